@@ -1,5 +1,8 @@
-import { countries, packs } from './countries.js';
-import { progressionChallenges } from './challenges.js';
+// The data as of the last pin; newer data is patched in by data_updates.js
+import { countries, packs } from './pinned/countries.js';
+import { progressionChallenges } from './pinned/challenges.js';
+import { loadDataUpdates } from './data_updates.js';
+import { indexPool, pickOptions } from './options.js';
 
 // DOM Elements
 const elements = {
@@ -8,6 +11,7 @@ const elements = {
   endScreen: document.getElementById("end-screen"),
   startButton: document.getElementById("start-btn"),
   packOptions: document.getElementById("pack-options"),
+  flagPicture: document.getElementById("flag-picture"),
   flagImage: document.getElementById("flag"),
   options: document.getElementById("options"),
   progressBar: document.getElementById("progress-bar"),
@@ -48,9 +52,45 @@ const AUDIO_SOURCES = {
   country: (code) => `${AUDIO_BASE_PATH}/${code}.mp3`,
 };
 
+// Audio sprites built by scripts/build_audio_sprites.py: {clip URL: {file,
+// start, duration}}. Clips in a sprite play from its decoded buffer; other
+// clips, or all of them without Web Audio, play through an <audio> element
+const AudioContextClass = window.AudioContext || window.webkitAudioContext;
+// How long playAudio waits for a suspended context to resume, and how long
+// past its duration a clip may run before it counts as finished
+const AUDIO_RESUME_TIMEOUT = 300;
+const AUDIO_CLIP_GRACE = 500;
+const audioSprites = fetch(`${AUDIO_BASE_PATH}/sprites.json`)
+  .then((response) => (response.ok ? response.json() : null))
+  .then((manifest) => {
+    const clips = new Map();
+    for (const sprite of Object.values(manifest?.sprites || {})) {
+      for (const [name, [start, duration]] of Object.entries(sprite.clips)) {
+        const src = `${AUDIO_BASE_PATH}/${name}.mp3`;
+        // The first sprite with a clip wins (generate_sw.py precaches that one)
+        if (!clips.has(src)) clips.set(src, { file: `${AUDIO_BASE_PATH}/${sprite.file}`, start, duration });
+      }
+    }
+    return clips;
+  })
+  .catch(() => new Map());
+
+// Flag variants built by scripts/optimize_flags.py; until (or unless) the
+// manifest loads, the full-size PNGs are used
+const FLAG_SIZES = "(min-width: 600px) 560px, min(100vw, 400px)";
+const flagVariants = fetch(`${CONFIG.flagBasePath}/variants.json`)
+  .then((response) => (response.ok ? response.json() : null))
+  .catch(() => null);
+
+// Ask the service worker to fetch a pack's or challenge's flags and audio
+// ahead of play (see ASSET_GROUPS in sw.js)
+const warmAssets = (message) =>
+  navigator.serviceWorker?.ready.then((registration) => registration.active?.postMessage(message));
+
 // Game State
 const state = {
   pool: [],
+  poolIndex: new Map(), // pool countries by code
   usedCodes: new Set(),
   currentAnswer: null,
   questionNumber: 0,
@@ -72,18 +112,12 @@ const state = {
 const audio = {
   active: null,
   background: null,
+  context: null,
+  sprites: new Map(), // sprite file -> Promise of its decoded AudioBuffer
+  generation: 0, // bumped by stopAudio so clips still loading never start
 };
 
 // Utility Functions
-const shuffle = (array) => {
-  const result = [...array];
-  for (let i = result.length - 1; i > 0; i--) {
-    const j = Math.floor(Math.random() * (i + 1));
-    [result[i], result[j]] = [result[j], result[i]];
-  }
-  return result;
-};
-
 const wait = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
 
 const getRandomItem = (array) => array[Math.floor(Math.random() * array.length)];
@@ -96,10 +130,22 @@ const showScreen = (screen) => {
 
   // Re-render progression path when returning to start screen
   if (screen === "start" && window.renderProgressionPath) {
+    applyDataUpdate();
     window.renderProgressionPath();
   }
 };
 
+// Data published since the pin (scripts/dataset_versions.py), patched into
+// countries and progressionChallenges. A round holds its challenge by index,
+// so the update is only applied while the start screen is shown
+let pendingDataUpdate = null;
+const applyDataUpdate = () => {
+  if (!pendingDataUpdate) return;
+  pendingDataUpdate();
+  pendingDataUpdate = null;
+  window._justCompletedIndex = null; // The index may point elsewhere now
+};
+
 const initProgressBar = () => {
   elements.progressBar.innerHTML = "";
   state.results = [];
@@ -172,6 +218,7 @@ const updateEndScreen = () => {
 
 // Audio Functions
 const stopAudio = () => {
+  audio.generation++;
   if (audio.active) {
     audio.active.pause();
     audio.active.currentTime = 0;
@@ -244,13 +291,8 @@ const toggleBackgroundAudio = (enabled) => {
   }
 };
 
-const playAudio = (src) =>
+const playElement = (src) =>
   new Promise((resolve) => {
-    if (!src || !state.audioEnabled) {
-      resolve();
-      return;
-    }
-
     const sound = new Audio(src);
     audio.active = sound;
 
@@ -267,6 +309,69 @@ const playAudio = (src) =>
     sound.play().catch(finish);
   });
 
+const loadSprite = (file) => {
+  if (!audio.sprites.has(file)) {
+    const decoded = fetch(file)
+      .then((response) => {
+        if (!response.ok) throw new Error(`${file}: ${response.status}`);
+        return response.arrayBuffer();
+      })
+      .then((data) => audio.context.decodeAudioData(data));
+    // Let a failed load be retried on the next play
+    decoded.catch(() => audio.sprites.delete(file));
+    audio.sprites.set(file, decoded);
+  }
+  return audio.sprites.get(file);
+};
+
+const playSpriteClip = (buffer, clip) =>
+  new Promise((resolve) => {
+    const source = audio.context.createBufferSource();
+    source.buffer = buffer;
+    source.connect(audio.context.destination);
+    // Same shape stopAudio expects from an <audio> element
+    const handle = { pause: () => source.stop() };
+    audio.active = handle;
+    const finish = () => {
+      clearTimeout(timeout);
+      if (audio.active === handle) {
+        audio.active = null;
+      }
+      resolve();
+    };
+    // "ended" never fires if the context is suspended mid-clip (e.g. an iOS interruption)
+    const timeout = setTimeout(finish, clip.duration * 1000 + AUDIO_CLIP_GRACE);
+    source.addEventListener("ended", finish, { once: true });
+    source.start(0, clip.start, clip.duration);
+  });
+
+// Browsers only let an AudioContext start during a user gesture, so this
+// runs synchronously in the click handlers that start a round or enable audio
+const unlockAudio = () => {
+  if (!AudioContextClass) return;
+  audio.context = audio.context || new AudioContextClass();
+  if (audio.context.state === "suspended") audio.context.resume().catch(() => {});
+};
+
+const resumeAudioContext = () =>
+  Promise.race([audio.context.resume(), wait(AUDIO_RESUME_TIMEOUT)]).catch(() => {});
+
+const playAudio = async (src) => {
+  if (!src || !state.audioEnabled) return;
+
+  const generation = audio.generation;
+  const clip = (await audioSprites).get(src);
+  if (clip && audio.context) {
+    if (audio.context.state === "suspended") await resumeAudioContext();
+    // A context the browser keeps suspended would never play the clip
+    const buffer = audio.context.state === "running" ? await loadSprite(clip.file).catch(() => null) : null;
+    if (generation !== audio.generation) return; // Stopped while the sprite loaded
+    if (buffer) return playSpriteClip(buffer, clip);
+  }
+  if (generation !== audio.generation) return;
+  return playElement(src);
+};
+
 // Game Logic
 const getCountryPool = () => {
   const codes = new Set(state.selectedPack.codes);
@@ -278,21 +383,20 @@ const getRandomCountry = (pool, excludeCodes = []) => {
   return available.length > 0 ? getRandomItem(available) : null;
 };
 
-const generateOptions = (answer) => {
-  const wrongOptions = [];
-  const excludeCodes = [answer.code];
+const generateOptions = (answer) => pickOptions(answer, state.pool, state.poolIndex);
 
-  while (wrongOptions.length < 3) {
-    const candidate = getRandomCountry(state.pool, excludeCodes);
-    if (candidate) {
-      wrongOptions.push(candidate);
-      excludeCodes.push(candidate.code);
-    } else {
-      break;
-    }
+const setFlagSources = (variants, code) => {
+  elements.flagPicture.querySelectorAll("source").forEach((source) => source.remove());
+  if (!variants?.flags[code]) return;
+  for (const format of variants.formats) {
+    const source = document.createElement("source");
+    source.type = `image/${format}`;
+    source.sizes = FLAG_SIZES;
+    source.srcset = variants.widths
+      .map((width) => `${CONFIG.flagBasePath}/${width}/${code}.${format} ${width}w`)
+      .join(", ");
+    elements.flagPicture.insertBefore(source, elements.flagImage);
   }
-
-  return shuffle([answer, ...wrongOptions]);
 };
 
 const renderOptions = (options) => {
@@ -361,8 +465,10 @@ const nextQuestion = async () => {
   state.usedCodes.add(answer.code);
 
   const options = generateOptions(answer);
+  const variants = await flagVariants;
 
   elements.flagImage.classList.add("hidden");
+  setFlagSources(variants, answer.code);
   elements.flagImage.onload = async () => {
     elements.flagImage.onload = null;
 
@@ -431,14 +537,20 @@ const handleGuess = async (code, button) => {
   }
 };
 
-// Progression persistence
+// Progression persistence: the id of the last challenge passed, so progress
+// survives challenges.js being regenerated. Saves from before challenges had
+// ids only hold the number passed, which is where the ids started.
 const getProgressionCompleted = () => {
+  const lastId = localStorage.getItem("progressionCompletedId");
+  const index = lastId === null ? -1 : progressionChallenges.findIndex((ch) => ch.id === Number(lastId));
+  if (index >= 0) return index + 1;
   const saved = localStorage.getItem("progressionCompleted");
   return saved ? parseInt(saved, 10) : 0;
 };
 
 const setProgressionCompleted = (count) => {
   localStorage.setItem("progressionCompleted", count);
+  localStorage.setItem("progressionCompletedId", progressionChallenges[count - 1].id);
 };
 
 const endGame = async () => {
@@ -477,6 +589,7 @@ const endGame = async () => {
 };
 
 const resetGameState = () => {
+  state.poolIndex = indexPool(state.pool);
   state.usedCodes = new Set();
   state.currentAnswer = null;
   state.questionNumber = 0;
@@ -503,6 +616,7 @@ const startGame = () => {
   state.selectedPack = packs[getSelectedPackId()];
   state.pool = getCountryPool();
   state.audioEnabled = state.audioAllowed;
+  if (state.audioEnabled) unlockAudio();
 
   // Set round size to min of selected option and available countries in pack
   const requestedQuestions = getQuestionsPerRound();
@@ -524,6 +638,10 @@ window.startProgressionChallenge = (challengeIndex) => {
   state.isProgression = true;
   state.progressionChallenge = challengeIndex;
   state.audioAllowed = true;
+  unlockAudio();
+  // Progression assets are grouped in chunks that each end with a review
+  const chunk = progressionChallenges.slice(0, challengeIndex).filter((c) => c.type === "review").length;
+  warmAssets({ type: "warm", groups: [`progression:${chunk}`] });
   startBackgroundAudio();
   state.audioEnabled = state.audioAllowed;
 
@@ -549,6 +667,7 @@ elements.packOptions.addEventListener("click", (e) => {
     btn.classList.remove("selected");
   });
   button.classList.add("selected");
+  warmAssets({ type: "warm", groups: [`pack:${button.dataset.pack}`] });
 });
 
 elements.startButton.addEventListener("click", () => {
@@ -587,10 +706,12 @@ elements.endExitButton.addEventListener("click", () => {
 });
 
 elements.musicToggle.addEventListener("change", (e) => {
+  if (e.target.checked) unlockAudio();
   toggleBackgroundAudio(e.target.checked);
 });
 
 elements.voiceToggle.addEventListener("change", (e) => {
+  if (e.target.checked) unlockAudio();
   setVoiceEnabled(e.target.checked);
 });
 
@@ -673,7 +794,7 @@ document.getElementById('progression-toggle').addEventListener('change', (e) =>
   const container = document.getElementById('path-container');
 
   function renderPath() {
-    const completed = parseInt(localStorage.getItem('progressionCompleted') || '0', 10);
+    const completed = getProgressionCompleted();
     const justDone = window._justCompletedIndex;
     let html = '';
 
@@ -751,6 +872,14 @@ document.getElementById('progression-toggle').addEventListener('change', (e) =>
   });
 })();
 
+loadDataUpdates(countries, progressionChallenges).then((update) => {
+  pendingDataUpdate = update;
+  if (update && !elements.startScreen.classList.contains("hidden")) {
+    applyDataUpdate();
+    window.renderProgressionPath();
+  }
+});
+
 // ====================================================================
 // Service Worker Registration
 // ====================================================================
@@ -766,5 +895,10 @@ if ('serviceWorker' in navigator) {
     console.log('Dev mode: Service worker unregistered, caches cleared');
   } else {
     navigator.serviceWorker.register(`${import.meta.env.BASE_URL}sw.js`);
+    // Only the first progression chunk is precached; fetch the rest when idle
+    if (!navigator.connection?.saveData) {
+      const whenIdle = window.requestIdleCallback || ((callback) => setTimeout(callback, 2000));
+      navigator.serviceWorker.ready.then(() => whenIdle(() => warmAssets({ type: "warm-idle" })));
+    }
   }
 }
@@ -0,0 +1,99 @@
+// Generated by scripts/dataset_versions.py; do not edit by hand.
+// Brings the bundled (pinned) countries and challenges up to the latest
+// published dataset: the patches in data/index.json from DATASET_VERSION on
+// are applied in place, or the latest full version is loaded when that is
+// smaller or the chain was pruned. Dynamic packs (All World, ...) keep the
+// countries of the bundled data until the next pin.
+
+export const DATASET_VERSION = "7cd8e010c0c1";
+const INDEX_FORMAT = 1;
+
+const fetchData = async (path) => {
+  const response = await fetch(`data/${path}`);
+  if (!response.ok) throw new Error(`data/${path}: ${response.status}`);
+  return response.json();
+};
+
+// Patches from version to the latest one, or null if one is missing
+const patchChain = (index, version) => {
+  const chain = [];
+  while (version !== index.latest) {
+    const [next, size] = index.patches[version] || [];
+    if (!next || chain.length >= Object.keys(index.patches).length) return null;
+    chain.push({ file: `patches/${version}-${next}.json`, size });
+    version = next;
+  }
+  return chain;
+};
+
+// Apply changes keyed by record[key]: null removes a record, a change is
+// merged into (or replaces) the record with its key, new keys are appended,
+// and order (the keys) sorts the result when the patch gives it
+const patchRecords = (records, changes = {}, key, order, merge) => {
+  const result = [];
+  for (const record of records) {
+    const change = changes[record[key]];
+    if (change === undefined) result.push(record);
+    else if (change !== null) result.push(merge ? Object.assign(record, change) : change);
+  }
+  const present = new Set(result.map((record) => String(record[key])));
+  for (const [k, change] of Object.entries(changes)) {
+    if (change !== null && !present.has(k)) result.push(change);
+  }
+  if (order) {
+    const rank = new Map(order.map((k, i) => [String(k), i]));
+    result.sort((a, b) => rank.get(String(a[key])) - rank.get(String(b[key])));
+  }
+  records.splice(0, records.length, ...result);
+};
+
+// Reviews cover every regular challenge from id range[0] through range[1]
+const expandReviews = (challenges) => {
+  const position = new Map(challenges.map((ch, i) => [ch.id, i]));
+  challenges.forEach((ch, i) => {
+    if (!ch.range) return;
+    const covered = challenges.slice(position.get(ch.range[0]), position.get(ch.range[1]) + 1);
+    challenges[i] = { ...ch, codes: covered.filter((c) => !c.range).flatMap((c) => c.codes) };
+  });
+};
+
+const download = async (index) => {
+  const chain = patchChain(index, DATASET_VERSION);
+  if (chain && chain.reduce((total, patch) => total + patch.size, 0) < index.size) {
+    const patches = await Promise.all(chain.map((patch) => fetchData(patch.file)));
+    return (countries, challenges) => {
+      for (const patch of patches) {
+        patchRecords(countries, patch.countries, "code", patch.countryOrder, true);
+        patchRecords(challenges, patch.challenges, "id", patch.challengeOrder, false);
+      }
+    };
+  }
+  const latest = await fetchData(`versions/${index.latest}.json`);
+  return (countries, challenges) => {
+    countries.splice(0, countries.length, ...latest.countries);
+    challenges.splice(0, challenges.length, ...latest.challenges);
+  };
+};
+
+// Downloads everything first and resolves to a function that updates the
+// arrays in place when called, or to null when there is nothing to apply.
+// A round refers to challenges by index, so the caller picks the moment.
+// On any error the arrays are left as bundled.
+export const loadDataUpdates = async (countries, challenges) => {
+  try {
+    const index = await fetchData("index.json");
+    if (index.format !== INDEX_FORMAT || !index.latest || index.latest === DATASET_VERSION) return null;
+    const update = await download(index);
+    return () => {
+      try {
+        update(countries, challenges);
+        expandReviews(challenges);
+      } catch (error) {
+        console.warn("Data update failed:", error);
+      }
+    };
+  } catch (error) {
+    console.warn("Data update failed, using the bundled data:", error);
+    return null;
+  }
+};
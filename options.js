@@ -0,0 +1,56 @@
+import { distractors } from './pinned/distractors.js';
+
+// Wrong answers taken from the answer's look-alikes (scripts/build_distractors.py);
+// the rest are random, so a round is not made entirely of near misses
+const SIMILAR_OPTIONS = 2;
+
+const randomIndex = (length) => Math.floor(Math.random() * length);
+
+const shuffle = (array) => {
+  const result = [...array];
+  for (let i = result.length - 1; i > 0; i--) {
+    const j = randomIndex(i + 1);
+    [result[i], result[j]] = [result[j], result[i]];
+  }
+  return result;
+};
+
+// Countries of a pool by code, built once per round
+export const indexPool = (pool) => new Map(pool.map((country) => [country.code, country]));
+
+// The answer plus up to count - 1 wrong answers from the pool, in random
+// order. Look-alikes come from a short precomputed list and random ones by
+// drawing until an unused country comes up, so the cost does not grow with
+// the pool.
+export const pickOptions = (answer, pool, poolIndex, count = 4) => {
+  const wanted = Math.min(count - 1, pool.length - 1);
+  const chosen = new Set([answer.code]);
+  const wrong = [];
+
+  const similar = distractors[answer.code] || [];
+  for (let i = 0, offset = randomIndex(similar.length || 1); i < similar.length; i++) {
+    if (wrong.length >= Math.min(SIMILAR_OPTIONS, wanted)) break;
+    // Start at a random candidate so the same look-alikes do not always appear
+    const country = poolIndex.get(similar[(offset + i) % similar.length]);
+    if (country && !chosen.has(country.code)) {
+      chosen.add(country.code);
+      wrong.push(country);
+    }
+  }
+
+  // Draws rarely collide unless the pool is barely larger than the options
+  if (pool.length <= count * 2) {
+    const rest = shuffle(pool.filter((country) => !chosen.has(country.code)));
+    wrong.push(...rest.slice(0, wanted - wrong.length));
+  } else {
+    while (wrong.length < wanted) {
+      const country = pool[randomIndex(pool.length)];
+      if (!chosen.has(country.code)) {
+        chosen.add(country.code);
+        wrong.push(country);
+      }
+    }
+  }
+
+  return shuffle([answer, ...wrong]);
+};
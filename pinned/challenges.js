@@ -0,0 +1,66 @@
+// Pinned copy of challenges.js (scripts/dataset_versions.py pin); do not edit by hand.
+// Generated by scripts/generate_challenges.py from scripts/challenge_spec.json
+// and the country ranks; run it instead of editing this file.
+// Countries ordered by rank, grouped into chunks of 5 with a review
+// challenge after every 4 regular ones. Player progress in localStorage
+// references challenges by id, and ids are kept when this file is regenerated.
+
+const challenges = [
+  { id: 1, type: "regular", codes: ["in","ru","us","ca","cn"], questionsShown: 5, passPercent: 100 },
+  { id: 2, type: "regular", codes: ["de","id","jp","br","pk"], questionsShown: 5, passPercent: 100 },
+  { id: 3, type: "regular", codes: ["au","ng","gb","fr","ar"], questionsShown: 5, passPercent: 100 },
+  { id: 4, type: "regular", codes: ["bd","it","kz","dz","mx"], questionsShown: 5, passPercent: 100 },
+  { id: 5, type: "review", range: [1, 4], questionsShown: 10, passPercent: 80 },
+  { id: 6, type: "regular", codes: ["cd","ph","sa","es","et"], questionsShown: 5, passPercent: 100 },
+  { id: 7, type: "regular", codes: ["kr","eg","sd","ly","vn"], questionsShown: 5, passPercent: 100 },
+  { id: 8, type: "regular", codes: ["ir","tr","mn","nl","pe"], questionsShown: 5, passPercent: 100 },
+  { id: 9, type: "regular", codes: ["td","ch","ne","pl","tz"], questionsShown: 5, passPercent: 100 },
+  { id: 10, type: "review", range: [1, 9], questionsShown: 10, passPercent: 80 },
+  { id: 11, type: "regular", codes: ["ao","be","ml","th","za"], questionsShown: 5, passPercent: 100 },
+  { id: 12, type: "regular", codes: ["se","co","ie","ke","bo"], questionsShown: 5, passPercent: 100 },
+  { id: 13, type: "regular", codes: ["il","mr","no","at","mm"], questionsShown: 5, passPercent: 100 },
+  { id: 14, type: "regular", codes: ["sg","ae","ve","na","iq"], questionsShown: 5, passPercent: 100 },
+  { id: 15, type: "review", range: [1, 14], questionsShown: 10, passPercent: 80 },
+  { id: 16, type: "regular", codes: ["my","mz","ug","af","cl"], questionsShown: 5, passPercent: 100 },
+  { id: 17, type: "regular", codes: ["dk","uz","zm","ma","ro"], questionsShown: 5, passPercent: 100 },
+  { id: 18, type: "regular", codes: ["so","cf","ss","cz","ua"], questionsShown: 5, passPercent: 100 },
+  { id: 19, type: "regular", codes: ["mg","bw","fi","gh","pt"], questionsShown: 5, passPercent: 100 },
+  { id: 20, type: "review", range: [1, 19], questionsShown: 10, passPercent: 80 },
+  { id: 21, type: "regular", codes: ["ye","ci","np","nz","cm"], questionsShown: 5, passPercent: 100 },
+  { id: 22, type: "regular", codes: ["tm","gr","pg","qa","hu"], questionsShown: 5, passPercent: 100 },
+  { id: 23, type: "regular", codes: ["cu","kp","sy","bf","kw"], questionsShown: 5, passPercent: 100 },
+  { id: 24, type: "regular", codes: ["py","lk","zw","mw","sk"], questionsShown: 5, passPercent: 100 },
+  { id: 25, type: "review", range: [1, 24], questionsShown: 10, passPercent: 80 },
+  { id: 26, type: "regular", codes: ["do","ec","om","cg","bg"], questionsShown: 5, passPercent: 100 },
+  { id: 27, type: "regular", codes: ["gt","sn","lu","kh","pa"], questionsShown: 5, passPercent: 100 },
+  { id: 28, type: "regular", codes: ["hr","gn","ga","lt","rw"], questionsShown: 5, passPercent: 100 },
+  { id: 29, type: "regular", codes: ["bj","az","bi","tn","uy"], questionsShown: 5, passPercent: 100 },
+  { id: 30, type: "review", range: [1, 29], questionsShown: 10, passPercent: 80 },
+  { id: 31, type: "regular", codes: ["ht","rs","la","by","gy"], questionsShown: 5, passPercent: 100 },
+  { id: 32, type: "regular", codes: ["jo","cr","kg","si","sr"], questionsShown: 5, passPercent: 100 },
+  { id: 33, type: "regular", codes: ["tj","lv","hn","bh","ni"], questionsShown: 5, passPercent: 100 },
+  { id: 34, type: "regular", codes: ["ee","sv","er","sl","tg"], questionsShown: 5, passPercent: 100 },
+  { id: 35, type: "review", range: [1, 34], questionsShown: 10, passPercent: 80 },
+  { id: 36, type: "regular", codes: ["cy","lr","is","ba","ge"], questionsShown: 5, passPercent: 100 },
+  { id: 37, type: "regular", codes: ["tt","am","al","mt","lb"], questionsShown: 5, passPercent: 100 },
+  { id: 38, type: "regular", codes: ["jm","md","bn","bt","gw"], questionsShown: 5, passPercent: 100 },
+  { id: 39, type: "regular", codes: ["mu","mk","ls","bs","sb"], questionsShown: 5, passPercent: 100 },
+  { id: 40, type: "review", range: [1, 39], questionsShown: 10, passPercent: 80 },
+  { id: 41, type: "regular", codes: ["gm","gq","dj","bz","mc"], questionsShown: 5, passPercent: 100 },
+  { id: 42, type: "regular", codes: ["fj","tl","li","sz","me"], questionsShown: 5, passPercent: 100 },
+  { id: 43, type: "regular", codes: ["bb","mv","km","vu","ad"], questionsShown: 5, passPercent: 100 },
+  { id: 44, type: "regular", codes: ["cv","ws","lc","st","ki"], questionsShown: 5, passPercent: 100 },
+  { id: 45, type: "review", range: [1, 44], questionsShown: 10, passPercent: 80 },
+  { id: 46, type: "regular", codes: ["ag","dm","to","fm","sm"], questionsShown: 5, passPercent: 100 },
+  { id: 47, type: "regular", codes: ["sc","pw","vc","gd","kn"], questionsShown: 5, passPercent: 100 },
+  { id: 48, type: "regular", codes: ["mh","tv","nr"], questionsShown: 3, passPercent: 100 },
+  { id: 49, type: "review", range: [1, 48], questionsShown: 10, passPercent: 80 },
+];
+
+// A review covers every regular challenge from id range[0] through range[1]
+const position = new Map(challenges.map((ch, i) => [ch.id, i]));
+export const progressionChallenges = challenges.map((ch) => {
+  if (!ch.range) return ch;
+  const covered = challenges.slice(position.get(ch.range[0]), position.get(ch.range[1]) + 1);
+  return { ...ch, codes: covered.filter((c) => !c.range).flatMap((c) => c.codes) };
+});
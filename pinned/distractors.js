@@ -0,0 +1,199 @@
+// Pinned copy of distractors.js (scripts/dataset_versions.py pin); do not edit by hand.
+// Generated by scripts/build_distractors.py; do not edit by hand.
+// For each country, the countries most easily mistaken for it (similar flag,
+// same continent, similar rank), best first.
+export const distractors = {
+  af: ["kw","jo","sa","pk","tl","sy","pt","tm"],
+  al: ["ch","me","kg","mk","ma","dk","tn","vn"],
+  dz: ["mg","ng","sd","ci","bi","pk","sn","mx"],
+  ad: ["md","ro","ba","mk","td","pt","be","fr"],
+  ao: ["ly","eg","ug","bf","sd","mw","pg","ke"],
+  ag: ["kn","tt","ht","gd","do","bz","mv","tl"],
+  ar: ["uy","bw","py","fm","sm","so","gr","fj"],
+  am: ["gm","kh","la","lt","ph","lb","iq","mv"],
+  au: ["nz","nr","tv","fj","gb","mh","sb","la"],
+  at: ["dk","hu","pl","nl","ch","lu","hr","ye"],
+  az: ["uz","rw","kp","kz","sy","th","kh","tj"],
+  bs: ["se","sv","is","kn","dm","jm","ag","sz"],
+  bh: ["mt","tl","qa","tr","cn","kg","lb","mn"],
+  bd: ["sa","tm","kz","lk","af","za","az","kw"],
+  bb: ["vc","ro","td","gd","md","ad","nr","do"],
+  by: ["dk","om","pt","me","mk","at","ch","al"],
+  be: ["ro","td","md","ad","fr","ml","ie","it"],
+  bz: ["cu","ht","cr","kh","ag","do","cv","mh"],
+  bj: ["gw","gn","cg","cm","ml","td","sn","mr"],
+  bt: ["bn","mm","mk","ge","in","lk","tl","gd"],
+  bo: ["gh","ve","ec","tj","py","co","by","gm"],
+  ba: ["ad","mh","md","ro","bz","se","mk","is"],
+  bw: ["so","ar","fm","fj","dj","sm","gm","sl"],
+  br: ["gy","na","ng","bj","bo","mr","ls","gw"],
+  bn: ["bt","mm","ge","my","sy","kw","ae","jo"],
+  bg: ["ru","si","sk","pl","cz","lt","at","rs"],
+  bf: ["mr","ly","ao","mu","ug","gw","gh","gm"],
+  bi: ["mg","gq","sd","er","sc","eg","cg","tn"],
+  cv: ["ls","gm","mh","kh","bz","cr","cu","mu"],
+  kh: ["kp","ph","bz","cu","ht","am","py","om"],
+  cm: ["bj","td","ml","gn","ro","tg","sn","gw"],
+  ca: ["pe","mx","tt","bh","tr","dk","pa","do"],
+  cf: ["gq","km","et","ug","mz","zw","ls","tg"],
+  td: ["ro","ml","gn","bj","cm","sn","fr","md"],
+  cl: ["cz","pl","pe","om","py","dk","ht","sk"],
+  cn: ["tr","vn","kg","tl","ma","tn","mv","ch"],
+  co: ["ec","ve","bo","py","mm","am","ru","cl"],
+  km: ["cf","st","gq","sl","ls","tg","gw","dj"],
+  cg: ["bj","sn","na","mr","gw","gn","ml","sc"],
+  cr: ["cu","py","ht","hr","do","bz","sv","uy"],
+  ci: ["ng","gn","it","ie","pe","bi","na","cg"],
+  hr: ["py","hu","lu","at","ru","cr","gb","nl"],
+  cu: ["cr","ht","bz","do","py","kh","uy","hr"],
+  cy: ["jp","fi","kr","sm","ge","gr","mt","mc"],
+  cz: ["pl","bg","sk","cl","ru","si","gb","rs"],
+  cd: ["na","tz","za","ga","sc","ss","et","so"],
+  dk: ["ch","at","al","me","by","pl","gb","mk"],
+  dj: ["sl","gq","ne","so","cf","st","km","bw"],
+  dm: ["sa","kn","ag","bs","bz","vc","ke","zw"],
+  do: ["pa","gb","cu","us","cr","tt","my","ht"],
+  ec: ["co","ve","bo","ug","mm","py","sk","et"],
+  eg: ["sd","iq","ye","ao","sy","gh","hr","hu"],
+  sv: ["ni","gr","cr","is","bs","hn","cu","ls"],
+  gq: ["sd","sl","et","cf","ae","kw","sc","bi"],
+  er: ["ma","bi","tg","tn","gw","sc","zw","mw"],
+  ee: ["mc","de","hu","rs","bg","sk","is","gr"],
+  sz: ["lr","ke","st","zw","mz","tg","bs","km"],
+  et: ["gq","mz","cf","ug","st","mm","tg","mw"],
+  fj: ["fm","tv","so","nz","ar","bw","ki","au"],
+  fi: ["cy","rs","gr","gb","cz","sm","kr","uy"],
+  fr: ["it","ro","ie","pe","mx","mt","td","gb"],
+  ga: ["mu","sl","gh","bf","rw","st","gw","tg"],
+  gm: ["gh","am","sd","sc","bf","eg","mu","za"],
+  ge: ["np","jp","kr","sg","my","lb","id","bh"],
+  de: ["ug","mw","mk","mz","ua","ee","li","me"],
+  gh: ["bo","gm","zw","tg","eg","sd","mg","mu"],
+  gr: ["nl","is","sm","sk","fi","sv","se","cz"],
+  gd: ["ag","mk","kn","jm","do","tg","me","tt"],
+  gt: ["mx","so","do","fm","fj","ar","ca","cu"],
+  gn: ["gw","bj","td","ml","cm","ci","ro","cg"],
+  gw: ["gn","bj","bf","na","gh","mu","mr","tg"],
+  gy: ["br","sr","gw","gn","na","bj","sz","mr"],
+  ht: ["cu","bz","cr","ag","ph","kh","tt","do"],
+  hn: ["ni","lu","sv","uz","cr","cu","sl","il"],
+  hu: ["lu","at","hr","py","mc","ye","nl","pl"],
+  is: ["se","gr","sv","sk","dk","bs","gb","no"],
+  in: ["tj","iq","sy","ne","ye","il","uz","ir"],
+  id: ["sg","mc","lb","ye","tj","ge","at","ir"],
+  ir: ["ye","iq","lb","tj","kw","ae","sy","at"],
+  iq: ["ye","eg","ae","sy","lb","tj","ir","sd"],
+  ie: ["it","fr","ng","ci","mt","pe","mx","be"],
+  il: ["uy","lb","kr","uz","sg","py","in","jp"],
+  it: ["ie","fr","ng","pe","mx","mt","ro","ci"],
+  jm: ["kn","gd","ag","bs","lt","za","tt","dm"],
+  jp: ["kr","ge","cy","np","il","sg","qa","id"],
+  jo: ["sy","kw","ae","om","iq","ye","tj","af"],
+  kz: ["pw","tv","az","bd","uz","hn","sa","tm"],
+  ke: ["mw","ug","sd","ao","ss","zw","eg","ly"],
+  ki: ["ws","vu","mc","to","sg","sc","pg","la"],
+  kw: ["ae","sy","jo","sd","my","ye","tj","om"],
+  kg: ["vn","cn","tr","tn","tl","al","me","ma"],
+  la: ["mv","my","kg","tl","mm","li","om","tr"],
+  lv: ["no","nl","es","at","hu","lu","hr","lr"],
+  lb: ["tj","iq","sg","ir","ye","id","at","il"],
+  ls: ["cv","sl","eg","cf","na","lr","gm","sv"],
+  lr: ["th","sz","gq","no","bi","lv","ls","us"],
+  ly: ["ao","bf","ug","mr","mw","mu","ss","vu"],
+  li: ["la","me","ws","by","al","mk","gb","at"],
+  lt: ["bg","ru","rs","cz","si","sk","am","es"],
+  lu: ["hu","hr","at","py","mc","rs","nl","sk"],
+  mg: ["gh","zw","bi","sc","gm","eg","dz","bh"],
+  mw: ["ke","ao","ug","ly","gh","eg","et","bf"],
+  my: ["th","ge","kw","gb","np","la","om","ae"],
+  mv: ["tl","vn","tr","la","cn","om","lb","kw"],
+  ml: ["td","sn","gn","bj","ro","cm","cg","zm"],
+  mt: ["bh","fr","it","mc","dk","pl","pe","pt"],
+  mh: ["cv","ba","sb","bz","cu","au","tv","nr"],
+  mr: ["bf","na","ly","mu","ao","cg","gw","bj"],
+  mu: ["bf","gh","ly","mr","gw","ga","tg","gm"],
+  mx: ["fr","it","ca","pe","pa","gt","do","ie"],
+  fm: ["fj","so","ar","bw","gt","pw","tv","mh"],
+  md: ["ad","ro","pt","td","mk","fr","be","se"],
+  mc: ["id","sg","rs","at","hu","lu","pl","mt"],
+  mn: ["cn","tl","tr","kg","bh","vn","kp","mv"],
+  me: ["mk","al","ch","kg","dk","vn","tl","by"],
+  ma: ["tn","tr","cn","al","kg","vn","tl","dk"],
+  mz: ["ug","tg","et","zw","za","cf","ss","mw"],
+  mm: ["ae","bt","la","et","ve","bn","kw","co"],
+  na: ["mr","za","cg","cd","gw","ss","bf","gn"],
+  nr: ["au","nz","ki","sb","mh","li","ws","vu"],
+  np: ["ge","kr","sg","jp","my","om","lb","kw"],
+  nl: ["at","lv","hu","gr","lu","hr","ye","rs"],
+  nz: ["au","nr","tv","fj","gb","sb","mh","do"],
+  ni: ["sv","sl","hn","cr","cu","us","ls","ee"],
+  ne: ["sl","in","eg","gq","dj","cf","uz","sd"],
+  ng: ["ci","it","ie","gn","pe","dz","bj","fr"],
+  kp: ["kh","om","tr","sg","mn","lb","cn","la"],
+  mk: ["me","al","ch","dk","by","gd","tl","md"],
+  no: ["lv","es","gb","dk","th","nl","lr","qa"],
+  om: ["jo","kp","mv","by","kw","np","my","ae"],
+  pk: ["sa","qa","af","bh","in","mg","jo","sy"],
+  pw: ["tv","kz","fm","hn","sb","fj","mh","rw"],
+  pa: ["do","ca","mx","cr","cu","np","gb","fr"],
+  pg: ["vu","ao","ws","tl","ly","to","kn","ki"],
+  py: ["hr","uy","hu","lu","cr","ye","iq","at"],
+  pe: ["it","fr","ca","cl","mx","ch","dk","bh"],
+  ph: ["kh","ht","om","np","kp","bh","cn","il"],
+  pl: ["at","cz","bg","ru","sk","si","dk","cl"],
+  pt: ["by","me","al","ch","md","ro","dk","mk"],
+  qa: ["bh","pk","jp","no","th","lk","mt","np"],
+  ro: ["td","fr","md","be","ad","ml","it","gn"],
+  ru: ["bg","si","sk","pl","lt","cz","hr","at"],
+  rw: ["gh","ga","mu","tg","zw","et","gm","ke"],
+  kn: ["ag","gd","tt","jm","tz","dm","bs","pg"],
+  lc: ["fm","hn","gt","kn","ag","gd","bb","bs"],
+  vc: ["bb","gd","ro","dm","td","do","gt","bs"],
+  ws: ["to","me","kg","tl","tn","al","pg","ki"],
+  sm: ["gr","cy","pl","fi","uy","ar","bg","rs"],
+  st: ["tg","km","et","gw","gh","gq","ga","sz"],
+  sa: ["pk","dm","af","jo","kw","mv","sy","bd"],
+  sn: ["ml","cg","td","bj","zm","gn","cm","ro"],
+  rs: ["mc","at","lu","cz","hu","sk","gb","fi"],
+  sc: ["gm","sd","zw","gq","mg","na","za","bi"],
+  sl: ["ne","gq","ni","dj","ga","ls","uz","lr"],
+  sg: ["id","mc","lb","ge","np","ye","il","tj"],
+  sk: ["si","ru","bg","pl","cz","at","hu","hr"],
+  si: ["ru","sk","bg","pl","cz","at","lt","rs"],
+  sb: ["mh","nr","nz","dm","sa","vu","au","fj"],
+  so: ["fm","bw","fj","dj","gt","ar","cd","er"],
+  za: ["na","tg","sd","mz","gm","eg","sc","cf"],
+  kr: ["jp","ge","np","il","cy","sg","fi","lb"],
+  ss: ["ke","na","ly","ug","mw","mz","tz","bf"],
+  es: ["lv","no","nl","lt","lk","at","dk","de"],
+  lk: ["es","qa","tl","kg","th","my","bt","cn"],
+  sd: ["eg","ao","kw","ye","gq","iq","ae","ke"],
+  sr: ["gy","ke","th","lr","bo","ar","lv","sy"],
+  se: ["is","ua","bs","gr","md","sv","no","dk"],
+  ch: ["dk","al","at","me","vn","mk","tr","tn"],
+  sy: ["ye","kw","jo","iq","tj","ae","in","eg"],
+  tj: ["lb","ye","in","iq","sy","ir","id","kw"],
+  tz: ["ss","kn","zm","mw","et","cd","mz","st"],
+  th: ["my","no","lr","iq","uz","ir","in","qa"],
+  tl: ["kg","cn","vn","tr","mv","bh","me","al"],
+  tg: ["mz","st","ug","gh","za","zw","gw","et"],
+  to: ["ws","al","tn","vn","ch","tl","kg","me"],
+  tt: ["ag","tl","ca","tn","ma","al","cn","do"],
+  tn: ["ma","kg","tr","vn","ch","cn","al","to"],
+  tr: ["cn","vn","kg","ma","tl","tn","mv","ch"],
+  tm: ["zm","af","bd","pk","mn","ae","sa","lk"],
+  tv: ["pw","fj","nz","kz","au","mh","fm","sb"],
+  ug: ["mz","ao","mw","ke","ly","tg","bf","sd"],
+  ua: ["se","gr","de","nl","is","sk","ga","ec"],
+  ae: ["kw","ye","iq","jo","sy","sd","mm","ir"],
+  gb: ["dk","do","hr","cz","my","fr","hu","ch"],
+  us: ["do","lr","cu","my","gb","cr","ni","ht"],
+  uy: ["py","il","ar","cr","cu","sm","fi","cl"],
+  uz: ["il","ye","ae","ir","in","az","iq","sy"],
+  vu: ["pg","ly","ki","bf","ao","ss","mw","gw"],
+  ve: ["co","ec","bo","mm","cl","lt","ug","mu"],
+  vn: ["cn","kg","tr","tl","ch","mv","tn","al"],
+  ye: ["iq","eg","ae","tj","sy","ir","lb","at"],
+  zm: ["tm","sn","ml","tz","st","mw","et","bj"],
+  zw: ["gh","mz","ug","mg","ke","tg","sc","et"],
+};
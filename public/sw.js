@@ -1,585 +1,417 @@
-const CACHE_NAME = 'flag-game-1.4.0';
+const VERSION = '2.1.0';
+const PRECACHE = 'flag-game-precache';
+const RUNTIME_CACHE = `flag-game-runtime-${VERSION}`;
 
 const CORE_ASSETS = [
-  './',
-  './index.html',
-  './manifest.json',
-  './assets/icons/icon-192.png',
-  './assets/icons/icon-512.png',
-  './assets/images/africa.png',
-  './assets/images/africa_full.png',
-  './assets/images/asia.png',
-  './assets/images/asia_full.png',
-  './assets/images/australia.png',
-  './assets/images/cup.png',
-  './assets/images/europe.png',
-  './assets/images/europe_full.png',
-  './assets/images/lamp.png',
-  './assets/images/large.png',
-  './assets/images/north_america.png',
-  './assets/images/rich.png',
-  './assets/images/south_america.png',
-  './assets/images/world.png',
-  './assets/images/world_full.png',
-  './assets/audio/background.mp3',
-  './assets/audio/celebration.mp3',
-  './assets/audio/negative.mp3',
-  './assets/audio/positive.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/congrats.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/question.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_0.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_1.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_2.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_3.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_4.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_5.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_6.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_7.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_8.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_9.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_10.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_11.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_12.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_13.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_14.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_15.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_16.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_17.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_18.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_19.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/score_20.mp3'
+  {"url": "./", "revision": "b5a802fe003d"},
+  {"url": "./index.html", "revision": "b5a802fe003d"},
+  {"url": "./manifest.json", "integrity": "sha256-WpBBs14bVyuIGr6nisF8YkKscdQz3Ry8xhwo50jTcB8="},
+  {"url": "./assets/flags/variants.json", "integrity": "sha256-ozY87WdUhL76qGcJ/BDc1w1C4+SlL6SqsmHgDQkP980="},
+  {"url": "./assets/icons/icon-192.png", "integrity": "sha256-+1jg8128tLZfg8wlyNbz53UpMPFrHlyD4XRrIRSMK5Y="},
+  {"url": "./assets/icons/icon-512.png", "integrity": "sha256-0LaSFQR4QPaVN2ewPTFJ2n5r+1l9G4h84scUi0H4kmg="},
+  {"url": "./assets/images/africa.png", "integrity": "sha256-ZR6mUwmOGRETCW+ib1NPrph6yxxs3DL7aS0EIO/6Gbw="},
+  {"url": "./assets/images/africa_full.png", "integrity": "sha256-UZf41Y26Pam2QdPR8kfs4Uxv+BGhdEggKZYWuvBN5fk="},
+  {"url": "./assets/images/asia.png", "integrity": "sha256-c5wGr0djhaH4WWoOhdG5ph6Ug6OI+RWZlZx+1RBs2yY="},
+  {"url": "./assets/images/asia_full.png", "integrity": "sha256-KDkQx+UPDvcp+E39H928xXZwbOFAL/7Ul3BKfL6+wcA="},
+  {"url": "./assets/images/australia.png", "integrity": "sha256-5s+U2jAefXW30ka0rFVvG/OTGDk8RMMjcNNRZ1FLYks="},
+  {"url": "./assets/images/cup.png", "integrity": "sha256-PEeHRZzsyRXH5BgluZWPezM2GaqHy1WamMooEnx5rr8="},
+  {"url": "./assets/images/europe.png", "integrity": "sha256-aldiolkoL65w2w4nt60WbFqSnHfH7zXhYw2b9XJp1eQ="},
+  {"url": "./assets/images/europe_full.png", "integrity": "sha256-xe9J3cyYhkNBoDxlmZzzcHMb8M3TOCq1Mo2XXYhUutw="},
+  {"url": "./assets/images/lamp.png", "integrity": "sha256-dR+44qPiY38MtuMRpz4byxZL9Idhm9s6BnLir5S0JWs="},
+  {"url": "./assets/images/north_america.png", "integrity": "sha256-3oehC6COAAEClIaHp0bTIn1pYZ6oxeUEpCzDthKvCbs="},
+  {"url": "./assets/images/south_america.png", "integrity": "sha256-Bgt65q747g0i59hAKkcatyTo/NMF5urmxu9xTKXb9+w="},
+  {"url": "./assets/images/world.png", "integrity": "sha256-6qQMwuuVnxHc2ToGMJXdDcQpfJ2STCDoXY0CHBe6Vak="},
+  {"url": "./assets/images/world_full.png", "integrity": "sha256-m2ID7Wjpb3sADPNRnlSLGUaxE2vY1kUwke4dIjztduQ="},
+  {"url": "./assets/audio/background.mp3", "integrity": "sha256-QfJD3byF7J0HKQzvkVltPDnrFGWCSBblaRVHAlzVUM0="},
+  {"url": "./assets/audio/celebration.mp3", "integrity": "sha256-O1DNIvXjyElHkvksxunU1hw4AR8GcMr6clYwBR6pSUE="},
+  {"url": "./assets/audio/negative.mp3", "integrity": "sha256-dhO98pMD6SoWqWMCEjApo0Gk42njhl6YgopATB9Bpsk="},
+  {"url": "./assets/audio/positive.mp3", "integrity": "sha256-xPpQ2FDYOXvWlLQApf8t7Msm0KbF0s8Vd6SDGXgqP3U="},
+  {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sprites/phrases.mp3", "integrity": "sha256-SMxNy9801tCTGpagptTgPTuq7HbebCUUNaESjFSXV+M="},
+  {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sprites.json", "integrity": "sha256-NETT4n8fkswOmJMQkY+JKZkEYSO1JI8xZa7cdfTPlgU="}
 ];
 
-// All flag images
-const PACK_FLAGS = [
-  './assets/flags/ad.png',
-  './assets/flags/ae.png',
-  './assets/flags/af.png',
-  './assets/flags/ag.png',
-  './assets/flags/ai.png',
-  './assets/flags/al.png',
-  './assets/flags/am.png',
-  './assets/flags/ao.png',
-  './assets/flags/aq.png',
-  './assets/flags/ar.png',
-  './assets/flags/as.png',
-  './assets/flags/at.png',
-  './assets/flags/au.png',
-  './assets/flags/aw.png',
-  './assets/flags/ax.png',
-  './assets/flags/az.png',
-  './assets/flags/ba.png',
-  './assets/flags/bb.png',
-  './assets/flags/bd.png',
-  './assets/flags/be.png',
-  './assets/flags/bf.png',
-  './assets/flags/bg.png',
-  './assets/flags/bh.png',
-  './assets/flags/bi.png',
-  './assets/flags/bj.png',
-  './assets/flags/bl.png',
-  './assets/flags/bm.png',
-  './assets/flags/bn.png',
-  './assets/flags/bo.png',
-  './assets/flags/bq.png',
-  './assets/flags/br.png',
-  './assets/flags/bs.png',
-  './assets/flags/bt.png',
-  './assets/flags/bv.png',
-  './assets/flags/bw.png',
-  './assets/flags/by.png',
-  './assets/flags/bz.png',
-  './assets/flags/ca.png',
-  './assets/flags/cc.png',
-  './assets/flags/cd.png',
-  './assets/flags/cf.png',
-  './assets/flags/cg.png',
-  './assets/flags/ch.png',
-  './assets/flags/ci.png',
-  './assets/flags/ck.png',
-  './assets/flags/cl.png',
-  './assets/flags/cm.png',
-  './assets/flags/cn.png',
-  './assets/flags/co.png',
-  './assets/flags/cr.png',
-  './assets/flags/cu.png',
-  './assets/flags/cv.png',
-  './assets/flags/cw.png',
-  './assets/flags/cx.png',
-  './assets/flags/cy.png',
-  './assets/flags/cz.png',
-  './assets/flags/de.png',
-  './assets/flags/dj.png',
-  './assets/flags/dk.png',
-  './assets/flags/dm.png',
-  './assets/flags/do.png',
-  './assets/flags/dz.png',
-  './assets/flags/ec.png',
-  './assets/flags/ee.png',
-  './assets/flags/eg.png',
-  './assets/flags/eh.png',
-  './assets/flags/er.png',
-  './assets/flags/es.png',
-  './assets/flags/et.png',
-  './assets/flags/eu.png',
-  './assets/flags/fi.png',
-  './assets/flags/fj.png',
-  './assets/flags/fk.png',
-  './assets/flags/fm.png',
-  './assets/flags/fo.png',
-  './assets/flags/fr.png',
-  './assets/flags/ga.png',
-  './assets/flags/gb-eng.png',
-  './assets/flags/gb-nir.png',
-  './assets/flags/gb-sct.png',
-  './assets/flags/gb-wls.png',
-  './assets/flags/gb.png',
-  './assets/flags/gd.png',
-  './assets/flags/ge.png',
-  './assets/flags/gf.png',
-  './assets/flags/gg.png',
-  './assets/flags/gh.png',
-  './assets/flags/gi.png',
-  './assets/flags/gl.png',
-  './assets/flags/gm.png',
-  './assets/flags/gn.png',
-  './assets/flags/gp.png',
-  './assets/flags/gq.png',
-  './assets/flags/gr.png',
-  './assets/flags/gs.png',
-  './assets/flags/gt.png',
-  './assets/flags/gu.png',
-  './assets/flags/gw.png',
-  './assets/flags/gy.png',
-  './assets/flags/hk.png',
-  './assets/flags/hm.png',
-  './assets/flags/hn.png',
-  './assets/flags/hr.png',
-  './assets/flags/ht.png',
-  './assets/flags/hu.png',
-  './assets/flags/id.png',
-  './assets/flags/ie.png',
-  './assets/flags/il.png',
-  './assets/flags/im.png',
-  './assets/flags/in.png',
-  './assets/flags/io.png',
-  './assets/flags/iq.png',
-  './assets/flags/ir.png',
-  './assets/flags/is.png',
-  './assets/flags/it.png',
-  './assets/flags/je.png',
-  './assets/flags/jm.png',
-  './assets/flags/jo.png',
-  './assets/flags/jp.png',
-  './assets/flags/ke.png',
-  './assets/flags/kg.png',
-  './assets/flags/kh.png',
-  './assets/flags/ki.png',
-  './assets/flags/km.png',
-  './assets/flags/kn.png',
-  './assets/flags/kp.png',
-  './assets/flags/kr.png',
-  './assets/flags/kw.png',
-  './assets/flags/ky.png',
-  './assets/flags/kz.png',
-  './assets/flags/la.png',
-  './assets/flags/lb.png',
-  './assets/flags/lc.png',
-  './assets/flags/li.png',
-  './assets/flags/lk.png',
-  './assets/flags/lr.png',
-  './assets/flags/ls.png',
-  './assets/flags/lt.png',
-  './assets/flags/lu.png',
-  './assets/flags/lv.png',
-  './assets/flags/ly.png',
-  './assets/flags/ma.png',
-  './assets/flags/mc.png',
-  './assets/flags/md.png',
-  './assets/flags/me.png',
-  './assets/flags/mf.png',
-  './assets/flags/mg.png',
-  './assets/flags/mh.png',
-  './assets/flags/mk.png',
-  './assets/flags/ml.png',
-  './assets/flags/mm.png',
-  './assets/flags/mn.png',
-  './assets/flags/mo.png',
-  './assets/flags/mp.png',
-  './assets/flags/mq.png',
-  './assets/flags/mr.png',
-  './assets/flags/ms.png',
-  './assets/flags/mt.png',
-  './assets/flags/mu.png',
-  './assets/flags/mv.png',
-  './assets/flags/mw.png',
-  './assets/flags/mx.png',
-  './assets/flags/my.png',
-  './assets/flags/mz.png',
-  './assets/flags/na.png',
-  './assets/flags/nc.png',
-  './assets/flags/ne.png',
-  './assets/flags/nf.png',
-  './assets/flags/ng.png',
-  './assets/flags/ni.png',
-  './assets/flags/nl.png',
-  './assets/flags/no.png',
-  './assets/flags/np.png',
-  './assets/flags/nr.png',
-  './assets/flags/nu.png',
-  './assets/flags/nz.png',
-  './assets/flags/om.png',
-  './assets/flags/pa.png',
-  './assets/flags/pe.png',
-  './assets/flags/pf.png',
-  './assets/flags/pg.png',
-  './assets/flags/ph.png',
-  './assets/flags/pk.png',
-  './assets/flags/pl.png',
-  './assets/flags/pm.png',
-  './assets/flags/pn.png',
-  './assets/flags/pr.png',
-  './assets/flags/ps.png',
-  './assets/flags/pt.png',
-  './assets/flags/pw.png',
-  './assets/flags/py.png',
-  './assets/flags/qa.png',
-  './assets/flags/re.png',
-  './assets/flags/ro.png',
-  './assets/flags/rs.png',
-  './assets/flags/ru.png',
-  './assets/flags/rw.png',
-  './assets/flags/sa.png',
-  './assets/flags/sb.png',
-  './assets/flags/sc.png',
-  './assets/flags/sd.png',
-  './assets/flags/se.png',
-  './assets/flags/sg.png',
-  './assets/flags/sh.png',
-  './assets/flags/si.png',
-  './assets/flags/sj.png',
-  './assets/flags/sk.png',
-  './assets/flags/sl.png',
-  './assets/flags/sm.png',
-  './assets/flags/sn.png',
-  './assets/flags/so.png',
-  './assets/flags/sr.png',
-  './assets/flags/ss.png',
-  './assets/flags/st.png',
-  './assets/flags/sv.png',
-  './assets/flags/sx.png',
-  './assets/flags/sy.png',
-  './assets/flags/sz.png',
-  './assets/flags/tc.png',
-  './assets/flags/td.png',
-  './assets/flags/tf.png',
-  './assets/flags/tg.png',
-  './assets/flags/th.png',
-  './assets/flags/tj.png',
-  './assets/flags/tk.png',
-  './assets/flags/tl.png',
-  './assets/flags/tm.png',
-  './assets/flags/tn.png',
-  './assets/flags/to.png',
-  './assets/flags/tr.png',
-  './assets/flags/tt.png',
-  './assets/flags/tv.png',
-  './assets/flags/tw.png',
-  './assets/flags/tz.png',
-  './assets/flags/ua.png',
-  './assets/flags/ug.png',
-  './assets/flags/um.png',
-  './assets/flags/un.png',
-  './assets/flags/us-ak.png',
-  './assets/flags/us-al.png',
-  './assets/flags/us-ar.png',
-  './assets/flags/us-az.png',
-  './assets/flags/us-ca.png',
-  './assets/flags/us-co.png',
-  './assets/flags/us-ct.png',
-  './assets/flags/us-de.png',
-  './assets/flags/us-fl.png',
-  './assets/flags/us-ga.png',
-  './assets/flags/us-hi.png',
-  './assets/flags/us-ia.png',
-  './assets/flags/us-id.png',
-  './assets/flags/us-il.png',
-  './assets/flags/us-in.png',
-  './assets/flags/us-ks.png',
-  './assets/flags/us-ky.png',
-  './assets/flags/us-la.png',
-  './assets/flags/us-ma.png',
-  './assets/flags/us-md.png',
-  './assets/flags/us-me.png',
-  './assets/flags/us-mi.png',
-  './assets/flags/us-mn.png',
-  './assets/flags/us-mo.png',
-  './assets/flags/us-ms.png',
-  './assets/flags/us-mt.png',
-  './assets/flags/us-nc.png',
-  './assets/flags/us-nd.png',
-  './assets/flags/us-ne.png',
-  './assets/flags/us-nh.png',
-  './assets/flags/us-nj.png',
-  './assets/flags/us-nm.png',
-  './assets/flags/us-nv.png',
-  './assets/flags/us-ny.png',
-  './assets/flags/us-oh.png',
-  './assets/flags/us-ok.png',
-  './assets/flags/us-or.png',
-  './assets/flags/us-pa.png',
-  './assets/flags/us-ri.png',
-  './assets/flags/us-sc.png',
-  './assets/flags/us-sd.png',
-  './assets/flags/us-tn.png',
-  './assets/flags/us-tx.png',
-  './assets/flags/us-ut.png',
-  './assets/flags/us-va.png',
-  './assets/flags/us-vt.png',
-  './assets/flags/us-wa.png',
-  './assets/flags/us-wi.png',
-  './assets/flags/us-wv.png',
-  './assets/flags/us-wy.png',
-  './assets/flags/us.png',
-  './assets/flags/uy.png',
-  './assets/flags/uz.png',
-  './assets/flags/va.png',
-  './assets/flags/vc.png',
-  './assets/flags/ve.png',
-  './assets/flags/vg.png',
-  './assets/flags/vi.png',
-  './assets/flags/vn.png',
-  './assets/flags/vu.png',
-  './assets/flags/wf.png',
-  './assets/flags/ws.png',
-  './assets/flags/xk.png',
-  './assets/flags/ye.png',
-  './assets/flags/yt.png',
-  './assets/flags/za.png',
-  './assets/flags/zm.png',
-  './assets/flags/zw.png'
-];
+// Flag and name audio for every country a pack or challenge uses
+const COUNTRY_ASSETS = {
+  "ad": [{"url": "./assets/flags/320/ad.webp", "integrity": "sha256-Pa54FbI2lE7XYRP+KjWblJzSuhrE4Nf/mYAeKAMnuKg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ad.mp3", "integrity": "sha256-RNreZNW10Bqg8D+wOjCizuHQSpqc7HjMVC+vIgqwzxs="}],
+  "ae": [{"url": "./assets/flags/320/ae.webp", "integrity": "sha256-Bkuv2wfZErPOq7eOiq363v+GNrQ+jNTod1W7cJL7zAc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ae.mp3", "integrity": "sha256-mVDWEAxZeF+7QoxaicuTVfP/yuVQEne4PhQbOjfHZT0="}],
+  "af": [{"url": "./assets/flags/320/af.webp", "integrity": "sha256-wklWzPTH1GQgJxZyplBOO7qsIw4BteMf2dDtdyjEaaU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/af.mp3", "integrity": "sha256-iRDuJN+G6xjZh6SsBvXiF6AhjtV2OHdd2cgWaJHTrfw="}],
+  "ag": [{"url": "./assets/flags/320/ag.webp", "integrity": "sha256-k27aniU9sSlt9Dt2miXn73ei+yk1pSP768JbdvteYmM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ag.mp3", "integrity": "sha256-vBFFcC9aZVgvo2lFxm53SDLW/fwlRcKVkYf1pko+9uQ="}],
+  "al": [{"url": "./assets/flags/320/al.webp", "integrity": "sha256-NldgZdGXRGcSclVz57GZLAKNtiGm8KrB0t3TdDUYM98="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/al.mp3", "integrity": "sha256-GL4LadES77FgDK4nShQ6XqOj9twUIFsiu6nakLdvUTw="}],
+  "am": [{"url": "./assets/flags/320/am.webp", "integrity": "sha256-oYQuEu+LRfClJTjny2R3Sjri6Ce99ypAb15pJjdaoFQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/am.mp3", "integrity": "sha256-sqQB2mc836bLP3PgQJYv8gZgJwLlCRZnlT6GxJLn/zE="}],
+  "ao": [{"url": "./assets/flags/320/ao.webp", "integrity": "sha256-0zAYM6ODQqGoAekFKO7vd917N1DWHQRlbEoegBdskl0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ao.mp3", "integrity": "sha256-kZriMYM6nAntruGfgH9LZN4+3/TCmpAdwS7pckzxr5s="}],
+  "ar": [{"url": "./assets/flags/320/ar.webp", "integrity": "sha256-w8ZUPeAb9k2mNyr3XyTghv/mFcBDNQ/mH+fi63ooVi4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ar.mp3", "integrity": "sha256-KhZL17kurb0PVg6e4kXZdAhYNklav0A1PjWJkzbJfEU="}],
+  "at": [{"url": "./assets/flags/320/at.webp", "integrity": "sha256-sRVaN53vjD9qXg+66V46q1cBVnNVS3r1st5dzW7qFC4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/at.mp3", "integrity": "sha256-7zZi2hoJo7VbF2a3ztYc9GTQk7bji+TsgUQwwabuJaQ="}],
+  "au": [{"url": "./assets/flags/320/au.webp", "integrity": "sha256-X8X7aYrbWWRNQ3mAANdGCG1JaZ8s+4f8sIZHrmE/6W0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/au.mp3", "integrity": "sha256-M9QRpcxW7xgfTLGfGdbhIRRGETh7IHGH2Q1JzAM9BjA="}],
+  "az": [{"url": "./assets/flags/320/az.webp", "integrity": "sha256-2bIi9V3ckEbR8UDCMrL0YNeArp7bKqJCvp/cgtlk+t0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/az.mp3", "integrity": "sha256-zs98KdEKmoTO+Ueex3+uuZ9o7E0qY1rk4fjQbkevcbE="}],
+  "ba": [{"url": "./assets/flags/320/ba.webp", "integrity": "sha256-CWLBo1qBClZeLsu4Db5BE1qpXAM60JFCD86pq+jTcH8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ba.mp3", "integrity": "sha256-j4OEM70pGXiX2Z2/pS1uiu8QWDa7YWr1LuzREllcHWk="}],
+  "bb": [{"url": "./assets/flags/320/bb.webp", "integrity": "sha256-Ecl+1ozrjt/ig+sTEvZV9neMofHIZKG7QIJ/KEgHfmU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bb.mp3", "integrity": "sha256-b9ETQ5b8lCs9QpNMyYtQG7DdGMKbDbklE2PSQ9C94Xc="}],
+  "bd": [{"url": "./assets/flags/320/bd.webp", "integrity": "sha256-hrsrZrgOpb/H/8SKyQZhf6DeE2cnc8ZsT5waCtDg4/w="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bd.mp3", "integrity": "sha256-lRjljGdgiHmYG9yICFg39vcDkANDwRFOlAvfJ70XVSo="}],
+  "be": [{"url": "./assets/flags/320/be.webp", "integrity": "sha256-efZGbazfWe7jvBCWUL3oPiPX9QdqfW+rCaMDPichOSg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/be.mp3", "integrity": "sha256-qQ5ddyuWQVCKWSQdUBv/pMVZTUTBSbAAaNPQNUT/QhU="}],
+  "bf": [{"url": "./assets/flags/320/bf.webp", "integrity": "sha256-aSoehe89clly7KyoKAIXIFe++9rt42+SVT/xknnEq6M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bf.mp3", "integrity": "sha256-OekYDQyfW46VsQiZ7654rpviH1794HJRLqg96r2mGWc="}],
+  "bg": [{"url": "./assets/flags/320/bg.webp", "integrity": "sha256-ipoT0nDpPE/ZzSPl5FwmLQHxA2SqXNE2f6cawB9+xC4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bg.mp3", "integrity": "sha256-izPao5nYTTQ06A+XVrqL0Dmvq81k6AETSXx5dk3okwI="}],
+  "bh": [{"url": "./assets/flags/320/bh.webp", "integrity": "sha256-PoaZiez6QS0RvfyMpevr52vIOevBqV+ZlJC4v9IL4os="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bh.mp3", "integrity": "sha256-gxhWpUa1ZlxcLWmMsCAsh2fXi64SBnT0d8ow8cgz1KE="}],
+  "bi": [{"url": "./assets/flags/320/bi.webp", "integrity": "sha256-bQlVUaSC1ZejItkoxnv15kmQKas0SS8E+2hsOdauX+o="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bi.mp3", "integrity": "sha256-Pur+buZwpFgwFgQ2tRdh2RHXk8duwk57R5qH01WdS0E="}],
+  "bj": [{"url": "./assets/flags/320/bj.webp", "integrity": "sha256-KaRnQuiAQ8kmxds0cns5w7tQnEP91bczak5TPFCU6cg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bj.mp3", "integrity": "sha256-YOjNr29p7gPYma59wzIp+D1CTRdmOCYcCZV97tz1BC0="}],
+  "bn": [{"url": "./assets/flags/320/bn.webp", "integrity": "sha256-bcuBT03C+hKn+r7WOXwcdtIZBl171ZhWCYuArz0/2Xc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bn.mp3", "integrity": "sha256-AFVN9HGVxkCKtmQkVuPRYKC8ZDiId8fYIW/2P/mD0hs="}],
+  "bo": [{"url": "./assets/flags/320/bo.webp", "integrity": "sha256-bBjMeWLRQtcpysUO5m/I3AZTxP2K3B5MFvetZYvz+2I="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bo.mp3", "integrity": "sha256-0M3IWoIp/pfbZaVYkkwh3ZV3yPc54VrGpPpGN57WHNI="}],
+  "br": [{"url": "./assets/flags/320/br.webp", "integrity": "sha256-Z4nY23INPBOP0vdXQ4MtYqD0v5y0X4OvYsJIwIDkmuE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/br.mp3", "integrity": "sha256-C5OmX/scQBZ65mkeFfCC0GC1NPmqkVuR+WDkUqh68I4="}],
+  "bs": [{"url": "./assets/flags/320/bs.webp", "integrity": "sha256-7ZF4+cLpI7qcm8P5Zg5Y1q4xMsDHQ1ZN29ga+r0Jq0w="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bs.mp3", "integrity": "sha256-3AO/5QhsvupE0vRgZFSiHgj7lyx4NcmIDeFdB+vejxA="}],
+  "bt": [{"url": "./assets/flags/320/bt.webp", "integrity": "sha256-u5toDaK7AS3UodNsalQ+ylNZ7DNJSQPKUKKd+J6vvVc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bt.mp3", "integrity": "sha256-JxWx5QpsYfKeizJTLVvn3NtbKelWlFxhI3GHuxP6UwM="}],
+  "bw": [{"url": "./assets/flags/320/bw.webp", "integrity": "sha256-6WPCSKhgR0g6FEiO2DCp5LSx6MHV843HCzwM/fDt804="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bw.mp3", "integrity": "sha256-WjVDVXlkx5fnAgUZcxglXf7DR4JO3h1F3U3nexrXiJw="}],
+  "by": [{"url": "./assets/flags/320/by.webp", "integrity": "sha256-sfj9I9LAtxhAm+7aEjnQZ+6Nafn/dNZYw6nWBkem17M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/by.mp3", "integrity": "sha256-9uwPimK05QDkE1QfsErt4eIxZqVeCSEzyP3/L5X9Li4="}],
+  "bz": [{"url": "./assets/flags/320/bz.webp", "integrity": "sha256-GwTDF2zkaS3XI5pCrt7O7t7njJnkPYGCI+Jd44rQV10="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/bz.mp3", "integrity": "sha256-FVDU29bCFifuOyJyiVrNcQQOoIjwG/1mNPCbJfgC6w0="}],
+  "ca": [{"url": "./assets/flags/320/ca.webp", "integrity": "sha256-KujBPP88FGOrykp6jyusJ+SdGm0O/4VEEU2sLcbocOk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ca.mp3", "integrity": "sha256-wIl4Qp+0APYL0RB76ZL0uhQ20zSLAPn0SO31zL1xayg="}],
+  "cd": [{"url": "./assets/flags/320/cd.webp", "integrity": "sha256-uI5+zCf50Vu8PZkdl5vHYx5OtJYuHa3Egji066GkJuQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cd.mp3", "integrity": "sha256-MfR8kSAZgxwVHtURjz+JZvwW60Z4Tss4+V+FC4w28D8="}],
+  "cf": [{"url": "./assets/flags/320/cf.webp", "integrity": "sha256-EIbcnyJzG+L9BAAaza55BuPvISIB8jyrp+JF1Nr4kw4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cf.mp3", "integrity": "sha256-eGzQD/qNm7Gm5CmreN9pILAVfE+NsWG2Qq7F72Yn2Bc="}],
+  "cg": [{"url": "./assets/flags/320/cg.webp", "integrity": "sha256-TzDZi5MwE32JUtbOtJlHi6q/ND4cHa6tACcMoIO64HU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cg.mp3", "integrity": "sha256-2jgYNLCznudW9PO4cER0eJzxvpGdWGRgUwl3bG1gvLw="}],
+  "ch": [{"url": "./assets/flags/320/ch.webp", "integrity": "sha256-U1Eo6OqLQUOHC8C21PMPH1DjIhiXAi4y/08fZYIgaJ8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ch.mp3", "integrity": "sha256-UGroesVCI4CZIhlkWDb72jz61irDzvjnoidyDUmxCbs="}],
+  "ci": [{"url": "./assets/flags/320/ci.webp", "integrity": "sha256-UAvaa0r1q2z7yBOVIuSMC4NwYAkwY7/SpPrA6KWmJ5I="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ci.mp3", "integrity": "sha256-M+e9XlqhA2xuCOKz55wJzwbvxtqUcc27tQKZeH82Tn4="}],
+  "cl": [{"url": "./assets/flags/320/cl.webp", "integrity": "sha256-4cgU+8rndCwcgVuzP094LQimjrO/luDyJKSLzA6j8tU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cl.mp3", "integrity": "sha256-ANfYgc8ViqJu3lkdG/vPoKC1xRpBIr/AOmGPlQ9GEdo="}],
+  "cm": [{"url": "./assets/flags/320/cm.webp", "integrity": "sha256-WjATRjQwa5EZEh7awwmrlYZzAJ2JF7a8lrHabFcBNs0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cm.mp3", "integrity": "sha256-p3ZQ6Ja8rMwy7/bMhsnRoOcEpVFIy/dV0bTHuM/EtJ0="}],
+  "cn": [{"url": "./assets/flags/320/cn.webp", "integrity": "sha256-Ofc5HvPK1qUHaX5McYXxPcsJlh5HFXd/956EVBOZPKU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cn.mp3", "integrity": "sha256-dsaEg1NnSEioYc8ogmxdW/2fbzAy3nMkhzPcDDZjWwA="}],
+  "co": [{"url": "./assets/flags/320/co.webp", "integrity": "sha256-WUW2GBoTu0eFby90CrP1DqNhHj95sYCsjVs8jTj+LaQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/co.mp3", "integrity": "sha256-wM4Nhag8KzPfeMrnOhqokLACmj1qV/7IQ0RLbEFHIjg="}],
+  "cr": [{"url": "./assets/flags/320/cr.webp", "integrity": "sha256-I7Us4usrVocva5bQDtuca1AXevsn47bV3hAFs3L2glQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cr.mp3", "integrity": "sha256-SeLUY1T8Y9qkCtu99dn9JnBmywAsO7UJAs5BWll4+zk="}],
+  "cu": [{"url": "./assets/flags/320/cu.webp", "integrity": "sha256-eKLa/zMs2uGc1Xxv3GKvu53uBJEpv5VfLmj7aNt16rU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cu.mp3", "integrity": "sha256-VzxDTP4nJF6oZRGfomCd22RBI1JFa8pYcV9KLygSGrc="}],
+  "cv": [{"url": "./assets/flags/320/cv.webp", "integrity": "sha256-keaGPJKHOZhPYev7J3YuTNRh4eajv6iuWlxkBkrh/6Q="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cv.mp3", "integrity": "sha256-SFbTOTLwuTe+Q44dyg3G4QFgtP3cQwljT4mYLFjk6Sk="}],
+  "cy": [{"url": "./assets/flags/320/cy.webp", "integrity": "sha256-2OHynsYP4syhPLGDkuPBEukgCmwx0QE5lz4CkeUbRiU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cy.mp3", "integrity": "sha256-bf4wK5F/mKysYYxrTY8M2iVh976qvEk4ZR2S94/glfE="}],
+  "cz": [{"url": "./assets/flags/320/cz.webp", "integrity": "sha256-GsKSsjfgPlsE7sVwHJtDG0lTUg54c6Tiz8Ko4IyhTNU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/cz.mp3", "integrity": "sha256-OzVjOI7xLnBtepxsHbU7iIhJHw8VFnG59YtEADDp6is="}],
+  "de": [{"url": "./assets/flags/320/de.webp", "integrity": "sha256-Ibtek+/zl+CRFFYALjmzFahqHg0b+GdWYFBPAAq+iEs="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/de.mp3", "integrity": "sha256-Gwnzp2+MgvwOfotw2hej/vYMpOivGuUpR8HpTofUUi0="}],
+  "dj": [{"url": "./assets/flags/320/dj.webp", "integrity": "sha256-b34sObT0pasdNZMk0Ar62jmg3mevfNJzjNduq4q9Hdk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/dj.mp3", "integrity": "sha256-3xpgZe/hckE/L9mRE3WPGpBKdU8ivAq1jcaF9DTEH58="}],
+  "dk": [{"url": "./assets/flags/320/dk.webp", "integrity": "sha256-IubMaE6VtJ8LeT9KvzULcojO9ufZ1wAXn8CjPZzJtI8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/dk.mp3", "integrity": "sha256-cHvifegnF6mR1Fi1r3ADLPZKzNoSl8lMkJcOvFs4Pwk="}],
+  "dm": [{"url": "./assets/flags/320/dm.webp", "integrity": "sha256-eU7EDv+BwEJN8LAApK/aiTmLU4+IZCgGQFw2rb/ULto="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/dm.mp3", "integrity": "sha256-b4mFHz3w/XhzgojQm9smuVx7Fvr7japVlW2ZMT+JjJU="}],
+  "do": [{"url": "./assets/flags/320/do.webp", "integrity": "sha256-zQdiY1z67tF6ixQWiVA3I5WSMaUPX63C9MLuYTER5lM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/do.mp3", "integrity": "sha256-VgkBSKH2Qt56NiUJjqBipYLERLKFTJlKZVPhryZ0rjU="}],
+  "dz": [{"url": "./assets/flags/320/dz.webp", "integrity": "sha256-qzpWJZbBReZzirAnbrRzkAideWlJt+Io7Cs+IhgHMWA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/dz.mp3", "integrity": "sha256-tGhX2oQVrp3E/sHArqcHiqPMyRpb1fkJAJe5nkxupts="}],
+  "ec": [{"url": "./assets/flags/320/ec.webp", "integrity": "sha256-7NOJfY4j5rJpwbH3lOxnKuTm8FNa6lqjBwE7rDaEqFo="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ec.mp3", "integrity": "sha256-g2AcNdoakWaRmimAfx8JNZ3UTSxLzt18VEzCYROh5d8="}],
+  "ee": [{"url": "./assets/flags/320/ee.webp", "integrity": "sha256-zHdTYo+Heir2DLQRHlGbRZZlsOSRdjdDR3q01dn9opM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ee.mp3", "integrity": "sha256-vms9mQFE/unY3YmUtvZyRZlcsfZBZcj06ZM+dk0Q6KU="}],
+  "eg": [{"url": "./assets/flags/320/eg.webp", "integrity": "sha256-OpNt7Er0q8dCydgbLMCohdr+QinyOiDVPTo7mzY6RTQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/eg.mp3", "integrity": "sha256-9yIMWQq4/yUJO0qQmrEkYAPrTMpzsJ+WEHiY27X2JMw="}],
+  "er": [{"url": "./assets/flags/320/er.webp", "integrity": "sha256-kdrH1lCzSlXXQBdoJa86ssyCzdkfEROfW9NtWaXSs3M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/er.mp3", "integrity": "sha256-YiEAghZltb3m9amqYi8T67mMYavmdMUR68kze7bTo9Q="}],
+  "es": [{"url": "./assets/flags/320/es.webp", "integrity": "sha256-fBKxej2I8Aj1DEQpbjp6xwUbJY3baDTZtpmNoddngDI="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/es.mp3", "integrity": "sha256-q4ytbyTW2KKm/W4McnRkcMadqFZmHmmJv67pF7DCoqI="}],
+  "et": [{"url": "./assets/flags/320/et.webp", "integrity": "sha256-8tPKe21GDxlyBNLm+Bz3TrWaNFljC8hbI2r0w2BhFnY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/et.mp3", "integrity": "sha256-b/if/6iqIpmsU76LhpL4dsnL5aHitH1gjImvAtYV0m0="}],
+  "fi": [{"url": "./assets/flags/320/fi.webp", "integrity": "sha256-lMqPDtQyLbH5U2BBk2DnOJRm9zmA/GYAXeZp598kRTE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/fi.mp3", "integrity": "sha256-9YYZI85OzlKMFvHnTyJ+5MBqtzDu5h9DEkHg7d0p20Q="}],
+  "fj": [{"url": "./assets/flags/320/fj.webp", "integrity": "sha256-r7SkFEKln8Oqh4VOVLeE9Lvac+bC8Iak4J0ekutv4IY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/fj.mp3", "integrity": "sha256-1nqEb33k8m/aFzpRJJcFmcnp6ws0LA3A10zkWHpm/1Q="}],
+  "fm": [{"url": "./assets/flags/320/fm.webp", "integrity": "sha256-Ktmq/Cd003aHC4LbDul25Hgz0a10yNRaXJucLHXKhb4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/fm.mp3", "integrity": "sha256-vZRtLVBtA87EMzt/+fhk+uQpy5dgujTzPyAGtrmHepc="}],
+  "fr": [{"url": "./assets/flags/320/fr.webp", "integrity": "sha256-X6kPvDSXdMs1irKgh78NGIX4XRE6+extybk2eH00faw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/fr.mp3", "integrity": "sha256-YeUUq2K8tyQjXQsmw67+0fyFJLw/wR36Lbmz4pwQT8o="}],
+  "ga": [{"url": "./assets/flags/320/ga.webp", "integrity": "sha256-LZNgdyVB/WSzRIbnO/gb8J/RoPuNreA6oEBDinmObOE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ga.mp3", "integrity": "sha256-p6P9zJ+wPenioKG28xohigCUHpvCQHPyi98NttZTErU="}],
+  "gb": [{"url": "./assets/flags/320/gb.webp", "integrity": "sha256-GQDyjd4UaR3PaHsNYhUR0JREyzc7VEd2Fvur8HJfrtY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gb.mp3", "integrity": "sha256-AOoLQxFOTZQS93Ql46TEJI/Rc9Rm+HQtN7G1nmJcATc="}],
+  "gd": [{"url": "./assets/flags/320/gd.webp", "integrity": "sha256-btMMt30yx/uMdd9J5DQZKWOA3lffHCd95IWIFASOs0Q="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gd.mp3", "integrity": "sha256-xGcA1DVd/U+l5zH818x5e9FXTb0Rm3dCrke78Znb8Ds="}],
+  "ge": [{"url": "./assets/flags/320/ge.webp", "integrity": "sha256-3fE0sGVRWAugcuZtF+mtXi2jzW4MHfX5JAi7KL8WDLY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ge.mp3", "integrity": "sha256-NwGMk2vptmc7gihwObTHwObdx6cdfK+vXts+v+bWhco="}],
+  "gh": [{"url": "./assets/flags/320/gh.webp", "integrity": "sha256-f4bw2CSv+hrYsJ0zJKlLbsmeO93FDl2kNaNgOQs8WrY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gh.mp3", "integrity": "sha256-7Bhc93XIfIBYwZI5E2scJFcuVXRjYQLG8HkiFHGj2Jc="}],
+  "gm": [{"url": "./assets/flags/320/gm.webp", "integrity": "sha256-ajOBFKkHS6Pyao+DFFDw1UsKMhcGEe8Hzb8jU4KEk7M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gm.mp3", "integrity": "sha256-UbrQpJJuDD5ICYFC8wrr3lVH+nTENTLAFIylZTF63YQ="}],
+  "gn": [{"url": "./assets/flags/320/gn.webp", "integrity": "sha256-doxHHdngnZrfSKmqAZ4jyh0MRtTSfhXDQ5EaY2vA4sg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gn.mp3", "integrity": "sha256-e5H0IoeJdUvsl5dvZWKXvdtAliFw8AfVKGqDkxEt7FU="}],
+  "gq": [{"url": "./assets/flags/320/gq.webp", "integrity": "sha256-18yup+Tzvj1Zmu48AHBRKi935IWjXdPxL+W6Sg6WKcY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gq.mp3", "integrity": "sha256-F24zJbZ91RtPioVf2JKHMTev36FV9S+/Azp6oUxqzNU="}],
+  "gr": [{"url": "./assets/flags/320/gr.webp", "integrity": "sha256-wfrV0S8jGl2I14y93NRpgbLlWYohZBnt0sBrv7AWgFU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gr.mp3", "integrity": "sha256-kOZmFHrRZWp5/4gn+SvQrnC3p3af1prpV+kDnIkWazo="}],
+  "gt": [{"url": "./assets/flags/320/gt.webp", "integrity": "sha256-+g1F4YiwwSAldQ54KMA/tX7IbEYOG/xNHc2SltSHlhw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gt.mp3", "integrity": "sha256-o7T3rUUwzHbwSKPMx0giq9EmpzgRd+JeYMGHd2gWq7M="}],
+  "gw": [{"url": "./assets/flags/320/gw.webp", "integrity": "sha256-2oWW2zV8h+Kg28kcxuAQwqF87qxrkXSK4Tei1NmNr9Y="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gw.mp3", "integrity": "sha256-7qcEkuI4ixoAJap5sp5WJ54F8MURdHyvir1xQZUiqc8="}],
+  "gy": [{"url": "./assets/flags/320/gy.webp", "integrity": "sha256-XZ12hK7gnvRm9a14H/D0nLCx7R2+zyx9PYFprKOn39c="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/gy.mp3", "integrity": "sha256-c8CmMUl3BMM/vBuv7a8nIfKc/ssY7TrbRQhY89uYoug="}],
+  "hn": [{"url": "./assets/flags/320/hn.webp", "integrity": "sha256-JHGiw+wcxmZO2pQyQuQ4CiapfVaXPHrUR3uyypGLecs="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/hn.mp3", "integrity": "sha256-mMOla6d62XLqrBxQvyXSl+WdTLWR5YU5Tphb/wSjpJM="}],
+  "hr": [{"url": "./assets/flags/320/hr.webp", "integrity": "sha256-t9X+rCiyHZa7YY8mLmtRh78meSKu6vq1wfXm/i19SBo="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/hr.mp3", "integrity": "sha256-e1oV5TURt4nR1AdlhcsKBmqTOzRbAxTstdrVvxwgQFg="}],
+  "ht": [{"url": "./assets/flags/320/ht.webp", "integrity": "sha256-aHCaaWVkxaAfL3+6IbVOgFSfX/R1OX1lCdjHl96Tzv0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ht.mp3", "integrity": "sha256-FoeJbp/AfS6ATAkNfnt/A6xfJO8ecVPZvgqKcCCIxyU="}],
+  "hu": [{"url": "./assets/flags/320/hu.webp", "integrity": "sha256-8aqTQDhlPQJkbro0gxHSDCmcbrF5skEVJ0lUEQvMHNk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/hu.mp3", "integrity": "sha256-bPNaM3k2xmQ7B3uzKrcGonwM1CVb1INPh8j9SMdFSXQ="}],
+  "id": [{"url": "./assets/flags/320/id.webp", "integrity": "sha256-2h3HJ/uWlpYjgp5yklypPoo1sAP+bXt2i498Yc9JveM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/id.mp3", "integrity": "sha256-Nhd1d2ckfERaXzAvCTMKpNKDTK6KsY2IKvTMATbCZ/E="}],
+  "ie": [{"url": "./assets/flags/320/ie.webp", "integrity": "sha256-12FZaho5CDYjUdfZXdswhN6STtPPEi7dQCWlschc7Ow="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ie.mp3", "integrity": "sha256-uQlscdPC6r/gNvSRoKRSPsOZo0VN4hs6S2JMD6xjLRY="}],
+  "il": [{"url": "./assets/flags/320/il.webp", "integrity": "sha256-i82OByuDfnoeda8Csf2CLf8IlKL6H7CHu7mULsdWpuY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/il.mp3", "integrity": "sha256-dwugluLIWEqWl63Gi0j/XTnKSjGL5X3kPgTrOaZhD1g="}],
+  "in": [{"url": "./assets/flags/320/in.webp", "integrity": "sha256-ggmh1FYIiKrhlrYilgtyy0NXDNJnKFb+EZRh6fzH2K4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/in.mp3", "integrity": "sha256-jquQP5DZuOWYr1AiaGB9mtT10WL+fxNgUUHym6q2AZs="}],
+  "iq": [{"url": "./assets/flags/320/iq.webp", "integrity": "sha256-yv5OMO8OWzVAeKyO1UsD7fyDzT19bUHL8Y3po4Co9yw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/iq.mp3", "integrity": "sha256-cvAgsUmcyOLhE2LH/2QyPlmGtIduemJjeSxxkxCWdZM="}],
+  "ir": [{"url": "./assets/flags/320/ir.webp", "integrity": "sha256-RHYsYWRRe8i3gbS5ereOliqPihffLvJF9YvIs2kRC5M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ir.mp3", "integrity": "sha256-n6HQV6qIP8PLlKqd40+aETmcjSMTYshWIM8lgyJ4U/k="}],
+  "is": [{"url": "./assets/flags/320/is.webp", "integrity": "sha256-Ri5gMd4O7PPl2Anp4D9fHxzu8eZhRQYS3dl1MvIVLsU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/is.mp3", "integrity": "sha256-gpSg4+FvwxK3q3TqzR/xdyhJ+UGRWkXvYfNnl9DIpXw="}],
+  "it": [{"url": "./assets/flags/320/it.webp", "integrity": "sha256-WuKATu7CvoRgCNvoIw1EMpMdKc9qVvd9aj/ubmK0Wpc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/it.mp3", "integrity": "sha256-VDENwPWM38LMd/8egYjdJE5tqRpIfGivlGynu4f76jA="}],
+  "jm": [{"url": "./assets/flags/320/jm.webp", "integrity": "sha256-eeuegg5H+O7EMzvrLPFT9GREwZseB1uRsdCApNbVl0A="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/jm.mp3", "integrity": "sha256-qCmePj26ztAwLD7KzzBZRDU5NfRej/azY6ItKQCn4E0="}],
+  "jo": [{"url": "./assets/flags/320/jo.webp", "integrity": "sha256-wHCebni/CXwlRlNQyYKxwcCYBVMJTwJLx5PQZizJYEE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/jo.mp3", "integrity": "sha256-3NKjMjvHYhxYjquQT9XS+n6qfz5Zwii7c2VycHJiork="}],
+  "jp": [{"url": "./assets/flags/320/jp.webp", "integrity": "sha256-w4FHbqk9SCCPP07oxblaDaMkrImdPscQV5Lz+jxOLx8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/jp.mp3", "integrity": "sha256-5ZFyO8qBNMN4aqILER4zQwHljVdV16oG4ujgjf0IKAo="}],
+  "ke": [{"url": "./assets/flags/320/ke.webp", "integrity": "sha256-atTEGq4ZmpUhrjfP9SNL7HqZkPS0mVrgLfVsStNho5Y="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ke.mp3", "integrity": "sha256-WwsnrI8thuYCxnFIQKCvUHPZ+kX3oFsV0Yt1ng59xbo="}],
+  "kg": [{"url": "./assets/flags/320/kg.webp", "integrity": "sha256-Z8aJ0kdIE0CmaoXUJPec/716nlqb3YAjsmntDshXtMg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kg.mp3", "integrity": "sha256-2WtcUNyo7syL+oqor9pF8QdZ25Rk9EjnMUQZfGSvtQQ="}],
+  "kh": [{"url": "./assets/flags/320/kh.webp", "integrity": "sha256-b5Lnq4sFdStQcwLJzAoqAavrW97PpEBjL5WFc4GDvG4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kh.mp3", "integrity": "sha256-Qhj0Go7yM2Lzuj9ZRg0YF7tDv0widjseJzH2M4TUEMs="}],
+  "ki": [{"url": "./assets/flags/320/ki.webp", "integrity": "sha256-3J6qWPSV7PIdUnma1/js/S3pxndyax3Vnq6dBqe3Teg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ki.mp3", "integrity": "sha256-KJ/ph0lmER3f3o5EotrAFPiR+II1F/3500TkuiLArjY="}],
+  "km": [{"url": "./assets/flags/320/km.webp", "integrity": "sha256-CnvllYq7jp9Y20IexklLX4cFfzcOxdRr9XVTiciDuMU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/km.mp3", "integrity": "sha256-o9VY6IVh3qcvAZF0l9zUDQLR8Z8WssyfXYLZBqLicS4="}],
+  "kn": [{"url": "./assets/flags/320/kn.webp", "integrity": "sha256-bc34CCKp5Wl7UC7iHRdniwoHsllT9rxUeJbh1GuhuLU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kn.mp3", "integrity": "sha256-Jstl/bQ3f3kfSwbD5UREnb7TL4yREli3Y6KinZcGt5M="}],
+  "kp": [{"url": "./assets/flags/320/kp.webp", "integrity": "sha256-CKcu7gvhZy+hOb9HcD35Y6arpEAnMHSXTO+pTOD0gYE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kp.mp3", "integrity": "sha256-eo37I8Kp2uVLaYnkAI0suBZKG6rF0xWwHdAVU9alANM="}],
+  "kr": [{"url": "./assets/flags/320/kr.webp", "integrity": "sha256-Q2IkO3P8ZhNexFUhyAK1fvfEovzQxfrOpIAXoT8G93g="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kr.mp3", "integrity": "sha256-4EGLXv3ykA6wvmq4F9mdYn8pXKsXRjMqRRp8PtW8pVk="}],
+  "kw": [{"url": "./assets/flags/320/kw.webp", "integrity": "sha256-IDDSYUG6jOVNYexJONFnM23PJ/2OJni91XFMdttEd7E="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kw.mp3", "integrity": "sha256-udS2sJWPCcZDlwYEcN2ZP+Fi+BuLeG1paiy/Ff6PAw0="}],
+  "kz": [{"url": "./assets/flags/320/kz.webp", "integrity": "sha256-z76b9VTYxdnW5hxFeiaPa4d5/xEMS9b6yLoCnUcZTZ0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/kz.mp3", "integrity": "sha256-8+OOBwN//40RjX1ptLUT8yM8jPg2VmsELBszGXX8gIo="}],
+  "la": [{"url": "./assets/flags/320/la.webp", "integrity": "sha256-iUdoUUC0wyotx86iOYS5mYinO3Kod35EzToXeXYjtes="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/la.mp3", "integrity": "sha256-PlbeacKNUeDlC14z/DNpOjLTUzMCg9iDXpf6ODhc3b4="}],
+  "lb": [{"url": "./assets/flags/320/lb.webp", "integrity": "sha256-pGGfUWjAhW7c4RpCnWSvIcRrEeKzEa5d+B0IeBNycew="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lb.mp3", "integrity": "sha256-5RDBlVdEE0ZYuTe9H++cnig7+btyqPrP8w1YswX4SGg="}],
+  "lc": [{"url": "./assets/flags/320/lc.webp", "integrity": "sha256-EbpeXLjHJhSMnCa7Zfwn4cZZquf4E9ZLnCoftYTsws0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lc.mp3", "integrity": "sha256-LvGc+VSrs12sy8hazkhpScSCy9Ph1auyNYHBQQqCY5U="}],
+  "li": [{"url": "./assets/flags/320/li.webp", "integrity": "sha256-B7lZWQrNbLxaezLWtMUmqldrO1mn9v/28D322BMPv2k="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/li.mp3", "integrity": "sha256-tjkXosM4l/C1g0iaA3/nmTbwdR4nN4/hRu8vhkSpZ+o="}],
+  "lk": [{"url": "./assets/flags/320/lk.webp", "integrity": "sha256-mwqDIMYdSK2rZaw+3n61CG6GKKoGNFXFgyjyBgdbae4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lk.mp3", "integrity": "sha256-+UgGrAhDeZ8kKVJ8OjIdz29CKq4ADRLkYLz8WqfN73I="}],
+  "lr": [{"url": "./assets/flags/320/lr.webp", "integrity": "sha256-RlcGN9F2Qdyo3IZYT6l0HTNDlwnm+1qsX2vDU6XhB2Q="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lr.mp3", "integrity": "sha256-sGnz0OISfw3LP8/kSuV5oyZXC7nNxJiLl36+5ocLpOw="}],
+  "ls": [{"url": "./assets/flags/320/ls.webp", "integrity": "sha256-FuuRmUUXr7I9hlBiRTdkMCsPmv4bSd2AyzY4QOP7geg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ls.mp3", "integrity": "sha256-0zgKelqXri+hbktZueJv8KYhvtt859ilyC6Lr8ymCgA="}],
+  "lt": [{"url": "./assets/flags/320/lt.webp", "integrity": "sha256-4O2l7Mn/y119HFVt3QUS1UVZHsqcSYpR7XjCOIyTkcA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lt.mp3", "integrity": "sha256-TFiIBoLoB702vHslEzeLlQwwpPXlWTFTp9G0WslN9rI="}],
+  "lu": [{"url": "./assets/flags/320/lu.webp", "integrity": "sha256-RhLdTeMjJBmAZOrpDcG1Ww1BnpaN16PG8KSERu27qYg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lu.mp3", "integrity": "sha256-MObJHyHddz2MondiHgD55YrYztTJShZM0Pf+JM3DSFQ="}],
+  "lv": [{"url": "./assets/flags/320/lv.webp", "integrity": "sha256-BW8XJxJSKW9X2H1yku8tRzSnld30PkgoEdIAcQglF2w="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/lv.mp3", "integrity": "sha256-JCmxjpKuVZGe064StNqiEta76JGUkOq+hpnm8jfZDvE="}],
+  "ly": [{"url": "./assets/flags/320/ly.webp", "integrity": "sha256-7/t1/kjlgjaKnUJOoadzkIG4vW7hICEs1TV4BFfiSoM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ly.mp3", "integrity": "sha256-jEQaV+4Mymh9WXGiXteh1ulE3rzaziJqhCvVHGufsxs="}],
+  "ma": [{"url": "./assets/flags/320/ma.webp", "integrity": "sha256-6G7KenUxgXWth4IaN7RWktK5ufZHVhOoDuu29Gb70t8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ma.mp3", "integrity": "sha256-EbucZWrgWXTE48v2+4N25aKAaR4CA2Yd7OlBpSBO/Sc="}],
+  "mc": [{"url": "./assets/flags/320/mc.webp", "integrity": "sha256-0+ajDV0hQuDx8el9uh93dLGG+XhOeoiblR62Bzwjg3E="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mc.mp3", "integrity": "sha256-GwwhHl6whqEX+3MXs2z+VXMqt/fO/x71OkTg/GkLWxs="}],
+  "md": [{"url": "./assets/flags/320/md.webp", "integrity": "sha256-ZhmjouaMKqu2Edl4U0fzzm7cZSn/JuNEncxdrcbGLIk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/md.mp3", "integrity": "sha256-uKr2jWAWW39k9sPcfRxxSTnmf1POovaEDDf1GmvVJeQ="}],
+  "me": [{"url": "./assets/flags/320/me.webp", "integrity": "sha256-UjQPMKH1ygDY22HCGdWmctY3n4cAiCWuLtijNFg9geA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/me.mp3", "integrity": "sha256-uBQfvkETnwrPE2B7MaLSxAY0IObvnjToYE+CxS88/oo="}],
+  "mg": [{"url": "./assets/flags/320/mg.webp", "integrity": "sha256-U2Rh7Jcn2cvkj5bj3ESX7jlvJ2ppdl7jTmL7LWtrkZY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mg.mp3", "integrity": "sha256-ouA2tZAxWn6aooLIXulOJub4ITr7xXXdgtTE0KzGFAo="}],
+  "mh": [{"url": "./assets/flags/320/mh.webp", "integrity": "sha256-CEEN1Gw0eIh8D97fn8ZtHxKjLMMgHp9ETzpMba42/n4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mh.mp3", "integrity": "sha256-LUfAoGIj9s1zr0AWAZu0UolGV5eMP8cTiC667MsmYC0="}],
+  "mk": [{"url": "./assets/flags/320/mk.webp", "integrity": "sha256-iWxaYAdmbNxIupwbCovSZjP+izsCUattpFc7PaJC0vc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mk.mp3", "integrity": "sha256-PG/OpXlpivDEOil9L/KiDk0mhiItCCsxuETGzB8GcUo="}],
+  "ml": [{"url": "./assets/flags/320/ml.webp", "integrity": "sha256-DWxqW2eADfeC8WqQaYNBcEyCSHGLfjdtnMcL67zNGgA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ml.mp3", "integrity": "sha256-MnskGFyFh/WRNs3qPVsHZkYsGnedxLWIZdiDbcNu8/M="}],
+  "mm": [{"url": "./assets/flags/320/mm.webp", "integrity": "sha256-4sZ+Uk32pTIQM8MgMdXOzwJfHLGyVk294wg6s2MWsMk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mm.mp3", "integrity": "sha256-qrAnX+Us0Za8KnZ9227oRMC0slYnyI186td8TOeIGjA="}],
+  "mn": [{"url": "./assets/flags/320/mn.webp", "integrity": "sha256-eBwkfgSJDva6CpuNslFbQXiGWw+ETBqev67y9Hx5qYo="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mn.mp3", "integrity": "sha256-CFc9sHsSqejbMyQLmj1061SzitGY9Zk5R9X7yVRZAMM="}],
+  "mr": [{"url": "./assets/flags/320/mr.webp", "integrity": "sha256-90zmhSojt3gmziCPZohF/M/Yqvkg9QyYqzWIa/I+EGA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mr.mp3", "integrity": "sha256-OB3aeUFwQ3KFgHHwcETi5YewEJXE+ZTujPew5LijdPg="}],
+  "mt": [{"url": "./assets/flags/320/mt.webp", "integrity": "sha256-uzi/ugik2bwUX7pnb4aAJh3dLAazUHyWYw4tTx5Gj5U="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mt.mp3", "integrity": "sha256-bNeogLeMxx4mne7lfVS4H3TkJFpHvQTUfWpN3aNQPnY="}],
+  "mu": [{"url": "./assets/flags/320/mu.webp", "integrity": "sha256-npZN7KhRla58LUswwk/rlkO9Ffwjb/DRJUWRsTJYf4k="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mu.mp3", "integrity": "sha256-kvnzY3s8SuCSD0zp0sDJiQKuk/yeTxgUM4kYp/EbtLo="}],
+  "mv": [{"url": "./assets/flags/320/mv.webp", "integrity": "sha256-6S01QTRJuq+HGZtiPKgzKnxKfvwCcESanmyH8KFvRnQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mv.mp3", "integrity": "sha256-C1O2iIZmea0LDCEsupgdo9URsKeTUIJAyuCYXK4Un1k="}],
+  "mw": [{"url": "./assets/flags/320/mw.webp", "integrity": "sha256-QAzniqmkfJEEE6mSIVTm3OSxXe34xAL5/Rztuy9l9n4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mw.mp3", "integrity": "sha256-R9NGkzlxbBzVgEFWBij3sz4ADsAXXn1NhDZNzVlOvFE="}],
+  "mx": [{"url": "./assets/flags/320/mx.webp", "integrity": "sha256-6LZdEpszU7Nz513+6YnOISXSe2dSFcHi0Lvuy499AF0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mx.mp3", "integrity": "sha256-n7NtqKlfz6v5n8wpv/VOxZ9EsL3kJ/TM4ujlSTT+CXI="}],
+  "my": [{"url": "./assets/flags/320/my.webp", "integrity": "sha256-ftyWO3TSqjBcEA8IC3Ai3baq0AaM0K/VRFw8ZbnJOjI="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/my.mp3", "integrity": "sha256-Xl1t1QADW4oCDjY52TtYb9hftlSU9HJGTRjqTutQzM0="}],
+  "mz": [{"url": "./assets/flags/320/mz.webp", "integrity": "sha256-/os7cW9rrPQ+3EW4yg2+Y4ni2HXbeAPaZy2KOrAL4n4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/mz.mp3", "integrity": "sha256-PFnrwxYEdfhyF5fEkWl62CHHIPEDH2mNBqOeaxGv+Jg="}],
+  "na": [{"url": "./assets/flags/320/na.webp", "integrity": "sha256-Y8UrToyo9ZrAeJG4ucpfG9I3TGzKUr5XcW+eIE0lq2Q="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/na.mp3", "integrity": "sha256-3YVNkK3t2gk2ocbknFL82xVuHGMRgrMX+0PPwN046Mo="}],
+  "ne": [{"url": "./assets/flags/320/ne.webp", "integrity": "sha256-cY3wuL4ja9oumUme0huUDxkDS4DF3Dg6yqmDR0iMLmw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ne.mp3", "integrity": "sha256-VICoARiGiyjX5Ed25i8q5B37RGi+8++WljMvV/iOdrk="}],
+  "ng": [{"url": "./assets/flags/320/ng.webp", "integrity": "sha256-XYYuGufT+DqdQycbAoxqV88r5BYnBfswlINB9TjIl+k="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ng.mp3", "integrity": "sha256-TUCp2NLRkjIOsNd29rIujbnrvmwo221J8munWudo/Gs="}],
+  "ni": [{"url": "./assets/flags/320/ni.webp", "integrity": "sha256-/DulH3OFjqyV9RmrXQqsCLFSOeq8nLSQvHvdFm0oja4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ni.mp3", "integrity": "sha256-tNROn4EyJsGS4mhHPAqJN3E6SLzu3kvpJidFj8m4wTc="}],
+  "nl": [{"url": "./assets/flags/320/nl.webp", "integrity": "sha256-06YVFWPmzyKzy563LlKfNtulk4+expO5E2m1XRTsbyg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/nl.mp3", "integrity": "sha256-jVpASv+UcwcyNC4wGidpBxeuMmVoE3nGLyhGc8r9gMg="}],
+  "no": [{"url": "./assets/flags/320/no.webp", "integrity": "sha256-+gx1VOsTcsNQLhbcn+OUvB+qb/iB34S1uNUAA7JUGec="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/no.mp3", "integrity": "sha256-EloNjGMJQljDJkchAcQLi1JQvK+4Qad8z28w/x3sXF8="}],
+  "np": [{"url": "./assets/flags/320/np.webp", "integrity": "sha256-KC9HhWlBzUZU6MA2ZIbHYm+zk6+wk4bsF4yHTbSJe3I="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/np.mp3", "integrity": "sha256-6+oxz3vJs4b0dDhw8X8XMAuZpZzW3TUWVAWfF7aNmgg="}],
+  "nr": [{"url": "./assets/flags/320/nr.webp", "integrity": "sha256-sf/+dVkIXcm0i3tkWOuZK7L3GIctIIK02IVJCX9+dvM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/nr.mp3", "integrity": "sha256-l8BpMufdo9IhXMO/JHGzbxgl+OOiLBW17dUBWTCDHdg="}],
+  "nz": [{"url": "./assets/flags/320/nz.webp", "integrity": "sha256-mrjx5ANstUFW3fXafm0P+Wqgzzr4R5IfByuqH8V5V1E="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/nz.mp3", "integrity": "sha256-3k74bZNZvmjXl33OpwqsPBicnNq5lzfh+n2r/nafEDU="}],
+  "om": [{"url": "./assets/flags/320/om.webp", "integrity": "sha256-5lB9liX3MrZCEaM3T4d9aqtTg0UAESmL3thCC63bsc4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/om.mp3", "integrity": "sha256-gIjdRcGmhPfhEsOjfpwZTtbKl/gBDimMK716nzZYmPQ="}],
+  "pa": [{"url": "./assets/flags/320/pa.webp", "integrity": "sha256-20S4k+J2R/ZMEvwbFCsoGrLoJ0MUxq3ky0dNEXuRwKc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pa.mp3", "integrity": "sha256-JvDt9lJXfyrlyHLGawQR9phwacde9gG9MUvhq7PfLc8="}],
+  "pe": [{"url": "./assets/flags/320/pe.webp", "integrity": "sha256-3ZZTzQz4B1x7JEyAZU12PN6h7qXxuooBoBnHCmGoK7Y="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pe.mp3", "integrity": "sha256-m2383CN++7T1omzcRRZGsQhw2LWjBmkOE5daesEAumc="}],
+  "pg": [{"url": "./assets/flags/320/pg.webp", "integrity": "sha256-JQWpuDD+Y/G/wZbSJ1iynSLAHmLmf4f3VKE3VfFugHQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pg.mp3", "integrity": "sha256-IQKTc07MD/lZeB2JKTMtUO2UmIEDpfiw4pXi9iTjy3w="}],
+  "ph": [{"url": "./assets/flags/320/ph.webp", "integrity": "sha256-l7L3H9OWTw88Jur+ts9iIkiAUs1mGrHW+67mOSO75I0="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ph.mp3", "integrity": "sha256-9oqhq0rIMTFoAafaO1ESKu/gA4DJc/DPxkYxEiFAmsY="}],
+  "pk": [{"url": "./assets/flags/320/pk.webp", "integrity": "sha256-vR0CAPmIk32ieXZGpMqzLtiqYLq1nWyeLBtfZMFD7AY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pk.mp3", "integrity": "sha256-LjwPND3kBRLv4aihERU5ttsb7sQq/sAOm+gPLwc/aro="}],
+  "pl": [{"url": "./assets/flags/320/pl.webp", "integrity": "sha256-7YnUBWN4akBBPO1s/sYlvEfEEIlK+uvyjj0boTePu+k="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pl.mp3", "integrity": "sha256-vsD9NlEaGN0RlXCY4bo6JtNOFuBB8I9nx+U4Ji6nK/Q="}],
+  "pt": [{"url": "./assets/flags/320/pt.webp", "integrity": "sha256-qkyBL3JlsLoWbP7DahBH3aOaf0PLFAL/nxd+HvJ2+uc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pt.mp3", "integrity": "sha256-Ag1zsplf3DiyhPyBvnL9ZksSitOXiCNB4Q0lN1v09pU="}],
+  "pw": [{"url": "./assets/flags/320/pw.webp", "integrity": "sha256-LD8RcF68Mq3pLYPAzpTqoncVug+iAmFKmemI9NAxtOk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/pw.mp3", "integrity": "sha256-56YU5kRojPjGhCEyWnw+SrcnLf4d81li6Poo4HPXyEI="}],
+  "py": [{"url": "./assets/flags/320/py.webp", "integrity": "sha256-IfctLlA0iIvqB8f2d6NBu21pdiWJLjAOOxE7tPI9BXc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/py.mp3", "integrity": "sha256-3tOsJCp4hHcW9kCYWTR0yJd3UWeoXZOtFJVxDpCQnXc="}],
+  "qa": [{"url": "./assets/flags/320/qa.webp", "integrity": "sha256-XjmQWeYUSIVng6FBfYYHjWjtB+xotMXFvRFOCgOxTDg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/qa.mp3", "integrity": "sha256-rEOh3dqUA+tIxJ0kwNSmuGBURiLawcz/sERcbMjF0s8="}],
+  "ro": [{"url": "./assets/flags/320/ro.webp", "integrity": "sha256-8grO3GE4k3Uy5VMItGwYJETQtRvOEwL/jc7HQM92p3M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ro.mp3", "integrity": "sha256-rOJ3OaIBwgrh3bktZ8zudhOCgJL8UATWINbPJdwkF/8="}],
+  "rs": [{"url": "./assets/flags/320/rs.webp", "integrity": "sha256-DDdf1QmeHA3swJMV2aGPqifWYLIOz4xq0hIjsz/2G3o="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/rs.mp3", "integrity": "sha256-YXqhlt5wQUvR63PFKKVpM8QpMB2TCRJrAJjdT0VDXh8="}],
+  "ru": [{"url": "./assets/flags/320/ru.webp", "integrity": "sha256-h138H4JgHQIe3UjI8o5glMgrKaH5Y4M+1uY2InDgR6Q="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ru.mp3", "integrity": "sha256-cNkkp/mHIYiwR1LCwBIJh+tMRz4MgtWJF14rPlUkVgw="}],
+  "rw": [{"url": "./assets/flags/320/rw.webp", "integrity": "sha256-jFuqXk8Vg4c7dml2yt1Ip8oF7hy4X8uafDRXhkHEJZg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/rw.mp3", "integrity": "sha256-S/WXCzkOn97/K9o1svboowm4TXmLcjTEOadMnnutoBE="}],
+  "sa": [{"url": "./assets/flags/320/sa.webp", "integrity": "sha256-BoSiETLPoAsC/sj614oCCxVMfc3ccqQU+Ep1X5WX5oM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sa.mp3", "integrity": "sha256-0pQmVprYo7DZ+ZzYtWKTIFL+Qcm0Z68bwMGIuRROxII="}],
+  "sb": [{"url": "./assets/flags/320/sb.webp", "integrity": "sha256-sRfWZh2J1GYj3kGEarXfw/+vAWotJKQ7G71REuoB5iM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sb.mp3", "integrity": "sha256-D3HpQzU73Y7bS2ktsvV4VyPcDGP+1lW7onhSqWbgibY="}],
+  "sc": [{"url": "./assets/flags/320/sc.webp", "integrity": "sha256-IrMcpYDuPvgZeoiQ8yHkxP6ZlHDQrOdViZf3h6c+PCI="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sc.mp3", "integrity": "sha256-Gh8M7hhi2t/6Q5njR/zc2j42C5s3NnMyBMG2xJ6O7l8="}],
+  "sd": [{"url": "./assets/flags/320/sd.webp", "integrity": "sha256-4yV5qfh885O6XAlc9cpyGSeJvg21oBRsVo4BPS1Gd6k="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sd.mp3", "integrity": "sha256-uBT3jdw0niNajsug4zuquGPbUvCE09G5XCgnWDL3eYo="}],
+  "se": [{"url": "./assets/flags/320/se.webp", "integrity": "sha256-LiOSzy5T/2KQQed4Gl6bEdS3oIbKDnxCTgC3Lt+qtrs="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/se.mp3", "integrity": "sha256-CD608hcbYhlKVl5+3yY2yyey9mBxUio1GFqmk0XHjMc="}],
+  "sg": [{"url": "./assets/flags/320/sg.webp", "integrity": "sha256-VAM+FClBKa4LG8XLAgSXSVE21on7RsKH/DyzZ02TwzM="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sg.mp3", "integrity": "sha256-HNqypoFbXVhijV2lcgPs1QUD7rA3js6Bl7HELXKhAcI="}],
+  "si": [{"url": "./assets/flags/320/si.webp", "integrity": "sha256-6HPhZnC1maagRiAtMyKPBWpoEmxXY0lJyFWidk7+gg8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/si.mp3", "integrity": "sha256-7ddSgyiQm+1uQdCyAw716GegWq3BOt+6euaylG39ZrI="}],
+  "sk": [{"url": "./assets/flags/320/sk.webp", "integrity": "sha256-OF7QONYWgJdeHaXSDX3Q7fkXX4509iVB6CNmHG/KUBE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sk.mp3", "integrity": "sha256-i2pteXIXfosbzJieKfbmHnloJ/RX4i+nsX68u/xergE="}],
+  "sl": [{"url": "./assets/flags/320/sl.webp", "integrity": "sha256-0XYiqs31LUaQFjQIvdp6VO0pioWU09TV8y2pjGCP6wA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sl.mp3", "integrity": "sha256-o5clDnve2juH1zKW2/27RQHatOrp/v+SAzyY8stg17w="}],
+  "sm": [{"url": "./assets/flags/320/sm.webp", "integrity": "sha256-oRMhu8d0dmktMgMmEm3kmBugnjtISuVjE8XlvwjK960="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sm.mp3", "integrity": "sha256-zSEskyCzS3i+hvqQ/kCG9hrR/to2F+gqKf+HmKpzfhI="}],
+  "sn": [{"url": "./assets/flags/320/sn.webp", "integrity": "sha256-NiLAtK8aHAIWJhW2uBCmr5Y0TLFDLqPdkIs0ilm5YHY="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sn.mp3", "integrity": "sha256-Q3XHdSWq2TIAwL3RKoBuJg4hdI0AL8DJ+zQA41hF/kU="}],
+  "so": [{"url": "./assets/flags/320/so.webp", "integrity": "sha256-f4ZgdLpS27bUBmNcDSCXj7d0EYTytS8ZUg/O8AXzN9M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/so.mp3", "integrity": "sha256-MQ3ULFRb/ls+kUy9PhvEnp4K6GrlVVVJYo8N/RRB0Z8="}],
+  "sr": [{"url": "./assets/flags/320/sr.webp", "integrity": "sha256-V1gUxIXftMM5BZfslRVS1VjXY95mZrYYM7zgIT3hZi8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sr.mp3", "integrity": "sha256-c6NaR79s/Alo52odxWtE1mYoDlqZ+xhEMpSf1LY/Wj0="}],
+  "ss": [{"url": "./assets/flags/320/ss.webp", "integrity": "sha256-uZbm81W9ZzlZSQcAgTvLqNJcLCTG/apKcdTUrG7vU1k="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ss.mp3", "integrity": "sha256-LWgsI1DEg7lhLD8ruD8eRRJebEFCu8CVtbfzljZN4Co="}],
+  "st": [{"url": "./assets/flags/320/st.webp", "integrity": "sha256-WWEVqOjCFGNP0NXoVR2VkA2HAqQG1IvgUj0GG/kF9gQ="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/st.mp3", "integrity": "sha256-2GmzrWBaKqFXm5rLhUFI4nVXvmYSBf4/e4tp/ZNP/28="}],
+  "sv": [{"url": "./assets/flags/320/sv.webp", "integrity": "sha256-84KYnwjWN+0M+Ro+1hDGeiWeF5+uQmsyBifJW92NJyk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sv.mp3", "integrity": "sha256-ly5PbZUeaYZBYmXtnULdOuo2zQFdUYKJLJsu0nbzCtk="}],
+  "sy": [{"url": "./assets/flags/320/sy.webp", "integrity": "sha256-lLjwJL2oA9C6pDYG0THrJL3u9Yjt2DbF7CVEaDBICzw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sy.mp3", "integrity": "sha256-qjFPylOCQ/6LnTmgtiBiWXB6NEaV6CX53rHutWvBrfw="}],
+  "sz": [{"url": "./assets/flags/320/sz.webp", "integrity": "sha256-UXJySEAjN0VauZX0F9j+YG2SveNJqe9QpnJ8miBi990="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/sz.mp3", "integrity": "sha256-fJTJVA9zFxoiU7FGYakICpzCJMlOh3Szxg3PuwD+FYw="}],
+  "td": [{"url": "./assets/flags/320/td.webp", "integrity": "sha256-BOCDGC+lG+L4CLG/BbeSo5KKGZrJtuqS2Vg9qudldyw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/td.mp3", "integrity": "sha256-pRy7YFLTD3KlC3jEVQGcRgBjYmS6EeufgXRn12LAR2A="}],
+  "tg": [{"url": "./assets/flags/320/tg.webp", "integrity": "sha256-9yxEU7IIpxHzTCA/gk5gzGuYkGgykm53KTRlmlc41nw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tg.mp3", "integrity": "sha256-CE7+ulF3oqRAL/PnJcQIwwYxJ5R4vSY7iiJyxeuGTP8="}],
+  "th": [{"url": "./assets/flags/320/th.webp", "integrity": "sha256-JQs/5E252HitVpnJARKZFjVCcABkuERQZioVw4CE29M="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/th.mp3", "integrity": "sha256-2TPhCtUk7n4+HfxKZOtzRN5UXt8uOQu9WDEfXMSFS/0="}],
+  "tj": [{"url": "./assets/flags/320/tj.webp", "integrity": "sha256-hcGlJATLgcT53d8r0gue7zCo3Q5eAcAEDkn9D31L42U="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tj.mp3", "integrity": "sha256-Gv5e0KTALUxK/J077wIJoCmXkujn7EJhOo96dVAG6Vg="}],
+  "tl": [{"url": "./assets/flags/320/tl.webp", "integrity": "sha256-Ez/UxgmGYqMus2gfaGkKB7rSAHBNH2BXweknM9jrUm4="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tl.mp3", "integrity": "sha256-RIh46EeHwE+LA8h5qOVjyrrPukty+u/AtfUCEPB/EqI="}],
+  "tm": [{"url": "./assets/flags/320/tm.webp", "integrity": "sha256-GSWqWHngqkRBQ79kOqx+MPrCJccY2M51AIiE6LbPb40="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tm.mp3", "integrity": "sha256-3iTYoy/PgDuUDQY4oMWPKRq7sajoKwgwdTEBsBCW2x0="}],
+  "tn": [{"url": "./assets/flags/320/tn.webp", "integrity": "sha256-zNwXMFKQXGHpuwV8E7tp1Q8O4zvCLaMYAZ0DXwsSAfs="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tn.mp3", "integrity": "sha256-2Wk4weGXVa5VvTPye7p8sEsZvtYW+JRg+hatBHqv8U4="}],
+  "to": [{"url": "./assets/flags/320/to.webp", "integrity": "sha256-i3rLeSG7xxoTJhOqbhmA5yob3pSFuxpcSj6Y7oVPDmg="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/to.mp3", "integrity": "sha256-f4iea6BsLnJyUtn0R+UBZ5qD+iusb0ZHgPAShRUpc+g="}],
+  "tr": [{"url": "./assets/flags/320/tr.webp", "integrity": "sha256-sHKuADdCxF/4U0R8y8KnOcYps7mf5+OmbEI+TVmGGEI="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tr.mp3", "integrity": "sha256-zdaCyLQM9rBnyp42isctCtUxpJ5zbczUVt7608M66d4="}],
+  "tt": [{"url": "./assets/flags/320/tt.webp", "integrity": "sha256-g7iAeWi6afh7O4Pm5Box8ys1/k/1zhYQnXlOEUbRp7Q="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tt.mp3", "integrity": "sha256-XwBDNMmzoGIqOno9LSrIhhuArajuiww+qgLWlVS9eaQ="}],
+  "tv": [{"url": "./assets/flags/320/tv.webp", "integrity": "sha256-sY8r3QbvxwKtylr3iC3AaW56/94ss8QR/BmhPPgUuHc="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tv.mp3", "integrity": "sha256-hD9lVOgjRIWyCU4poSk3w0t6MvcdpiyBOoYPphQfarE="}],
+  "tz": [{"url": "./assets/flags/320/tz.webp", "integrity": "sha256-fq76RBzbTxwQ8lOnshNfZ9WNbyQnVRcs8aEu0dMpqOA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/tz.mp3", "integrity": "sha256-+J+qfBCMISlOCIZTjcknw0SqdEMet3qgALmN+yj5WXg="}],
+  "ua": [{"url": "./assets/flags/320/ua.webp", "integrity": "sha256-f0AlxqiWuHprm4P86Q9a3+T8Cu+PPsUGJ3vkGLI4PWw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ua.mp3", "integrity": "sha256-AmzrosdkjaAtmWHsJmCAz1AGiUPSxn/ZQY9zp/ePtJA="}],
+  "ug": [{"url": "./assets/flags/320/ug.webp", "integrity": "sha256-WSvoDYN3AhelIJfaMlLSxrJTDx5Arq2r30A7kCG09Iw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ug.mp3", "integrity": "sha256-5T1Mqag6KQMgYuzxINh4b6CmTsDEX9cEHi3Oxqq5eRQ="}],
+  "us": [{"url": "./assets/flags/320/us.webp", "integrity": "sha256-jpj3tx4FjC+xLIAy3i/YS5wYi8Tvp0BpjcRcvOh0t/s="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/us.mp3", "integrity": "sha256-p4X0OYR6u50l8ucUy1GEhvQgxaLkDzn+jBmKahWjt7g="}],
+  "uy": [{"url": "./assets/flags/320/uy.webp", "integrity": "sha256-Wmy1qSCyp967X4bl5BLkXzu5xE62IrpORXdPtlzGr28="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/uy.mp3", "integrity": "sha256-kMhDe8vI8XTVHsFCtcjzslelu1cpBQuoVN1ewWeToHg="}],
+  "uz": [{"url": "./assets/flags/320/uz.webp", "integrity": "sha256-cNj73c5m/Ld8PE1sy9Ozdfro8WjkQodT9NLlNW9T5Fo="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/uz.mp3", "integrity": "sha256-px4rchv77GlFgtFVd1nETe8ahK43jvoAUyAUOzkzYsE="}],
+  "vc": [{"url": "./assets/flags/320/vc.webp", "integrity": "sha256-O27ehMKP6InOQrkx9c36CpPF5jvC/BZjzjNmPJpkTVA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/vc.mp3", "integrity": "sha256-zFXAbfkYX7h+8bNQYhJzGe9ncABXTzJ3pwEVIwT62Uw="}],
+  "ve": [{"url": "./assets/flags/320/ve.webp", "integrity": "sha256-QgfCEAc/jEFFC3QOLU2jo9pcgdtbSH/sx3irEOu0Aiw="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ve.mp3", "integrity": "sha256-RBJU5Gj1QapbhWCLqundU6DZPkMleWC5y8oGLd/5Eck="}],
+  "vn": [{"url": "./assets/flags/320/vn.webp", "integrity": "sha256-a2TAq3tO1A4I030D2meXTtplJYOjGFoSkFmUGBO7NvA="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/vn.mp3", "integrity": "sha256-Pp66VECTyjRegqj40zBFe2DlgaPB9Oczawq+sLh1zPQ="}],
+  "vu": [{"url": "./assets/flags/320/vu.webp", "integrity": "sha256-x9K2nKgYvlMMu6Virxd0AhXp08SG2yBQrP125M/rGnE="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/vu.mp3", "integrity": "sha256-+3TjszNiz5q1JVVUanXS8hS/3k4cZcwPcoDJJ7SWaQU="}],
+  "ws": [{"url": "./assets/flags/320/ws.webp", "integrity": "sha256-6opMvN3YuOnuoSZC4jfs72c+C9Fvz4RI3vXnJx5ihq8="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ws.mp3", "integrity": "sha256-sGlNlsQdZOVeuvWzA5LkStmCkwdCnwJVQh6I31dJR+s="}],
+  "ye": [{"url": "./assets/flags/320/ye.webp", "integrity": "sha256-9ajmmXwe5g7Ulr5rCd7+BUv6urHjxJAD52aX82bW3wk="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/ye.mp3", "integrity": "sha256-b1RBWfNG6ppEbD22UD54DpI9i/4tTJI4JA+vY7sWdUY="}],
+  "za": [{"url": "./assets/flags/320/za.webp", "integrity": "sha256-Nmry3Qty+M6IdJ5co2B5DCXxHh3hQRJc/sZ8adowtNo="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/za.mp3", "integrity": "sha256-G6iUbt/M/R6Iqjj2OFVNRhqZLUjwpaGs9ltF+M1IIQc="}],
+  "zm": [{"url": "./assets/flags/320/zm.webp", "integrity": "sha256-UVIiLBV2XsIzNIM9jKK//f9z6QrcW5WpI3POHanIf14="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/zm.mp3", "integrity": "sha256-xgVYB4Yir+mNVN6V10ffKFoig/bYdwdS8RWf16oapgg="}],
+  "zw": [{"url": "./assets/flags/320/zw.webp", "integrity": "sha256-Z7A1S5GL88fT5rngF6YHit30iNjk6AQ9xTiBQjq63WU="}, {"url": "./assets/audio/kPzsL2i3teMYv0FxEYQ6/zw.mp3", "integrity": "sha256-UbwMvA6iSvVANqQXE0MRHz/nV7ZjY3KFsElHm7r9Avw="}],
+};
+
+// Country codes per progression chunk and per pack
+const ASSET_GROUPS = {
+  "progression:0": ["in", "ru", "us", "ca", "cn", "de", "id", "jp", "br", "pk", "au", "ng", "gb", "fr", "ar", "bd", "it", "kz", "dz", "mx"],
+  "progression:1": ["cd", "ph", "sa", "es", "et", "kr", "eg", "sd", "ly", "vn", "ir", "tr", "mn", "nl", "pe", "td", "ch", "ne", "pl", "tz"],
+  "progression:2": ["ao", "be", "ml", "th", "za", "se", "co", "ie", "ke", "bo", "il", "mr", "no", "at", "mm", "sg", "ae", "ve", "na", "iq"],
+  "progression:3": ["my", "mz", "ug", "af", "cl", "dk", "uz", "zm", "ma", "ro", "so", "cf", "ss", "cz", "ua", "mg", "bw", "fi", "gh", "pt"],
+  "progression:4": ["ye", "ci", "np", "nz", "cm", "tm", "gr", "pg", "qa", "hu", "cu", "kp", "sy", "bf", "kw", "py", "lk", "zw", "mw", "sk"],
+  "progression:5": ["do", "ec", "om", "cg", "bg", "gt", "sn", "lu", "kh", "pa", "hr", "gn", "ga", "lt", "rw", "bj", "az", "bi", "tn", "uy"],
+  "progression:6": ["ht", "rs", "la", "by", "gy", "jo", "cr", "kg", "si", "sr", "tj", "lv", "hn", "bh", "ni", "ee", "sv", "er", "sl", "tg"],
+  "progression:7": ["cy", "lr", "is", "ba", "ge", "tt", "am", "al", "mt", "lb", "jm", "md", "bn", "bt", "gw", "mu", "mk", "ls", "bs", "sb"],
+  "progression:8": ["gm", "gq", "dj", "bz", "mc", "fj", "tl", "li", "sz", "me", "bb", "mv", "km", "vu", "ad", "cv", "ws", "lc", "st", "ki"],
+  "progression:9": ["ag", "dm", "to", "fm", "sm", "sc", "pw", "vc", "gd", "kn", "mh", "tv", "nr"],
+  "pack:world": ["in", "ru", "us", "ca", "cn", "de", "id", "jp", "br", "pk", "au", "ng", "gb", "fr", "ar", "bd", "it", "kz", "dz", "mx"],
+  "pack:africa": ["ng", "dz", "cd", "et", "eg", "sd", "ly", "td", "ne", "tz", "ao", "ml", "za", "ke", "mr", "na", "mz", "ug", "zm", "ma"],
+  "pack:asia": ["in", "cn", "id", "jp", "pk", "bd", "kz", "ph", "sa", "kr", "vn", "ir", "tr", "mn", "th", "il", "mm", "sg", "ae", "iq", "my"],
+  "pack:europe": ["ru", "de", "gb", "fr", "it", "es", "nl", "ch", "pl", "be", "se", "ie", "no", "at", "dk", "ro", "cz", "ua", "fi", "pt"],
+  "pack:northAmerica": ["us", "ca", "mx", "cu", "do", "gt", "pa", "ht", "cr", "hn", "ni", "sv", "tt", "jm", "bs", "bz", "bb", "lc", "ag", "dm", "vc", "gd", "kn"],
+  "pack:oceania": ["au", "nz", "pg", "sb", "fj", "vu", "ws", "ki", "to", "fm", "pw", "mh", "tv", "nr"],
+  "pack:southAmerica": ["br", "ar", "pe", "co", "bo", "ve", "cl", "py", "ec", "uy", "gy", "sr"],
+  "pack:worldFull": ["af", "al", "dz", "ad", "ao", "ag", "ar", "am", "au", "at", "az", "bs", "bh", "bd", "bb", "by", "be", "bz", "bj", "bt", "bo", "ba", "bw", "br", "bn", "bg", "bf", "bi", "cv", "kh", "cm", "ca", "cf", "td", "cl", "cn", "co", "km", "cg", "cr", "ci", "hr", "cu", "cy", "cz", "cd", "dk", "dj", "dm", "do", "ec", "eg", "sv", "gq", "er", "ee", "sz", "et", "fj", "fi", "fr", "ga", "gm", "ge", "de", "gh", "gr", "gd", "gt", "gn", "gw", "gy", "ht", "hn", "hu", "is", "in", "id", "ir", "iq", "ie", "il", "it", "jm", "jp", "jo", "kz", "ke", "ki", "kw", "kg", "la", "lv", "lb", "ls", "lr", "ly", "li", "lt", "lu", "mg", "mw", "my", "mv", "ml", "mt", "mh", "mr", "mu", "mx", "fm", "md", "mc", "mn", "me", "ma", "mz", "mm", "na", "nr", "np", "nl", "nz", "ni", "ne", "ng", "kp", "mk", "no", "om", "pk", "pw", "pa", "pg", "py", "pe", "ph", "pl", "pt", "qa", "ro", "ru", "rw", "kn", "lc", "vc", "ws", "sm", "st", "sa", "sn", "rs", "sc", "sl", "sg", "sk", "si", "sb", "so", "za", "kr", "ss", "es", "lk", "sd", "sr", "se", "ch", "sy", "tj", "tz", "th", "tl", "tg", "to", "tt", "tn", "tr", "tm", "tv", "ug", "ua", "ae", "gb", "us", "uy", "uz", "vu", "ve", "vn", "ye", "zm", "zw"],
+  "pack:europeFull": ["al", "ad", "at", "by", "be", "ba", "bg", "hr", "cy", "cz", "dk", "ee", "fi", "fr", "de", "gr", "hu", "is", "ie", "it", "lv", "li", "lt", "lu", "mt", "md", "mc", "me", "nl", "mk", "no", "pl", "pt", "ro", "ru", "sm", "rs", "sk", "si", "es", "se", "ch", "ua", "gb"],
+  "pack:asiaFull": ["af", "am", "az", "bh", "bd", "bt", "bn", "kh", "cn", "ge", "in", "id", "ir", "iq", "il", "jp", "jo", "kz", "kw", "kg", "la", "lb", "my", "mv", "mn", "mm", "np", "kp", "om", "pk", "ph", "qa", "sa", "sg", "kr", "lk", "sy", "tj", "th", "tl", "tr", "tm", "ae", "uz", "vn", "ye"],
+  "pack:africaFull": ["dz", "ao", "bj", "bw", "bf", "bi", "cv", "cm", "cf", "td", "km", "cg", "ci", "cd", "dj", "eg", "gq", "er", "sz", "et", "ga", "gm", "gh", "gn", "gw", "ke", "ls", "lr", "ly", "mg", "mw", "ml", "mr", "mu", "ma", "mz", "na", "ne", "ng", "rw", "st", "sn", "sc", "sl", "so", "za", "ss", "sd", "tz", "tg", "tn", "ug", "zm", "zw"],
+};
+
+// Audio sprites holding the name clips of each group's countries
+const GROUP_ASSETS = {
+};
 
-// All country name audio files
-const COUNTRY_AUDIO = [
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ad.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ae.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/af.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ag.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/al.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/am.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ao.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ar.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/at.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/au.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/az.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ba.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bb.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bd.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/be.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bf.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bh.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bi.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bj.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bo.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/br.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bs.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bt.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bw.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/by.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/bz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ca.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cd.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cf.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ch.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ci.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cl.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/co.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cu.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cv.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cy.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/cz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/de.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/dj.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/dk.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/dm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/do.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/dz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ec.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ee.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/eg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/er.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/es.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/et.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/fi.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/fj.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/fm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/fr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ga.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gb.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gd.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ge.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gh.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gq.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gt.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gw.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/gy.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/hn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/hr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ht.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/hu.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/id.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ie.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/il.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/in.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/iq.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ir.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/is.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/it.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/jm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/jo.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/jp.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ke.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kh.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ki.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/km.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kp.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kw.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/kz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/la.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lb.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lc.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/li.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lk.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ls.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lt.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lu.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/lv.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ly.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ma.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mc.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/md.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/me.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mh.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mk.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ml.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mt.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mu.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mv.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mw.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mx.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/my.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/mz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/na.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ne.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ng.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ni.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/nl.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/no.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/np.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/nr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/nz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/om.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pa.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pe.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ph.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pk.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pl.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pt.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/pw.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/py.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/qa.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ro.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/rs.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ru.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/rw.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sa.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sb.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sc.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sd.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/se.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/si.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sk.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sl.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/so.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ss.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/st.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sv.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sy.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/sz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/td.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tg.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/th.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tj.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tl.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/to.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tr.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tt.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tv.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/tz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ua.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ug.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/us.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/uy.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/uz.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/vc.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ve.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/vn.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/vu.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ws.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/ye.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/za.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/zm.mp3',
-  './assets/audio/kPzsL2i3teMYv0FxEYQ6/zw.mp3'
+const INSTALL_GROUPS = ["progression:0"];
+
+const WARM_CONCURRENCY = 4;
+
+const groupEntries = (name) => [
+  ...(GROUP_ASSETS[name] || []),
+  ...(ASSET_GROUPS[name] || []).flatMap((code) => COUNTRY_ASSETS[code] || []),
+];
+const INSTALL_MANIFEST = [...CORE_ASSETS, ...INSTALL_GROUPS.flatMap(groupEntries)];
+const PRECACHE_MANIFEST = [
+  ...CORE_ASSETS,
+  ...Object.values(COUNTRY_ASSETS).flat(),
+  ...Object.values(GROUP_ASSETS).flat(),
 ];
 
+const absoluteUrl = (url) => new URL(url, self.registration.scope).href;
+const revision = (entry) => entry.revision || encodeURIComponent(entry.integrity);
+const cacheKey = (entry) => `${absoluteUrl(entry.url)}?__rev=${revision(entry)}`;
+const precacheEntriesByUrl = new Map(PRECACHE_MANIFEST.map((entry) => [absoluteUrl(entry.url), entry]));
+
+// Every size and format of a flag falls back to its precached image offline
+const flagCode = (url) => url.pathname.match(/\/assets\/flags\/(?:\d+\/)?([\w-]+)\.\w+$/)?.[1];
+const precachedFlag = async (url) => {
+  const entry = COUNTRY_ASSETS[flagCode(url)]?.[0];
+  const response = entry && (await caches.open(PRECACHE).then((cache) => cache.match(cacheKey(entry))));
+  return response || Response.error();
+};
+
+// Entries carry the SRI hash of their file: downloads are checked against it
+// by fetch, and a cached copy that no longer matches (a truncated or corrupted
+// write) is dropped and downloaded again when its group is precached or warmed
+const base64Digest = async (response) => {
+  const body = await response.clone().arrayBuffer();
+  const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', body));
+  return btoa(String.fromCharCode(...digest));
+};
+
+const cachedEntry = async (cache, entry) => {
+  const response = await cache.match(cacheKey(entry));
+  if (!response || !entry.integrity) return response;
+  if (`sha256-${await base64Digest(response)}` === entry.integrity) return response;
+  await cache.delete(cacheKey(entry));
+  return undefined;
+};
+
+const fetchEntry = async (cache, entry, options) => {
+  const init = entry.integrity ? { ...options, integrity: entry.integrity } : options;
+  const response = await fetch(entry.url, init);
+  if (!response.ok) throw new Error(`Precache failed for ${entry.url}: ${response.status}`);
+  await cache.put(cacheKey(entry), response.clone());
+  return response;
+};
+
+const precacheEntries = async (cache, entries) => {
+  const missing = [];
+  for (const entry of entries) {
+    if (!(await cachedEntry(cache, entry))) missing.push(entry);
+  }
+  await Promise.all(missing.map((entry) => fetchEntry(cache, entry, { cache: 'reload' })));
+  return missing.length;
+};
+
+// Background warming: a shared queue drained by WARM_CONCURRENCY workers
+const warmQueue = [];
+const warmingKeys = new Set();
+let warming = null;
+
+const drainWarmQueue = async () => {
+  const cache = await caches.open(PRECACHE);
+  const worker = async () => {
+    while (warmQueue.length) {
+      const entry = warmQueue.shift();
+      const key = cacheKey(entry);
+      if (warmingKeys.has(key)) continue;
+      warmingKeys.add(key);
+      // A failed entry is simply retried the next time its group is warmed
+      if (!(await cachedEntry(cache, entry))) await fetchEntry(cache, entry).catch(() => {});
+      warmingKeys.delete(key);
+    }
+  };
+  await Promise.all(Array.from({ length: WARM_CONCURRENCY }, worker));
+};
+
+const warm = (entries, urgent) => {
+  if (urgent) warmQueue.unshift(...entries);
+  else warmQueue.push(...entries);
+  warming = warming || drainWarmQueue().finally(() => { warming = null; });
+  return warming;
+};
+
 self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => {
-      return cache.addAll([...CORE_ASSETS, ...PACK_FLAGS, ...COUNTRY_AUDIO]);
-    })
+    caches.open(PRECACHE).then((cache) => precacheEntries(cache, INSTALL_MANIFEST))
   );
   self.skipWaiting();
 });
 
 self.addEventListener('activate', (event) => {
+  const currentKeys = new Set(PRECACHE_MANIFEST.map(cacheKey));
   event.waitUntil(
-    caches.keys().then((cacheNames) => {
-      return Promise.all(
+    Promise.all([
+      caches.keys().then((cacheNames) => Promise.all(
         cacheNames
-          .filter((name) => name !== CACHE_NAME)
+          .filter((name) => name !== PRECACHE && name !== RUNTIME_CACHE)
           .map((name) => caches.delete(name))
-      );
-    })
+      )),
+      caches.open(PRECACHE).then(async (cache) => {
+        const requests = await cache.keys();
+        await Promise.all(
+          requests
+            .filter((request) => !currentKeys.has(request.url))
+            .map((request) => cache.delete(request))
+        );
+      }),
+    ])
   );
   self.clients.claim();
 });
 
+self.addEventListener('message', (event) => {
+  const { type, groups } = event.data || {};
+  if (type === 'warm') {
+    event.waitUntil(warm((groups || []).flatMap(groupEntries), true));
+  } else if (type === 'warm-idle') {
+    event.waitUntil(warm(Object.keys(ASSET_GROUPS).flatMap(groupEntries), false));
+  }
+});
+
 self.addEventListener('fetch', (event) => {
+  const url = new URL(event.request.url);
+  url.search = '';
+  const entry = precacheEntriesByUrl.get(url.href);
+  if (entry) {
+    // Entries not warmed yet are stored under their revision on first use
+    event.respondWith(
+      caches.open(PRECACHE).then(async (cache) => (
+        (await cache.match(cacheKey(entry))) || fetchEntry(cache, entry).catch(() => fetch(event.request))
+      ))
+    );
+    return;
+  }
+
+  // The dataset index changes whenever data is published; offline, the last copy is used
+  if (url.pathname.endsWith('/data/index.json')) {
+    event.respondWith(
+      fetch(event.request).then((response) => {
+        if (response.ok) {
+          const copy = response.clone();
+          caches.open(RUNTIME_CACHE).then((cache) => cache.put(event.request, copy));
+        }
+        return response;
+      }).catch(() => caches.match(event.request).then((cached) => cached || Response.error()))
+    );
+    return;
+  }
+
   event.respondWith(
     caches.match(event.request).then((cachedResponse) => {
       if (cachedResponse) {
@@ -590,10 +422,13 @@ self.addEventListener('fetch', (event) => {
           return response;
         }
         const responseToCache = response.clone();
-        caches.open(CACHE_NAME).then((cache) => {
+        caches.open(RUNTIME_CACHE).then((cache) => {
           cache.put(event.request, responseToCache);
         });
         return response;
+      }).catch((error) => {
+        if (flagCode(url)) return precachedFlag(url);
+        throw error;
       });
     })
   );
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Report which files in public/assets the game actually references.
+
+References are collected from:
+  - literal "assets/..." paths in index.html, app.js, styles.css and
+    public/manifest.json
+  - app.js AUDIO_SOURCES, with template entries expanded for every
+    country code (country) or possible score (score)
+  - one flag per country code at CONFIG.flagBasePath, plus its variants
+    listed in variants.json when app.js loads it
+  - the audio sprites in AUDIO_BASE_PATH/sprites.json when app.js loads it
+
+Country codes are every code used by a pack in countries.js or a
+challenge in challenges.js. The report lists referenced files that do not
+exist and files nobody references, with their size.
+
+--prune DIR deletes the unreferenced files from a build output that
+mirrors public/ (by default Vite's dist/), leaving a minimal deployable
+asset set. Files in DIR that do not come from public/ are never touched.
+
+Usage:
+    python3 scripts/analyze_assets.py [--all] [--prune [DIR]] [--dry-run]
+"""
+
+import argparse
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+
+from game_data import load_challenges, load_packs
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PUBLIC_DIR = PROJECT_ROOT / "public"
+ASSETS_DIR = PUBLIC_DIR / "assets"
+DEFAULT_PRUNE_DIR = PROJECT_ROOT / "dist"
+
+# Files whose literal "assets/..." paths are references
+PAGE_SOURCES = ["index.html", "app.js", "styles.css", "public/manifest.json"]
+
+_ASSET_PATH = re.compile(r"""(?<![\w$}/])assets/[\w./-]+\.\w+""")
+_CONST_STRING = re.compile(r'const (\w+) = "([^"]*)";')
+_CONST_TEMPLATE = re.compile(r"const (\w+) = `([^`]*)`;")
+_AUDIO_SOURCES = re.compile(r"const AUDIO_SOURCES = \{(.*?)\n\};", re.S)
+_STATIC_SOURCE = re.compile(r'^\s*(\w+): (?:"([^"]+)"|`([^`]+)`),?$', re.M)
+_TEMPLATE_SOURCE = re.compile(r"^\s*(\w+): \((\w+)\) => `([^`]+)`,?$", re.M)
+_FLAG_BASE_PATH = re.compile(r'flagBasePath: "([^"]+)"')
+_QUESTION_COUNTS = re.compile(r'<button class="segment-btn[^"]*" data-value="(\d+)"')
+
+KINDS = [
+    ("flag variant", re.compile(r"^assets/flags/\d+/")),
+    ("flag", re.compile(r"^assets/flags/")),
+    ("voice", re.compile(r"^assets/audio/[^/]+/")),
+    ("sound", re.compile(r"^assets/audio/")),
+    ("image", re.compile(r"^assets/images/")),
+    ("icon", re.compile(r"^assets/icons/")),
+]
+
+
+def kind_of(path):
+    return next((kind for kind, pattern in KINDS if pattern.match(path)), "other")
+
+
+def _expand(template, constants):
+    return re.sub(r"\$\{(\w+)\}", lambda m: constants.get(m.group(1), m.group(0)), template)
+
+
+class AssetGraph:
+    """Referenced asset paths (relative to public/) and who references them."""
+
+    def __init__(self):
+        self.refs = defaultdict(set)
+
+    def add(self, path, referrer):
+        self.refs[path].add(referrer)
+
+    def missing(self):
+        return sorted(p for p in self.refs if not (PUBLIC_DIR / p).is_file())
+
+    def orphans(self):
+        files = (p.relative_to(PUBLIC_DIR).as_posix() for p in ASSETS_DIR.rglob("*") if p.is_file())
+        return sorted(p for p in files if p not in self.refs)
+
+
+def game_codes(packs, challenges):
+    """{code: [first pack or challenge using it, ...]} for every playable code."""
+    codes = defaultdict(list)
+    for pack_id, pack in packs.items():
+        for code in pack["codes"]:
+            codes[code].append(f"pack:{pack_id}")
+    for i, challenge in enumerate(challenges):
+        for code in challenge["codes"]:
+            codes[code].append(f"challenge:{i}")
+    return codes
+
+
+def page_references(graph):
+    for name in PAGE_SOURCES:
+        text = (PROJECT_ROOT / name).read_text(encoding="utf-8")
+        for path in _ASSET_PATH.findall(text):
+            graph.add(path, name)
+
+
+def _constants(app_text):
+    """Top-level string and template constants in app.js, expanded."""
+    constants = dict(_CONST_STRING.findall(app_text))
+    for name, template in _CONST_TEMPLATE.findall(app_text):
+        constants[name] = _expand(template, constants)
+    return constants
+
+
+def audio_references(graph, app_text, codes, max_score):
+    match = _AUDIO_SOURCES.search(app_text)
+    if not match:
+        raise RuntimeError("Unable to find AUDIO_SOURCES in app.js")
+    constants = _constants(app_text)
+
+    body = match.group(1)
+    for key, path, template in _STATIC_SOURCE.findall(body):
+        graph.add(path or _expand(template, constants), f"AUDIO_SOURCES.{key}")
+    values = {"code": sorted(codes), "value": [str(s) for s in range(max_score + 1)]}
+    for key, param, template in _TEMPLATE_SOURCE.findall(body):
+        if param not in values:
+            print(f"Warning: AUDIO_SOURCES.{key} takes '{param}', which this tool cannot expand")
+            continue
+        for value in values[param]:
+            graph.add(_expand(template, {**constants, param: value}), f"AUDIO_SOURCES.{key}")
+
+
+def flag_references(graph, app_text, codes):
+    match = _FLAG_BASE_PATH.search(app_text)
+    if not match:
+        raise RuntimeError("Unable to find CONFIG.flagBasePath in app.js")
+    base = match.group(1)
+    for code in codes:
+        graph.add(f"{base}/{code}.png", "flags")
+
+    manifest_path = PUBLIC_DIR / base / "variants.json"
+    if "variants.json" not in app_text or not manifest_path.exists():
+        return
+
+    graph.add(f"{base}/variants.json", "app.js")
+    variants = json.loads(manifest_path.read_text(encoding="utf-8"))
+    for code in codes:
+        if code not in variants["flags"]:
+            continue
+        for width in variants["widths"]:
+            for fmt in variants["formats"]:
+                graph.add(f"{base}/{width}/{code}.{fmt}", "variants.json")
+
+
+def sprite_references(graph, app_text):
+    base = _constants(app_text).get("AUDIO_BASE_PATH")
+    if not base or "sprites.json" not in app_text or not (PUBLIC_DIR / base / "sprites.json").exists():
+        return
+    graph.add(f"{base}/sprites.json", "app.js")
+    manifest = json.loads((PUBLIC_DIR / base / "sprites.json").read_text(encoding="utf-8"))
+    for sprite in manifest["sprites"].values():
+        graph.add(f"{base}/{sprite['file']}", "sprites.json")
+
+
+def build_graph():
+    with span("asset graph") as s:
+        graph, codes = _build_graph()
+        s.add(items=len(graph.refs))
+    return graph, codes
+
+
+def _build_graph():
+    app_text = (PROJECT_ROOT / "app.js").read_text(encoding="utf-8")
+    index_text = (PROJECT_ROOT / "index.html").read_text(encoding="utf-8")
+    packs = load_packs(PROJECT_ROOT / "countries.js")
+    challenges = load_challenges(PROJECT_ROOT / "challenges.js")
+    codes = game_codes(packs, challenges)
+    # A round can have as many questions as the longest option or challenge
+    max_score = max(
+        [int(n) for n in _QUESTION_COUNTS.findall(index_text)]
+        + [c["questionsShown"] for c in challenges]
+    )
+
+    graph = AssetGraph()
+    page_references(graph)
+    audio_references(graph, app_text, codes, max_score)
+    flag_references(graph, app_text, codes)
+    sprite_references(graph, app_text)
+    return graph, codes
+
+
+def size(path):
+    return (PUBLIC_DIR / path).stat().st_size
+
+
+def print_report(graph, codes, show_all=False, limit=15):
+    present = [p for p in graph.refs if (PUBLIC_DIR / p).is_file()]
+    missing = graph.missing()
+    orphans = graph.orphans()
+
+    totals = defaultdict(lambda: [0, 0, 0, 0])
+    for path in present:
+        totals[kind_of(path)][0] += 1
+        totals[kind_of(path)][1] += size(path)
+    for path in orphans:
+        totals[kind_of(path)][2] += 1
+        totals[kind_of(path)][3] += size(path)
+
+    print(f"{len(codes)} country codes, {len(graph.refs)} referenced assets")
+    print(f"\n  {'kind':<14} {'used':>6} {'bytes':>12} {'orphan':>7} {'bytes':>12}")
+    for kind in [k for k, _ in KINDS] + ["other"]:
+        if kind in totals:
+            used, used_bytes, orphan, orphan_bytes = totals[kind]
+            print(f"  {kind:<14} {used:>6} {used_bytes:>12,} {orphan:>7} {orphan_bytes:>12,}")
+    used_total = sum(t[1] for t in totals.values())
+    orphan_total = sum(t[3] for t in totals.values())
+    print(f"  {'total':<14} {len(present):>6} {used_total:>12,} {len(orphans):>7} {orphan_total:>12,}")
+
+    print(f"\n--- Missing ({len(missing)}) ---")
+    for path in missing if show_all else missing[:limit]:
+        referrers = sorted(graph.refs[path])
+        code = Path(path).stem
+        used_by = f" ({', '.join(codes[code][:2])})" if code in codes else ""
+        print(f"  {path}  <- {', '.join(referrers)}{used_by}")
+    if not show_all and len(missing) > limit:
+        print(f"  ... {len(missing) - limit} more (--all to list)")
+
+    print(f"\n--- Orphaned ({len(orphans)}, {orphan_total:,} bytes) ---")
+    largest = sorted(orphans, key=size, reverse=True)
+    for path in largest if show_all else largest[:limit]:
+        print(f"  {size(path):>10,}  {path}")
+    if not show_all and len(orphans) > limit:
+        print(f"  ... {len(orphans) - limit} more (--all to list)")
+
+
+def prune(graph, out_dir, dry_run=False):
+    """Delete unreferenced public assets from a build output directory."""
+    removed = 0
+    freed = 0
+    for path in graph.orphans():
+        target = out_dir / path
+        if not target.is_file():
+            continue
+        freed += target.stat().st_size
+        removed += 1
+        if not dry_run:
+            target.unlink()
+    verb = "Would remove" if dry_run else "Removed"
+    print(f"\n{verb} {removed} files ({freed:,} bytes) from {out_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report missing and unreferenced assets")
+    parser.add_argument("--all", action="store_true",
+                        help="List every missing and orphaned file")
+    parser.add_argument("--prune", nargs="?", const=DEFAULT_PRUNE_DIR, type=Path, metavar="DIR",
+                        help="Delete unreferenced assets from a build output (default: dist)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="With --prune, only report what would be removed")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    graph, codes = build_graph()
+    print_report(graph, codes, args.all)
+
+    if args.prune:
+        out_dir = args.prune.resolve()
+        if out_dir == PUBLIC_DIR.resolve():
+            raise SystemExit("Refusing to prune public/ itself; prune a build output instead")
+        if not out_dir.is_dir():
+            raise SystemExit(f"{out_dir} does not exist; run `npm run build` first")
+        with span("prune"):
+            prune(graph, out_dir, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
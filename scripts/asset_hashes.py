@@ -0,0 +1,75 @@
+"""
+Content hashes for build assets, cached by file mtime and size.
+
+HashIndex remembers the SHA-256 of every file it has hashed together with
+the file's mtime and size, in .asset_hashes.json at the project root.
+Regenerating build outputs then only rehashes files that actually changed
+on disk. Several build scripts may share the index at once (build.py runs
+them in parallel), so saving merges into whatever is on disk by then.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from tracing import span
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_INDEX = PROJECT_ROOT / ".asset_hashes.json"
+
+
+def sha256_file(path, chunk_size=1 << 16):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class HashIndex:
+    def __init__(self, path=DEFAULT_INDEX):
+        self.path = Path(path)
+        self.entries = {}
+        if self.path.exists():
+            self.entries = json.loads(self.path.read_text(encoding="utf-8"))
+        self.lock = threading.Lock()
+        self.hashed = 0
+        self.updated = set()
+
+    def _key(self, path):
+        return os.path.relpath(Path(path).resolve(), PROJECT_ROOT)
+
+    def hash(self, path):
+        """SHA-256 hex digest of path, reusing the cached value if mtime and size match."""
+        stat = os.stat(path)
+        key = self._key(path)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["sha256"]
+        with span("hash file", bytes=stat.st_size, items=1):
+            digest = sha256_file(path)
+        with self.lock:
+            self.entries[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+            self.hashed += 1
+            self.updated.add(key)
+        return digest
+
+    def integrity(self, path):
+        """Subresource Integrity value ("sha256-<base64>") of path."""
+        return "sha256-" + base64.b64encode(bytes.fromhex(self.hash(path))).decode()
+
+    def save(self):
+        if not self.updated:
+            return
+        with self.lock:
+            entries = json.loads(self.path.read_text(encoding="utf-8")) if self.path.exists() else {}
+            entries.update({key: self.entries[key] for key in self.updated})
+            data = json.dumps(entries, indent=1, sort_keys=True)
+            self.updated = set()
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.part")
+        tmp.write_text(data, encoding="utf-8")
+        tmp.replace(self.path)
@@ -0,0 +1,38 @@
+"""
+Audio generation pipeline shared by generate_audio.py and generate_missing_audio.py.
+"""
+
+from .cache import AudioCache, request_key, write_atomic
+from .journal import JobJournal
+from .mp3 import mp3_duration
+from .postprocess import (
+    PROCESSED,
+    UNCHANGED,
+    AudioProcessor,
+    ProcessedStore,
+    ProcessResult,
+    print_report,
+    process_files,
+)
+from .pipeline import (
+    CACHED,
+    SKIPPED,
+    SYNTHESIZED,
+    AudioJob,
+    plan,
+    post_process,
+    resolve_names,
+    run,
+    source_codes,
+    synthesize,
+    write,
+)
+from .sprites import GAP_FRAMES, pack_sprite
+from .sources import (
+    build_phrase_list,
+    extract_pack_codes,
+    fetch_country_names,
+    load_env,
+    load_settings,
+)
+from .tts import DEFAULT_API_BASE, TokenBucket, TTSClient
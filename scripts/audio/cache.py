@@ -0,0 +1,118 @@
+"""
+Content-addressed cache for synthesized audio.
+
+Every TTS request is keyed by a hash of its full payload (text, voice_id,
+model_id, voice_settings). Produced MP3s are stored once under
+objects/<key[:2]>/<key>.mp3 and hard-linked (or copied) to their output
+paths, and index.json records which key each output file was built from.
+A rerun only calls the API for outputs whose inputs changed, and identical
+texts under different filenames are synthesized once.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+def request_key(voice_id, payload):
+    """Stable hash of everything that influences the synthesized audio."""
+    canonical = json.dumps({"voice_id": voice_id, **payload}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def write_atomic(path, data):
+    """Write bytes via a temp file so readers never see a truncated file."""
+    tmp_path = path.with_name(path.name + ".part")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+class AudioCache:
+    def __init__(self, cache_dir, root, adopt_existing=None):
+        self.cache_dir = Path(cache_dir)
+        self.root = Path(root).resolve()
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_path = self.cache_dir / "index.json"
+        self.index = {}
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        # By default only a missing index (a fresh checkout) adopts existing
+        # outputs, so the first run does not synthesize the committed clips again
+        self.adopt_existing = not self.index_path.exists() if adopt_existing is None else adopt_existing
+        self.lock = threading.Lock()
+        self.key_locks = {}
+        self.refreshed = set()
+        self.hits = 0
+        self.misses = 0
+        self.adopted = 0
+
+    def _rel(self, out_path):
+        return os.path.relpath(Path(out_path).resolve(), self.root)
+
+    def object_path(self, key):
+        return self.objects_dir / key[:2] / f"{key}.mp3"
+
+    def lock_for(self, key):
+        """Per-key lock so concurrent requests for the same payload synthesize once."""
+        with self.lock:
+            return self.key_locks.setdefault(key, threading.Lock())
+
+    def has(self, key):
+        return self.object_path(key).exists()
+
+    def is_current(self, out_path, key):
+        """True if out_path exists and the index records it as built from `key`.
+
+        Output files the index does not know are misses: their content is
+        unverified. With adopt_existing (the default when there is no index
+        yet) they are recorded under `key` instead, but never copied into
+        objects/, so they cannot be linked to other outputs.
+        """
+        out_path = Path(out_path)
+        if not out_path.exists():
+            return False
+        rel = self._rel(out_path)
+        with self.lock:
+            recorded = self.index.get(rel)
+            if recorded is None and self.adopt_existing:
+                self.index[rel] = key
+                self.adopted += 1
+                return True
+        return recorded == key
+
+    def store(self, key, audio):
+        obj = self.object_path(key)
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(obj, audio)
+        with self.lock:
+            self.refreshed.add(key)
+            self.misses += 1
+
+    def link(self, key, out_path, hit=False):
+        """Materialize cached object `key` at out_path and record it in the index."""
+        out_path = Path(out_path)
+        tmp_path = out_path.with_name(out_path.name + ".part")
+        tmp_path.unlink(missing_ok=True)
+        self._place(self.object_path(key), tmp_path)
+        tmp_path.replace(out_path)
+        with self.lock:
+            self.index[self._rel(out_path)] = key
+            if hit:
+                self.hits += 1
+
+    @staticmethod
+    def _place(src, dst):
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    def save(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            data = json.dumps(self.index, indent=2, sort_keys=True)
+        write_atomic(self.index_path, data.encode("utf-8"))
@@ -0,0 +1,105 @@
+"""
+Append-only JSONL journal for long batch jobs.
+
+Each line records one state transition for an item:
+    {"item": "kw", "state": "done", "ts": 1718000000.0, "latency": 1.42}
+
+States are pending, in-flight, done and failed (with an "error" field).
+Replaying the file gives the last known state of every item, so an
+interrupted run can be resumed without repeating finished work. Items left
+in-flight by a crash are treated as pending on resume.
+"""
+
+import json
+import statistics
+import threading
+import time
+
+PENDING = "pending"
+IN_FLIGHT = "in-flight"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobJournal:
+    def __init__(self, path, fresh=False):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.states = {}
+        if fresh:
+            self.path.write_text("", encoding="utf-8")
+        elif self.path.exists():
+            self._replay()
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.started = {}
+        self.lock = threading.Lock()
+
+    def _replay(self):
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn final line from a crash
+            self.states[record["item"]] = record
+
+    def _write(self, item, state, **fields):
+        record = {"item": item, "state": state, "ts": round(time.time(), 3), **fields}
+        with self.lock:
+            self.file.write(json.dumps(record) + "\n")
+            self.file.flush()
+            self.states[item] = record
+        return record
+
+    def state(self, item):
+        record = self.states.get(item)
+        return record["state"] if record else None
+
+    def select(self, items, resume=False, retry_failed=False):
+        """Filter items to the ones this run should process."""
+        if retry_failed:
+            return [i for i in items if self.state(i) == FAILED]
+        if resume:
+            return [i for i in items if self.state(i) != DONE]
+        return list(items)
+
+    def pending(self, items):
+        for item in items:
+            self._write(item, PENDING)
+
+    def start(self, item):
+        with self.lock:
+            self.started[item] = time.perf_counter()
+        self._write(item, IN_FLIGHT)
+
+    def _latency(self, item):
+        with self.lock:
+            started = self.started.pop(item, None)
+        return round(time.perf_counter() - started, 3) if started is not None else None
+
+    def done(self, item, **fields):
+        return self._write(item, DONE, latency=self._latency(item), **fields)
+
+    def fail(self, item, error):
+        return self._write(item, FAILED, latency=self._latency(item), error=str(error))
+
+    def close(self):
+        self.file.close()
+
+    def summary(self, items):
+        """Print per-state counts, latency statistics and failed items."""
+        records = [self.states[i] for i in items if i in self.states]
+        counts = {}
+        for record in records:
+            counts[record["state"]] = counts.get(record["state"], 0) + 1
+        print("\n--- Job summary ---")
+        for state in (DONE, FAILED, IN_FLIGHT, PENDING):
+            print(f"  {state:<10} {counts.get(state, 0)}")
+        latencies = [r["latency"] for r in records if r.get("latency") is not None]
+        if latencies:
+            print(
+                f"  latency    mean {statistics.mean(latencies):.2f}s, "
+                f"median {statistics.median(latencies):.2f}s, max {max(latencies):.2f}s"
+            )
+        for record in records:
+            if record["state"] == FAILED:
+                print(f"  failed {record['item']}: {record['error']}")
@@ -0,0 +1,102 @@
+"""
+Minimal MPEG audio layer III frame parsing: enough to measure durations and
+to splice clips together frame by frame without decoding them.
+"""
+
+from dataclasses import dataclass
+
+# Samples every layer III decoder outputs before the first real sample
+DECODER_DELAY = 529
+
+# Bitrates (kbps) for layer III by [MPEG-1?][index], sample rates by version bits
+_BITRATES = {
+    True: [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320],
+    False: [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160],
+}
+_SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+
+
+@dataclass
+class Frame:
+    offset: int
+    size: int
+    header: int
+    samples: int
+    sample_rate: int
+
+    @property
+    def mono(self):
+        return self.header >> 6 & 3 == 3
+
+    @property
+    def format(self):
+        """(sample rate, mono) - clips can only be spliced if these match."""
+        return self.sample_rate, self.mono
+
+
+def _parse_header(header):
+    version = header >> 19 & 3
+    rate_index = header >> 10 & 3
+    bitrate_index = header >> 12 & 15
+    if (header >> 21) != 0x7FF or (header >> 17 & 3) != 1 or version == 1 \
+            or rate_index == 3 or bitrate_index in (0, 15):
+        return None
+    mpeg1 = version == 3
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    samples = 1152 if mpeg1 else 576
+    size = samples // 8 * _BITRATES[mpeg1][bitrate_index] * 1000 // sample_rate + (header >> 9 & 1)
+    return samples, sample_rate, size
+
+
+def frames(data):
+    """Yield the audio frames in data, skipping an ID3v2 tag and any junk between frames."""
+    pos = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        pos = 10 + (data[6] << 21 | data[7] << 14 | data[8] << 7 | data[9])
+    while pos + 4 <= len(data):
+        header = int.from_bytes(data[pos:pos + 4], "big")
+        parsed = _parse_header(header)
+        if parsed is None:
+            pos += 1
+            continue
+        samples, sample_rate, size = parsed
+        yield Frame(pos, size, header, samples, sample_rate)
+        pos += size
+
+
+def is_info_frame(data, frame):
+    """True for a Xing/Info/VBRI header frame, which describes the file, not audio."""
+    body = data[frame.offset + 4:frame.offset + min(frame.size, 64)]
+    return any(tag in body for tag in (b"Xing", b"Info", b"VBRI"))
+
+
+def gapless_info(data, frame):
+    """
+    (encoder delay, padding) in samples from the LAME extension of an Info
+    frame (also written by ffmpeg, as "Lavf"/"Lavc"), or None. Decoders that honour the tag skip these samples; a spliced
+    stream carries no tag, so its user has to skip them instead.
+    """
+    body = data[frame.offset:frame.offset + frame.size]
+    tag = max(body.find(b"Xing"), body.find(b"Info"))
+    if tag < 0:
+        return None
+    flags = int.from_bytes(body[tag + 4:tag + 8], "big")
+    lame = tag + 8 + 4 * bool(flags & 1) + 4 * bool(flags & 2) + 100 * bool(flags & 4) + 4 * bool(flags & 8)
+    if len(body) < lame + 24 or not body[lame:lame + 4].isalpha():
+        return None
+    packed = int.from_bytes(body[lame + 21:lame + 24], "big")
+    return packed >> 12, packed & 0xFFF
+
+
+def mp3_duration(data):
+    """Duration in seconds of an MP3 byte string, by walking its frames."""
+    return sum(f.samples / f.sample_rate for f in frames(data) if not is_info_frame(data, f))
+
+
+def silent_frame(like):
+    """A frame of silence in the same format as `like`: zeroed side info and data."""
+    header = like.header | 1 << 16          # no CRC
+    header &= ~(1 << 9)                     # no padding byte
+    header = header & ~(15 << 12) | 1 << 12  # lowest bitrate: silence needs no data
+    _, _, size = _parse_header(header)
+    return header.to_bytes(4, "big") + b"\x00" * (size - 4)
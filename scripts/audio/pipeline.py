@@ -0,0 +1,164 @@
+"""
+Streaming audio generation pipeline.
+
+Each stage is a generator that consumes and yields AudioJob objects, so a
+full run never holds the whole plan in memory and stages can be swapped or
+parallelized independently:
+
+    source_codes -> resolve_names -> plan -> synthesize -> post_process -> write
+
+Silence trimming and loudness normalization (postprocess.py) run on the
+written files afterwards rather than as a post_process processor, because
+cached audio is hard-linked into place instead of rewritten.
+
+Failures do not stop the stream: a failing job carries its exception in
+`error` and is passed through to the end, where the caller reports it.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from tracing import span
+
+from .cache import request_key, write_atomic
+
+# Job statuses after the synthesize stage
+SKIPPED = "skipped"          # output already up to date
+CACHED = "cached"            # served from the audio cache, no API call
+SYNTHESIZED = "synthesized"  # fetched from the TTS API
+
+
+@dataclass
+class AudioJob:
+    name: str
+    text: str
+    out_path: object
+    payload: dict = field(default_factory=dict)
+    key: str = None
+    status: str = None
+    audio: bytes = None
+    error: Exception = None
+    latency: float = None
+
+
+def source_codes(codes):
+    """Yield normalized country codes."""
+    for code in codes:
+        code = code.strip().lower()
+        if code:
+            yield code
+
+
+def resolve_names(codes, country_names, on_missing=None):
+    """Yield (code, name) pairs, reporting codes with no known name to on_missing."""
+    for code in codes:
+        name = country_names.get(code)
+        if not name:
+            if on_missing:
+                on_missing(code)
+            continue
+        yield code, name
+
+
+def plan(items, audio_dir, client, cache=None):
+    """Turn (code or filename, text) pairs into AudioJobs with their request payload."""
+    for name, text in items:
+        filename = name if name.endswith(".mp3") else f"{name}.mp3"
+        payload = client.payload(text)
+        key = request_key(client.voice_id, payload) if cache else None
+        yield AudioJob(name=name, text=text, out_path=audio_dir / filename, payload=payload, key=key)
+
+
+def _synthesize_one(job, client, cache, force, journal):
+    started = time.perf_counter()
+    if journal:
+        journal.start(job.name)
+    try:
+        if cache is None:
+            if job.out_path.exists() and not force:
+                job.status = SKIPPED
+            else:
+                job.audio = client.fetch(job.payload)
+                job.status = SYNTHESIZED
+        else:
+            with cache.lock_for(job.key):
+                if not force and cache.is_current(job.out_path, job.key):
+                    job.status = SKIPPED
+                elif cache.has(job.key) and (not force or job.key in cache.refreshed):
+                    job.status = CACHED
+                else:
+                    cache.store(job.key, client.fetch(job.payload))
+                    job.status = SYNTHESIZED
+    except Exception as e:
+        job.error = e
+    job.latency = time.perf_counter() - started
+    return job
+
+
+def synthesize(jobs, client, cache=None, force=False, concurrency=4, journal=None):
+    """
+    Synthesize jobs on a bounded thread pool, yielding each as it completes.
+
+    At most 2 * concurrency jobs are pulled from upstream ahead of the
+    workers. With a cache, concurrent jobs sharing a payload are serialized
+    on a per-key lock so identical texts are only requested once.
+    """
+    concurrency = max(1, concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        inflight = set()
+        for job in jobs:
+            inflight.add(pool.submit(_synthesize_one, job, client, cache, force, journal))
+            if len(inflight) >= 2 * concurrency:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while inflight:
+            done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def post_process(jobs, *processors):
+    """Apply processor(job) callables to every successfully synthesized job."""
+    for job in jobs:
+        if job.error is None and job.status in (CACHED, SYNTHESIZED):
+            for processor in processors:
+                try:
+                    processor(job)
+                except Exception as e:
+                    job.error = e
+                    break
+        yield job
+
+
+def write(jobs, cache=None, journal=None):
+    """Materialize job audio at its output path and record the outcome."""
+    for job in jobs:
+        if job.error is None and job.status in (CACHED, SYNTHESIZED):
+            try:
+                with span("write audio", items=1) as s:
+                    if cache:
+                        cache.link(job.key, job.out_path, hit=job.status == CACHED)
+                    else:
+                        write_atomic(job.out_path, job.audio)
+                    # Cache hits carry no audio in memory, so count what landed on disk
+                    s.add(bytes=job.out_path.stat().st_size)
+            except OSError as e:
+                job.error = e
+        job.audio = None
+        if journal:
+            if job.error is None:
+                journal.done(job.name, status=job.status)
+            else:
+                journal.fail(job.name, job.error)
+        yield job
+
+
+def run(items, audio_dir, client, cache=None, force=False, concurrency=4, journal=None,
+        processors=()):
+    """Compose plan -> synthesize -> post_process -> write over (name, text) items."""
+    jobs = plan(items, audio_dir, client, cache)
+    jobs = synthesize(jobs, client, cache, force, concurrency, journal)
+    jobs = post_process(jobs, *processors)
+    return write(jobs, cache, journal)
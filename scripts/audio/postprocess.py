@@ -0,0 +1,187 @@
+"""
+Offline post-processing for generated MP3s: trim leading and trailing
+silence, normalize loudness and re-encode as mono at a target bitrate.
+
+The work is done by ffmpeg, one subprocess per file, so a thread pool is
+enough to keep every core busy. ProcessedStore remembers, per output file,
+the hash of the file it wrote and the settings used, so an unchanged file
+is skipped without invoking ffmpeg. The untouched TTS output is kept under
+sources/ in the store directory; changing the settings re-encodes from
+that original rather than from an already processed file.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .cache import write_atomic
+from .mp3 import mp3_duration
+
+# Result statuses
+PROCESSED = "processed"
+UNCHANGED = "unchanged"
+
+
+@dataclass
+class ProcessResult:
+    path: Path
+    status: str = None
+    bytes_before: int = 0
+    bytes_after: int = 0
+    seconds_before: float = 0.0
+    seconds_after: float = 0.0
+    error: Exception = None
+
+
+class AudioProcessor:
+    """ffmpeg filter chain for one output format; `key` identifies the settings."""
+
+    def __init__(self, ffmpeg="ffmpeg", bitrate="48k", sample_rate=24000, loudness=-16.0,
+                 true_peak=-1.5, silence_db=-45, silence_pad=0.05):
+        self.ffmpeg = shutil.which(ffmpeg) or ffmpeg
+        self.settings = {
+            "bitrate": bitrate,
+            "sample_rate": sample_rate,
+            "loudness": loudness,
+            "true_peak": true_peak,
+            "silence_db": silence_db,
+            "silence_pad": silence_pad,
+        }
+        canonical = json.dumps(self.settings, sort_keys=True)
+        self.key = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+    def check(self):
+        if not (os.path.isfile(self.ffmpeg) and os.access(self.ffmpeg, os.X_OK)):
+            raise SystemExit(f"ffmpeg not found ({self.ffmpeg}); install it or pass --ffmpeg PATH")
+
+    def filters(self):
+        s = self.settings
+        # Trimming the start of the reversed clip trims the original's tail
+        trim = (f"silenceremove=start_periods=1:start_threshold={s['silence_db']}dB"
+                f":start_silence={s['silence_pad']}")
+        loudnorm = f"loudnorm=I={s['loudness']}:TP={s['true_peak']}:LRA=11"
+        return ",".join([trim, "areverse", trim, "areverse", loudnorm])
+
+    def process(self, data):
+        """Return the processed MP3 for the MP3 bytes in `data`."""
+        command = [
+            self.ffmpeg, "-hide_banner", "-loglevel", "error",
+            "-f", "mp3", "-i", "pipe:0",
+            "-af", self.filters(),
+            "-ac", "1", "-ar", str(self.settings["sample_rate"]),
+            "-c:a", "libmp3lame", "-b:a", self.settings["bitrate"],
+            "-map_metadata", "-1", "-f", "mp3", "pipe:1",
+        ]
+        result = subprocess.run(command, input=data, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='replace').strip()}")
+        return result.stdout
+
+
+class ProcessedStore:
+    """Tracks processed outputs in <store_dir>/processed.json and keeps their originals."""
+
+    def __init__(self, store_dir, root):
+        self.store_dir = Path(store_dir)
+        self.root = Path(root).resolve()
+        self.sources_dir = self.store_dir / "sources"
+        self.index_path = self.store_dir / "processed.json"
+        self.index = {}
+        if self.index_path.exists():
+            self.index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        self.lock = threading.Lock()
+
+    def _rel(self, path):
+        return os.path.relpath(Path(path).resolve(), self.root)
+
+    def source_path(self, digest):
+        return self.sources_dir / digest[:2] / f"{digest}.mp3"
+
+    def process(self, path, processor, force=False):
+        """Process one file in place unless it is already the output for these settings."""
+        path = Path(path)
+        result = ProcessResult(path)
+        try:
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            rel = self._rel(path)
+            with self.lock:
+                entry = self.index.get(rel)
+
+            if entry and entry["output"] == digest:
+                if entry["settings"] == processor.key and not force:
+                    result.status = UNCHANGED
+                    result.bytes_before = result.bytes_after = len(data)
+                    result.seconds_before = result.seconds_after = mp3_duration(data)
+                    return result
+                # Same file we wrote earlier: re-encode from its original
+                source_digest = entry["source"]
+                data = self.source_path(source_digest).read_bytes()
+            else:
+                source_digest = digest
+                source = self.source_path(digest)
+                if not source.exists():
+                    source.parent.mkdir(parents=True, exist_ok=True)
+                    write_atomic(source, data)
+
+            processed = processor.process(data)
+            if not mp3_duration(processed):
+                raise RuntimeError("nothing left after trimming silence")
+            # Never write through the path: it may be a hard link into the audio cache
+            write_atomic(path, processed)
+            with self.lock:
+                self.index[rel] = {
+                    "source": source_digest,
+                    "output": hashlib.sha256(processed).hexdigest(),
+                    "settings": processor.key,
+                }
+            result.status = PROCESSED
+            result.bytes_before, result.bytes_after = len(data), len(processed)
+            result.seconds_before, result.seconds_after = mp3_duration(data), mp3_duration(processed)
+        except Exception as e:
+            result.error = e
+        return result
+
+    def save(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            data = json.dumps(self.index, indent=2, sort_keys=True)
+        write_atomic(self.index_path, data.encode("utf-8"))
+
+
+def process_files(paths, processor, store, workers=None, force=False):
+    """Process files in parallel (one ffmpeg per worker), yielding results in order."""
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(lambda path: store.process(path, processor, force), paths)
+
+
+def print_report(results, verbose=True):
+    """Per-file and total duration and size, before and after."""
+    totals = [0, 0, 0.0, 0.0]
+    processed = unchanged = failed = 0
+    for r in results:
+        if r.error:
+            failed += 1
+            print(f"  {r.path.name}: Error: {r.error}")
+            continue
+        if r.status == UNCHANGED:
+            unchanged += 1
+            continue
+        processed += 1
+        if verbose:
+            print(f"  {r.path.name:<20} {r.seconds_before:6.2f}s -> {r.seconds_after:6.2f}s"
+                  f"  {r.bytes_before:>8,} -> {r.bytes_after:>8,} bytes")
+        totals[0] += r.bytes_before
+        totals[1] += r.bytes_after
+        totals[2] += r.seconds_before
+        totals[3] += r.seconds_after
+    print(f"Processed: {processed}, unchanged: {unchanged}, failed: {failed}")
+    if processed:
+        print(f"Total: {totals[2]:.1f}s -> {totals[3]:.1f}s, {totals[0]:,} -> {totals[1]:,} bytes")
@@ -0,0 +1,69 @@
+"""
+Inputs for the audio pipeline: credentials, country codes, names and phrases.
+"""
+
+import os
+import re
+
+from http_cache import FLAGCDN_CODES_URL, HTTPCache
+from tracing import span
+
+from .tts import DEFAULT_API_BASE, DEFAULT_MODEL_ID
+
+
+def load_env(env_path):
+    env = {}
+    if not env_path.exists():
+        return env
+    for line in env_path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        env[key.strip()] = value.strip().strip('"').strip("'")
+    return env
+
+
+def load_settings(root, api_base=None):
+    """Read API key, model ID and API base from .env or the environment."""
+    env = load_env(root / ".env")
+    api_key = env.get("ELEVEN_LABS_API") or os.getenv("ELEVEN_LABS_API")
+    if not api_key:
+        raise SystemExit("Missing ELEVEN_LABS_API in .env or environment.")
+    model_id = env.get("ELEVEN_LABS_MODEL_ID") or os.getenv("ELEVEN_LABS_MODEL_ID", DEFAULT_MODEL_ID)
+    api_base = (
+        api_base
+        or env.get("ELEVEN_LABS_API_BASE")
+        or os.getenv("ELEVEN_LABS_API_BASE", DEFAULT_API_BASE)
+    )
+    return api_key, model_id, api_base
+
+
+def extract_pack_codes(countries_js_path):
+    text = countries_js_path.read_text(encoding="utf-8")
+    match = re.search(r"const packs = \{(.*?)\};", text, re.S)
+    if not match:
+        raise RuntimeError("Unable to find packs in countries.js")
+    codes = set(re.findall(r'"([a-z]{2})"', match.group(1)))
+    return sorted(codes)
+
+
+def fetch_country_names(http_cache=None):
+    http_cache = http_cache or HTTPCache()
+    with span("fetch country names"):
+        return http_cache.get_json(FLAGCDN_CODES_URL)
+
+
+def build_phrase_list():
+    phrases = [
+        ("question.mp3", "What country is this?"),
+        ("correct.mp3", "That is correct, Savva!"),
+        ("correct_alt1.mp3", "Good job, Savva!"),
+        ("correct_alt2.mp3", "Well done, Savva!"),
+        ("incorrect.mp3", "Not quite right..."),
+        ("congrats.mp3", "Congratulations, Savva!"),
+        ("try_again.mp3", "Good luck next time!"),
+    ]
+    for score in range(0, 11):
+        phrases.append((f"score_{score}.mp3", f"Your score is {score}."))
+    return phrases
@@ -0,0 +1,70 @@
+"""
+Audio sprites: several short clips spliced into one MP3 with an offset map.
+
+Clips are joined frame by frame, without re-encoding. ID3 tags and
+Xing/Info header frames are dropped, and a few silent frames separate
+consecutive clips so that decoder delay and seek imprecision never bleed
+one clip into the next. All clips in a sprite must share a sample rate and
+channel mode; run process_audio.py first to bring mixed files in line.
+"""
+
+from .mp3 import DECODER_DELAY, frames, gapless_info, is_info_frame, silent_frame
+
+# Silence between clips, in frames (about 100 ms at 44.1 kHz)
+GAP_FRAMES = 4
+
+
+def audio_frames(data):
+    """
+    The audio frames of one clip as (frame, bytes) pairs, plus the encoder
+    delay and padding (in samples) its Info frame declares.
+    """
+    clip = []
+    delay = padding = 0
+    for f in frames(data):
+        if is_info_frame(data, f):
+            delay, padding = gapless_info(data, f) or (0, 0)
+        else:
+            clip.append((f, data[f.offset:f.offset + f.size]))
+    return clip, delay, padding
+
+
+def pack_sprite(clips, gap_frames=GAP_FRAMES):
+    """
+    Join (name, mp3 bytes) clips into one MP3.
+    Returns (sprite bytes, {name: [start seconds, duration seconds]}), where
+    the offsets locate each clip's audible samples in the decoded sprite.
+    """
+    parts = []
+    offsets = {}
+    position = 0.0
+    sprite_format = None
+    gap = b""
+    for name, data in clips:
+        clip, delay, padding = audio_frames(data)
+        if not clip:
+            raise ValueError(f"{name}: no MP3 audio frames found")
+        clip_format = clip[0][0].format
+        if sprite_format is None:
+            sprite_format = clip_format
+            gap = silent_frame(clip[0][0]) * gap_frames
+            gap_seconds = gap_frames * clip[0][0].samples / clip[0][0].sample_rate
+        elif clip_format != sprite_format:
+            raise ValueError(
+                f"{name}: {clip_format[0]} Hz {'mono' if clip_format[1] else 'stereo'} does not match "
+                f"the sprite's {sprite_format[0]} Hz {'mono' if sprite_format[1] else 'stereo'}"
+            )
+        if parts:
+            parts.append(gap)
+            position += gap_seconds
+        duration = sum(f.samples / f.sample_rate for f, _ in clip)
+        # The decoded sprite runs DECODER_DELAY samples late, and each clip's
+        # own encoder delay and padding surround its audible part
+        rate = clip[0][0].sample_rate
+        offsets[name] = [
+            round(position + (DECODER_DELAY + delay) / rate, 4),
+            round(duration - (delay + padding) / rate, 4),
+        ]
+        parts.extend(chunk for _, chunk in clip)
+        position += duration
+    return b"".join(parts), offsets
@@ -0,0 +1,103 @@
+"""
+ElevenLabs text-to-speech client with rate limiting and retries.
+"""
+
+import json
+import random
+import threading
+import time
+from urllib import error, request
+
+from tracing import span
+
+DEFAULT_API_BASE = "https://api.elevenlabs.io"
+DEFAULT_MODEL_ID = "eleven_multilingual_v2"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+VOICE_SETTINGS = {"stability": 0.35, "similarity_boost": 0.8}
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+def retry_delay(attempt, exc, base_delay):
+    """Exponential backoff with jitter, honouring Retry-After when the server sends one."""
+    retry_after = exc.headers.get("Retry-After") if exc.headers else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return base_delay * (2 ** attempt) * (0.5 + random.random())
+
+
+class TTSClient:
+    """Issues TTS requests for one voice, sharing a rate limiter across threads."""
+
+    def __init__(
+        self,
+        api_key,
+        voice_id,
+        model_id=DEFAULT_MODEL_ID,
+        api_base=DEFAULT_API_BASE,
+        rate=2.0,
+        max_retries=5,
+        base_delay=1.0,
+        voice_settings=None,
+    ):
+        self.api_key = api_key
+        self.voice_id = voice_id
+        self.model_id = model_id
+        self.api_base = api_base.rstrip("/")
+        self.limiter = TokenBucket(rate)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.voice_settings = voice_settings or VOICE_SETTINGS
+
+    def payload(self, text):
+        return {
+            "text": text,
+            "model_id": self.model_id,
+            "voice_settings": self.voice_settings,
+        }
+
+    def fetch(self, payload):
+        url = f"{self.api_base}/v1/text-to-speech/{self.voice_id}"
+        data = json.dumps(payload).encode("utf-8")
+        req = request.Request(url, data=data, method="POST")
+        req.add_header("Accept", "audio/mpeg")
+        req.add_header("Content-Type", "application/json")
+        req.add_header("xi-api-key", self.api_key)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                with span("tts request", attempt=attempt) as s:
+                    with request.urlopen(req, timeout=60) as response:
+                        audio = response.read()
+                    s.add(bytes=len(audio), items=1)
+                    return audio
+            except error.HTTPError as e:
+                if e.code not in RETRY_STATUSES or attempt == self.max_retries:
+                    raise
+                time.sleep(retry_delay(attempt, e, self.base_delay))
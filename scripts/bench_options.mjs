@@ -0,0 +1,83 @@
+#!/usr/bin/env node
+// Benchmark multiple-choice option selection on the full countries set.
+//
+// Compares pickOptions (options.js: precomputed look-alikes plus random
+// draws) with the previous generateOptions, which filtered the whole pool
+// with excludeCodes.includes for every wrong answer. Also reports how often
+// the options include a country from the answer's look-alike list.
+//
+// Usage:
+//     node scripts/bench_options.mjs [iterations]
+
+import { countries, packs } from '../countries.js';
+import { distractors } from '../distractors.js';
+import { indexPool, pickOptions } from '../options.js';
+
+const iterations = parseInt(process.argv[2] || '200000', 10);
+
+// The selection app.js used before the distractor index, kept as the baseline
+const getRandomItem = (array) => array[Math.floor(Math.random() * array.length)];
+const getRandomCountry = (pool, excludeCodes = []) => {
+  const available = pool.filter((country) => !excludeCodes.includes(country.code));
+  return available.length > 0 ? getRandomItem(available) : null;
+};
+const shuffle = (array) => {
+  const result = [...array];
+  for (let i = result.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [result[i], result[j]] = [result[j], result[i]];
+  }
+  return result;
+};
+const legacyOptions = (answer, pool) => {
+  const wrongOptions = [];
+  const excludeCodes = [answer.code];
+  while (wrongOptions.length < 3) {
+    const candidate = getRandomCountry(pool, excludeCodes);
+    if (candidate) {
+      wrongOptions.push(candidate);
+      excludeCodes.push(candidate.code);
+    } else {
+      break;
+    }
+  }
+  return shuffle([answer, ...wrongOptions]);
+};
+
+const time = (select, pool) => {
+  const answers = Array.from({ length: 1024 }, () => getRandomItem(pool));
+  let similar = 0;
+  // Warm up the JIT before measuring
+  for (let i = 0; i < 10000; i++) select(answers[i % answers.length]);
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < iterations; i++) {
+    const answer = answers[i % answers.length];
+    const options = select(answer);
+    const lookAlikes = distractors[answer.code] || [];
+    if (options.some((o) => o !== answer && lookAlikes.includes(o.code))) similar++;
+  }
+  const ns = Number(process.hrtime.bigint() - start) / iterations;
+  return { ns, similar: similar / iterations };
+};
+
+const pools = {
+  [`all countries (${countries.length})`]: countries,
+};
+for (const id of ['world', 'africaFull']) {
+  const codes = new Set(packs[id].codes);
+  pools[`pack ${id} (${codes.size})`] = countries.filter((c) => codes.has(c.code));
+}
+
+console.log(`${iterations.toLocaleString()} selections per run\n`);
+console.log(`  ${'pool'.padEnd(26)} ${'method'.padEnd(14)} ${'ns/op'.padStart(8)} ${'look-alike'.padStart(11)}`);
+for (const [name, pool] of Object.entries(pools)) {
+  const poolIndex = indexPool(pool);
+  const runs = {
+    legacy: time((answer) => legacyOptions(answer, pool), pool),
+    index: time((answer) => pickOptions(answer, pool, poolIndex), pool),
+  };
+  for (const [method, { ns, similar }] of Object.entries(runs)) {
+    console.log(`  ${name.padEnd(26)} ${method.padEnd(14)} ${ns.toFixed(0).padStart(8)} ${(similar * 100).toFixed(0).padStart(10)}%`);
+  }
+  console.log(`  ${''.padEnd(26)} ${'speedup'.padEnd(14)} ${(runs.legacy.ns / runs.index.ns).toFixed(1).padStart(7)}x`);
+}
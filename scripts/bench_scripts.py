@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Benchmark the build scripts and catch performance regressions.
+
+Benchmarks:
+  ranks              compute_ranks' rank_table and overall_ranks
+  ranks_incremental  rank_index.diff_records and apply_changes for 10 edited records, after
+                     checking that ties, inserts, removals and reordering rank as a full rebuild
+  emit               RecordWriter writing the ranked records as JSON, JS and NDJSON
+  sw                 generate_sw_content on the project's assets, with warm hashes
+  audio              audio.run synthesizing clips from tts_stub_server (no latency)
+
+ranks, ranks_incremental and emit run on synthetic country datasets of every
+--sizes record count (same fields as country_data.json, seeded, with ties
+and missing values); sw runs on the real tree and audio on --clips phrases.
+Each benchmark is timed --repeat times, each timing averaged over enough
+calls to take at least 0.2s; the median and the best are recorded, and
+the best (the least disturbed by other load) is compared.
+
+Every run is appended to a JSON history file (.bench_history.json). With
+--save-baseline the run also becomes the baseline; otherwise it is compared
+with the baseline and the script exits with status 1 when any benchmark is
+more than --threshold slower. Timings depend on the machine, so the history
+is not committed.
+
+With --profile each benchmark's setup and timing loop are traced, along with
+the spans of the code under test. Tracing slows that code down, so a
+profiled run is neither recorded nor compared with the baseline.
+
+Usage:
+    python3 scripts/bench_scripts.py [--only NAME ...] [--sizes 200 1000 10000 100000]
+                                     [--repeat 5] [--clips 100] [--threshold 0.25]
+                                     [--save-baseline] [--no-record] [--history PATH]
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+
+import audio
+import rank_index
+from asset_hashes import HashIndex
+from compute_ranks import BASE_METRICS, merge_ranks, overall_ranks, rank_table
+from emitters import RecordWriter
+from generate_sw import generate_sw_content
+from tracing import add_profile_args, span, start_profile
+from tts_stub_server import start_stub_server
+
+PROJECT_ROOT = Path(__file__).parent.parent
+HISTORY_FILE = PROJECT_ROOT / ".bench_history.json"
+
+HISTORY_VERSION = 1
+# Runs kept in the history file, oldest dropped first
+HISTORY_RUNS = 200
+
+SIZES = [200, 1000, 10000, 100000]
+CONTINENTS = ["Africa", "Asia", "Europe", "North America", "Oceania", "South America"]
+
+
+def synthetic_countries(size, seed=0):
+    """Records shaped like country_data.json, with a few ties and missing values."""
+    rng = random.Random(seed)
+    countries = []
+    for i in range(size):
+        population = int(rng.lognormvariate(15, 2))
+        area = int(rng.lognormvariate(11, 2.5))
+        gdp = round(rng.lognormvariate(10, 2), -3)  # rounded like the real data, so ties occur
+        countries.append({
+            "code": f"c{i:05d}",
+            "name": f"Country {i}",
+            "continent": rng.choice(CONTINENTS),
+            "population": population,
+            "area": area if rng.random() > 0.01 else None,
+            "gdp": int(gdp) if rng.random() > 0.03 else None,
+        })
+    return countries
+
+
+def ranked(countries):
+    table = rank_table(countries, BASE_METRICS)
+    table["rank"] = overall_ranks(table)
+    return [
+        {**country, **{name: column[i] for name, column in table.items()}}
+        for i, country in enumerate(countries)
+    ]
+
+
+def bench_ranks(size, workdir):
+    countries = synthetic_countries(size)
+
+    def run():
+        table = rank_table(countries, BASE_METRICS)
+        table["rank"] = overall_ranks(table)
+    return run
+
+
+def incremental_edits(countries, seed=0):
+    """Edited copies of countries that change ranks through ties, inserts, removals and reordering."""
+    rng = random.Random(seed)
+    tie = next(c for c in countries if c["gdp"] is not None)
+    edits = []
+    data = [dict(c) for c in countries]
+    for c in rng.sample(data, 3):
+        c["gdp"] = tie["gdp"]
+    edits.append(data)
+    data = [dict(c) for c in data]
+    data.insert(len(data) // 2, {**tie, "code": "new-mid", "name": "Inserted"})
+    edits.append(data)
+    data = data + [{**tie, "code": "new-end", "name": "Appended", "population": None}]
+    edits.append(data)
+    # A new record whose only missing metric changes nothing else gets no update for it
+    data = data + [{**tie, "code": "new-null", "name": "No GDP", "gdp": None}]
+    edits.append(data)
+    data = [c for c in data if rng.random() > 0.05]
+    edits.append(data)
+    data = data[len(data) // 3:] + data[:len(data) // 3]
+    edits.append(data)
+    return edits
+
+
+def check_incremental(size):
+    """Apply each edit through the rank index and compare with a full rebuild."""
+    countries = synthetic_countries(size)
+    index = rank_index.build_index(countries, BASE_METRICS)
+    previous = ranked(countries)
+    for step, data in enumerate(incremental_edits(countries), 1):
+        changed, removed = rank_index.diff_records(index, data)
+        updates = rank_index.apply_changes(index, data, changed, removed)
+        try:
+            records, _ = merge_ranks(data, {c["code"]: c for c in previous}, updates)
+        except KeyError as e:
+            raise SystemExit(f"ranks_incremental/{size}: edit {step} fails with KeyError {e}")
+        for got, expected in zip(records, ranked(data)):
+            if got != expected:
+                field = next(k for k in expected if got.get(k) != expected[k])
+                raise SystemExit(f"ranks_incremental/{size}: edit {step} gives {expected['code']} "
+                                 f"{field} {got.get(field)}, a full rebuild {expected[field]}")
+        previous = records
+
+
+def bench_ranks_incremental(size, workdir):
+    check_incremental(size)
+    countries = synthetic_countries(size)
+    edited = [dict(c) for c in countries]
+    for c in random.Random(1).sample(edited, 10):
+        c["population"] = c["population"] * 3 + 1
+    index = rank_index.build_index(countries, BASE_METRICS)
+    versions = [edited, countries]
+    calls = [0]
+
+    def run():
+        # Alternate between the two versions so every call has 10 changes to apply
+        data = versions[calls[0] % 2]
+        calls[0] += 1
+        changed, removed = rank_index.diff_records(index, data)
+        rank_index.apply_changes(index, data, changed, removed)
+    return run
+
+
+def bench_emit(size, workdir):
+    records = ranked(synthetic_countries(size))
+
+    def run():
+        with RecordWriter(json_path=workdir / "ranked.json", js_path=workdir / "ranked.js",
+                          ndjson_path=workdir / "ranked.ndjson") as writer:
+            writer.write_all(records)
+    return run
+
+
+def bench_sw(size, workdir):
+    hash_index = HashIndex(workdir / "hashes.json")
+    generate_sw_content("bench", hash_index)  # hash every asset once, as a rebuild would find them
+
+    def run():
+        generate_sw_content("bench", hash_index)
+    return run
+
+
+def bench_audio(size, workdir):
+    server, url = start_stub_server(latency=0)
+    client = audio.TTSClient("bench", "bench", api_base=url, rate=0)
+    items = [(f"clip_{i}.mp3", f"Phrase number {i}") for i in range(size)]
+    out_dir = workdir / "audio"
+    out_dir.mkdir()
+
+    def run():
+        for job in audio.run(items, out_dir, client, None, force=True):
+            if job.error:
+                raise RuntimeError(f"{job.out_path.name}: {job.error}")
+    run.close = server.shutdown
+    return run
+
+
+# name: (setup(size, workdir) -> callable, scales with --sizes)
+BENCHMARKS = {
+    "ranks": (bench_ranks, True),
+    "ranks_incremental": (bench_ranks_incremental, True),
+    "emit": (bench_emit, True),
+    "sw": (bench_sw, False),
+    "audio": (bench_audio, False),
+}
+
+
+def measure(run, repeat):
+    """Median and best seconds per call."""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    samples = [t / number for t in timer.repeat(repeat, number)]
+    return {"median": statistics.median(samples), "min": min(samples), "calls": number * repeat}
+
+
+def run_benchmarks(names, sizes, repeat, clips):
+    results = {}
+    for name in names:
+        setup, scales = BENCHMARKS[name]
+        for size in (sizes if scales else [clips if name == "audio" else None]):
+            key = name if size is None else f"{name}/{size}"
+            with tempfile.TemporaryDirectory() as tmp:
+                with span(f"setup {key}"):
+                    run = setup(size, Path(tmp))
+                try:
+                    with span(key):
+                        results[key] = measure(run, repeat)
+                finally:
+                    getattr(run, "close", lambda: None)()
+            print(f"  {key:<26} {format_time(results[key]['median']):>10}  "
+                  f"(best {format_time(results[key]['min'])}, {results[key]['calls']} calls)")
+    return results
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def load_history(path):
+    if path.exists():
+        history = json.loads(path.read_text(encoding="utf-8"))
+        if history.get("version") == HISTORY_VERSION:
+            return history
+    return {"version": HISTORY_VERSION, "baseline": None, "runs": []}
+
+
+def save_history(history, path):
+    history["runs"] = history["runs"][-HISTORY_RUNS:]
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(history, indent=1), encoding="utf-8")
+    tmp.replace(path)
+
+
+def git_revision():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def compare(results, baseline, threshold):
+    """Print each result against the baseline. Returns the keys that regressed."""
+    regressions = []
+    revision = baseline.get("git") or "unknown revision"
+    print(f"\nBest times against the baseline from {baseline['date']} ({revision}):")
+    for key, result in results.items():
+        before = baseline["results"].get(key)
+        if not before:
+            print(f"  {key:<26} no baseline")
+            continue
+        ratio = result["min"] / before["min"]
+        slower = ratio > 1 + threshold
+        if slower:
+            regressions.append(key)
+        print(f"  {key:<26} {format_time(before['min']):>10} -> {format_time(result['min']):>10}"
+              f"  {ratio:5.2f}x{'  REGRESSION' if slower else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the build scripts against a stored baseline")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS),
+                        metavar="NAME", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                        help=f"Synthetic dataset sizes (default: {' '.join(map(str, SIZES))})")
+    parser.add_argument("--repeat", type=int, default=5, help="Timings per benchmark (default: 5)")
+    parser.add_argument("--clips", type=int, default=100, help="Clips per audio run (default: 100)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline, 0.25 = 25%% (default: 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help="Make this run the baseline")
+    parser.add_argument("--no-record", action="store_true", help="Do not append this run to the history")
+    parser.add_argument("--history", type=Path, default=HISTORY_FILE,
+                        help="History file (default: .bench_history.json in the project root)")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    if args.profile is not None and args.save_baseline:
+        parser.error("--save-baseline cannot be combined with --profile")
+    start_profile(args.profile)
+
+    print(f"Python {platform.python_version()} on {platform.machine()}, median of {args.repeat}:")
+    results = run_benchmarks(args.only, args.sizes, args.repeat, args.clips)
+
+    history = load_history(args.history)
+    run = {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    regressions = []
+    if args.save_baseline:
+        history["baseline"] = run
+        print("\nSaved as the baseline")
+    elif args.profile is not None:
+        args.no_record = True
+        print("\nProfiled run: not recorded or compared with the baseline")
+    elif history["baseline"]:
+        regressions = compare(results, history["baseline"], args.threshold)
+    else:
+        print("\nNo baseline yet; run with --save-baseline to store one")
+
+    if not args.no_record:
+        history["runs"].append(run)
+    if args.save_baseline or not args.no_record:
+        save_history(history, args.history)
+
+    if regressions:
+        raise SystemExit(f"{len(regressions)} benchmarks more than {args.threshold:.0%} slower "
+                         f"than the baseline: {', '.join(regressions)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Run the data and asset pipeline: every generator script in dependency
+order, skipping the ones whose inputs and outputs are unchanged.
+
+Each stage in STAGES declares the script it runs, the files it reads and
+writes (glob patterns from the project root) and the stages it depends on.
+After a stage succeeds, the content hashes of its inputs and outputs are
+recorded in .build_state.json. A stage runs again only when an input
+changed, its command changed, or an output is missing or was edited since.
+Stages whose dependencies are done run in parallel, and a failure skips
+everything downstream of it.
+
+The fetch and audio stages call external APIs (and audio costs money), so
+they only run when named or with --all. So does pin, which changes the data
+the page bundles (see dataset_versions.py).
+
+Usage:
+    python3 scripts/build.py [STAGE ...] [--all] [--force] [--dry-run] [--jobs N] [--list]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from asset_hashes import HashIndex
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SCRIPT_DIR = Path(__file__).parent
+STATE_FILE = PROJECT_ROOT / ".build_state.json"
+
+# Bumped when the state format changes, forcing a full run
+STATE_VERSION = 1
+
+# Voice the game plays (AUDIO_VOICE_ID in app.js)
+VOICE_ID = "kPzsL2i3teMYv0FxEYQ6"
+VOICE_DIR = f"public/assets/audio/{VOICE_ID}"
+
+
+@dataclass
+class Stage:
+    name: str
+    command: list            # script in scripts/ and its arguments
+    inputs: list             # glob patterns relative to the project root
+    outputs: list
+    deps: list = field(default_factory=list)
+    default: bool = True     # run without being named
+
+
+STAGES = [
+    Stage("fetch", ["fetch_country_data.py"],
+          inputs=["scripts/fetch_country_data.py", "scripts/http_cache.py", "scripts/emitters.py"],
+          outputs=["scripts/country_data.json"],
+          default=False),
+    Stage("ranks", ["compute_ranks.py"],
+          inputs=["scripts/compute_ranks.py", "scripts/rank_index.py", "scripts/emitters.py",
+                  "scripts/country_data.json"],
+          outputs=["scripts/country_data_ranked.json", "scripts/countries_ranked.js"],
+          deps=["fetch"]),
+    Stage("countries", ["sync_countries.py"],
+          inputs=["scripts/sync_countries.py", "scripts/emitters.py", "scripts/game_data.py",
+                  "scripts/country_data_ranked.json", "countries.js"],
+          outputs=["countries.js"],
+          deps=["ranks"]),
+    Stage("challenges", ["generate_challenges.py"],
+          inputs=["scripts/generate_challenges.py", "scripts/game_data.py", "scripts/challenge_spec.json",
+                  "scripts/country_data_ranked.json", "countries.js", "challenges.js"],
+          outputs=["challenges.js"],
+          deps=["countries"]),
+    Stage("pin", ["dataset_versions.py", "pin"],
+          inputs=["scripts/dataset_versions.py", "scripts/game_data.py", "countries.js", "challenges.js",
+                  "distractors.js"],
+          outputs=["pinned/*.js", "public/data/*.json", "public/data/*/*.json", "data_updates.js"],
+          deps=["countries", "challenges", "distractors"],
+          default=False),
+    Stage("dataset", ["dataset_versions.py"],
+          inputs=["scripts/dataset_versions.py", "scripts/game_data.py", "countries.js", "challenges.js",
+                  "pinned/*.js"],
+          outputs=["public/data/*.json", "public/data/*/*.json", "data_updates.js"],
+          deps=["countries", "challenges", "pin"]),
+    Stage("flags", ["optimize_flags.py"],
+          inputs=["scripts/optimize_flags.py", "scripts/asset_hashes.py", "scripts/analyze_assets.py",
+                  "scripts/game_data.py", "countries.js", "challenges.js", "public/assets/flags/*.png"],
+          outputs=["public/assets/flags/variants.json", "public/assets/flags/*/*"],
+          deps=["countries", "challenges"]),
+    Stage("features", ["flag_features.py"],
+          inputs=["scripts/flag_features.py", "scripts/asset_hashes.py", "public/assets/flags/*.png"],
+          outputs=[".flag_features/*"]),
+    Stage("distractors", ["build_distractors.py"],
+          inputs=["scripts/build_distractors.py", "scripts/game_data.py", "scripts/emitters.py",
+                  "scripts/country_data_ranked.json", "countries.js", ".flag_features/*"],
+          outputs=["distractors.js"],
+          deps=["ranks", "countries", "features"]),
+    Stage("audio", ["generate_audio.py", "--voice-id", VOICE_ID],
+          inputs=["scripts/generate_audio.py", "scripts/process_audio.py", "scripts/audio/*.py",
+                  "countries.js"],
+          outputs=[f"{VOICE_DIR}/*.mp3"],
+          deps=["countries"],
+          default=False),
+    Stage("sprites", ["build_audio_sprites.py", "--voice-id", VOICE_ID],
+          inputs=["scripts/build_audio_sprites.py", "scripts/analyze_assets.py", "scripts/game_data.py",
+                  "scripts/audio/*.py", "index.html", "app.js", "countries.js", "challenges.js",
+                  f"{VOICE_DIR}/*.mp3"],
+          outputs=[f"{VOICE_DIR}/sprites.json", f"{VOICE_DIR}/sprites/*"],
+          deps=["audio", "countries", "challenges"]),
+    Stage("sw", ["generate_sw.py"],
+          inputs=["scripts/generate_sw.py", "scripts/analyze_assets.py", "scripts/asset_hashes.py",
+                  "scripts/game_data.py", "index.html", "styles.css", "*.js", "pinned/*.js",
+                  "public/manifest.json",
+                  "public/assets/**/*"],
+          outputs=["public/sw.js"],
+          deps=["countries", "challenges", "dataset", "flags", "distractors", "sprites"]),
+]
+
+
+def snapshot(patterns, hash_index, previous=None):
+    """
+    {relative path: [sha256, size, mtime_ns]} of every file matching the
+    patterns. Files whose size and mtime match `previous` are not rehashed.
+    """
+    previous = previous or {}
+    files = {}
+    for pattern in patterns:
+        for path in PROJECT_ROOT.glob(pattern):
+            key = path.relative_to(PROJECT_ROOT).as_posix()
+            if key in files or not path.is_file():
+                continue
+            stat = path.stat()
+            entry = previous.get(key)
+            if entry and entry[1:] == [stat.st_size, stat.st_mtime_ns]:
+                files[key] = entry
+            else:
+                files[key] = [hash_index.hash(path), stat.st_size, stat.st_mtime_ns]
+    return dict(sorted(files.items()))
+
+
+def _describe(kind, before, after):
+    changed = sorted(p for p in before.keys() | after.keys()
+                     if (before.get(p) or [None])[0] != (after.get(p) or [None])[0])
+    if not changed:
+        return None
+    shown = ", ".join(changed[:3]) + (f" and {len(changed) - 3} more" if len(changed) > 3 else "")
+    return f"{kind} changed: {shown}"
+
+
+def stale_reason(stage, record, hash_index):
+    """Why the stage has to run, or None if it is up to date."""
+    if record is None:
+        return "never built"
+    if record["command"] != stage.command:
+        return "command changed"
+    outputs = snapshot(stage.outputs, hash_index, record["outputs"])
+    if not outputs:
+        return "outputs missing"
+    return (_describe("inputs", record["inputs"], snapshot(stage.inputs, hash_index, record["inputs"]))
+            or _describe("outputs", record["outputs"], outputs))
+
+
+def load_state(path=STATE_FILE):
+    if path.exists():
+        state = json.loads(path.read_text(encoding="utf-8"))
+        if state.get("version") == STATE_VERSION:
+            return state
+    return {"version": STATE_VERSION, "stages": {}}
+
+
+def save_state(state, path=STATE_FILE):
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(state, indent=1, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def select(targets, include_all):
+    """Stages to consider: the targets (or every default stage) and the stages they depend on."""
+    by_name = {stage.name: stage for stage in STAGES}
+    unknown = [name for name in targets if name not in by_name]
+    if unknown:
+        raise SystemExit(f"Unknown stage: {', '.join(unknown)} (see --list)")
+    named = set(targets)
+    wanted = set()
+    pending = list(targets) or [s.name for s in STAGES if s.default or include_all]
+    while pending:
+        name = pending.pop()
+        if name in wanted:
+            continue
+        wanted.add(name)
+        # Opt-in stages only run when asked for, not as a dependency
+        pending.extend(d for d in by_name[name].deps
+                       if by_name[d].default or include_all or d in named)
+    return [stage for stage in STAGES if stage.name in wanted]
+
+
+def run_stage(stage):
+    start = time.perf_counter()
+    with span(stage.name):
+        result = subprocess.run(
+            [sys.executable, str(SCRIPT_DIR / stage.command[0]), *stage.command[1:]],
+            cwd=PROJECT_ROOT, capture_output=True, text=True,
+        )
+    return result, time.perf_counter() - start
+
+
+def print_output(result):
+    for line in (result.stdout + result.stderr).splitlines():
+        print(f"    {line}")
+
+
+def build(stages, jobs, force=False, dry_run=False):
+    """Run the stages that are out of date. Returns the names of failed stages."""
+    state = load_state()
+    hash_index = HashIndex()
+    names = {stage.name for stage in stages}
+    deps = {stage.name: [d for d in stage.deps if d in names] for stage in stages}
+    done, ran, failed = set(), set(), set()
+    running = {}
+
+    def finish(stage, status):
+        done.add(stage.name)
+        if status == "failed":
+            failed.add(stage.name)
+        elif status == "ran":
+            ran.add(stage.name)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        waiting = list(stages)
+        while waiting or running:
+            for stage in [s for s in waiting if all(d in done for d in deps[s.name])]:
+                waiting.remove(stage)
+                blocked = [d for d in deps[stage.name] if d in failed]
+                if blocked:
+                    print(f"{stage.name}: skipped, {', '.join(blocked)} failed")
+                    finish(stage, "failed")
+                    continue
+                reason = "forced" if force else stale_reason(stage, state["stages"].get(stage.name), hash_index)
+                if dry_run and not reason and any(d in ran for d in deps[stage.name]):
+                    reason = "after " + ", ".join(d for d in deps[stage.name] if d in ran)
+                if not reason:
+                    print(f"{stage.name}: up to date")
+                    finish(stage, "fresh")
+                elif dry_run:
+                    print(f"{stage.name}: would run ({reason})")
+                    finish(stage, "ran")
+                else:
+                    print(f"{stage.name}: running ({reason})")
+                    running[pool.submit(run_stage, stage)] = stage
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                result, seconds = future.result()
+                if result.returncode:
+                    print(f"{stage.name}: failed (exit {result.returncode}) in {seconds:.1f}s")
+                    print_output(result)
+                    finish(stage, "failed")
+                    continue
+                print(f"{stage.name}: done in {seconds:.1f}s")
+                print_output(result)
+                # Inputs are recorded after the run, as some stages update their own inputs
+                record = state["stages"].get(stage.name) or {"inputs": {}, "outputs": {}}
+                state["stages"][stage.name] = {
+                    "command": stage.command,
+                    "inputs": snapshot(stage.inputs, hash_index, record["inputs"]),
+                    "outputs": snapshot(stage.outputs, hash_index, record["outputs"]),
+                }
+                save_state(state)
+                finish(stage, "ran")
+
+    hash_index.save()
+    return sorted(failed), sorted(ran)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the generated data and assets that are out of date")
+    parser.add_argument("stages", nargs="*", metavar="STAGE",
+                        help="Stages to bring up to date, with their dependencies (default: all default stages)")
+    parser.add_argument("--all", action="store_true",
+                        help="Include the stages that call external APIs (fetch, audio)")
+    parser.add_argument("--force", action="store_true", help="Run the selected stages even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would run without running it")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Stages run at the same time (default: CPU count)")
+    parser.add_argument("--list", action="store_true", help="List the stages and exit")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    if args.list:
+        for stage in STAGES:
+            after = f" (after {', '.join(stage.deps)})" if stage.deps else ""
+            opt_in = "" if stage.default else " [opt-in]"
+            print(f"  {stage.name:<12} {' '.join(stage.command)}{after}{opt_in}")
+        return
+
+    start = time.perf_counter()
+    stages = select(args.stages, args.all)
+    failed, ran = build(stages, args.jobs, args.force, args.dry_run)
+    verb = "would run" if args.dry_run else "ran"
+    print(f"\n{len(stages)} stages, {len(ran)} {verb}, {len(failed)} failed "
+          f"in {time.perf_counter() - start:.2f}s")
+    if failed:
+        raise SystemExit(f"Failed: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
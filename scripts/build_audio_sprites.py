@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Pack voice clips into audio sprites: one MP3 per group plus sprites.json,
+a map of where each clip sits in its sprite.
+
+The "phrases" sprite holds every voice clip the game plays that is not a
+country name (the question and the scores, as found by analyze_assets.py).
+--packs adds a "pack-<id>" sprite of country name clips per pack. The page
+decodes a sprite once and plays clips from it by offset; the service worker
+precaches the sprites instead of the individual files.
+
+Output, in public/assets/audio/<voice>/:
+    sprites/<group>.mp3
+    sprites.json   {"version": 1, "sprites": {group: {"file", "clips": {name: [start, duration]}}}}
+
+Clips are spliced without re-encoding, so every clip in a sprite must have
+the same sample rate and channel mode; process_audio.py makes them uniform.
+
+Usage:
+    python3 scripts/build_audio_sprites.py [--voice-id ID] [--packs [ID ...]]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import audio
+from analyze_assets import build_graph
+from game_data import load_packs
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+AUDIO_DIR = PROJECT_ROOT / "public" / "assets" / "audio"
+
+# Voice the game plays (AUDIO_VOICE_ID in app.js)
+DEFAULT_VOICE_ID = "kPzsL2i3teMYv0FxEYQ6"
+
+MANIFEST_VERSION = 1
+
+
+def _clip_order(name):
+    """question, ..., score_0, score_1, ..., score_10 rather than score_1, score_10, score_2."""
+    base, _, number = name.rpartition("_")
+    return (base, int(number)) if number.isdigit() else (name, -1)
+
+
+def phrase_clips(voice_dir, graph, codes):
+    """Names of the non-country voice clips the game references."""
+    prefix = f"{voice_dir.relative_to(PROJECT_ROOT / 'public').as_posix()}/"
+    names = [
+        Path(path).stem for path in graph.refs
+        if path.startswith(prefix) and path.endswith(".mp3") and "/" not in path[len(prefix):]
+        and Path(path).stem not in codes
+    ]
+    return sorted(names, key=_clip_order)
+
+
+def sprite_groups(voice_dir, pack_ids=None):
+    """{group: [clip name, ...]} for the phrases and, optionally, packs."""
+    graph, codes = build_graph()
+    groups = {"phrases": phrase_clips(voice_dir, graph, codes)}
+    if pack_ids is not None:
+        packs = load_packs(PROJECT_ROOT / "countries.js")
+        for pack_id in pack_ids or packs:
+            if pack_id not in packs:
+                raise SystemExit(f"Unknown pack '{pack_id}' (choose from {', '.join(packs)})")
+            groups[f"pack-{pack_id}"] = packs[pack_id]["codes"]
+    return groups
+
+
+def build_sprites(voice_dir, groups):
+    """Write every sprite and return the sprites.json content."""
+    sprites_dir = voice_dir / "sprites"
+    sprites_dir.mkdir(exist_ok=True)
+    manifest = {"version": MANIFEST_VERSION, "sprites": {}}
+    for group, names in groups.items():
+        clips = []
+        for name in names:
+            path = voice_dir / f"{name}.mp3"
+            if not path.exists():
+                print(f"  Warning: {path.name} not found, left out of '{group}'")
+                continue
+            clips.append((name, path.read_bytes()))
+        if not clips:
+            continue
+        try:
+            data, offsets = audio.pack_sprite(clips)
+        except ValueError as e:
+            raise SystemExit(f"Cannot build '{group}': {e}; run process_audio.py to make the clips uniform")
+        audio.write_atomic(sprites_dir / f"{group}.mp3", data)
+        manifest["sprites"][group] = {"file": f"sprites/{group}.mp3", "clips": offsets}
+        before = sum(len(clip) for _, clip in clips)
+        print(f"  {group:<20} {len(clips):>4} clips  {before:>10,} -> {len(data):>10,} bytes")
+
+    # Sprites of groups that are no longer built
+    for stale in sprites_dir.glob("*.mp3"):
+        if stale.stem not in manifest["sprites"]:
+            stale.unlink()
+            print(f"  Removed stale {stale.name}")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack voice clips into audio sprites")
+    parser.add_argument("--voice-id", default=DEFAULT_VOICE_ID,
+                        help=f"Voice whose clips to pack (default: {DEFAULT_VOICE_ID})")
+    parser.add_argument("--packs", nargs="*", metavar="ID",
+                        help="Also build a sprite of country names per pack (all packs if no IDs given)")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    voice_dir = AUDIO_DIR / args.voice_id
+    if not voice_dir.is_dir():
+        raise SystemExit(f"{voice_dir} does not exist")
+
+    groups = sprite_groups(voice_dir, args.packs)
+    with span("pack sprites", items=len(groups)):
+        manifest = build_sprites(voice_dir, groups)
+    manifest_path = voice_dir / "sprites.json"
+    audio.write_atomic(manifest_path, (json.dumps(manifest, separators=(",", ":")) + "\n").encode("utf-8"))
+    print(f"Wrote {len(manifest['sprites'])} sprites to {manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
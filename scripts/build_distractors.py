@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Build distractors.js: for every country, the countries most easily mistaken
+for it, which the game offers as wrong answers.
+
+Similarity combines:
+  - the flags, from the similarity matrix flag_features.py keeps up to
+    date (layout, palette, perceptual hash and stripes)
+  - the continent
+  - the overall rank, so well-known countries are paired with each other
+
+Each country keeps its DISTRACTORS most similar countries, best first. The
+page picks wrong answers from that list among the countries in play and
+tops up with random ones, without scanning the pool.
+
+Flags that changed since the last run are re-read first. Requires NumPy
+and Pillow (pip install numpy pillow).
+
+Usage:
+    python3 scripts/build_distractors.py [--count N] [--workers N] [--show CODE ...]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from asset_hashes import HashIndex
+from emitters import js_key
+from flag_features import FLAGS_DIR, FeatureStore, update
+from game_data import load_countries
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+RANKED_FILE = Path(__file__).parent / "country_data_ranked.json"
+OUTPUT_FILE = PROJECT_ROOT / "distractors.js"
+
+# Candidates kept per country
+DISTRACTORS = 8
+
+# Weights of the similarity terms (each in 0..1)
+WEIGHTS = {"flag": 0.85, "continent": 0.1, "rank": 0.05}
+
+
+def load_ranks():
+    with open(RANKED_FILE, "r") as f:
+        return {c["code"]: c.get("rank") for c in json.load(f)}
+
+
+def build_index(countries, flag_codes, similarity, ranks, count=DISTRACTORS):
+    """{code: [most similar codes, best first]}"""
+    row = {code: i for i, code in enumerate(flag_codes)}
+    worst_rank = max((r for r in ranks.values() if r is not None), default=1)
+    index = {}
+    for a in countries:
+        flags = similarity[row[a["code"]]]
+        rank_a = ranks.get(a["code"]) or worst_rank
+        scored = []
+        for b in countries:
+            if b["code"] == a["code"]:
+                continue
+            rank_b = ranks.get(b["code"]) or worst_rank
+            terms = {
+                "flag": float(flags[row[b["code"]]]),
+                "continent": 1.0 if a["continent"] == b["continent"] else 0.0,
+                "rank": 1 - abs(rank_a - rank_b) / worst_rank,
+            }
+            scored.append((sum(WEIGHTS[k] * v for k, v in terms.items()), b["code"]))
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        index[a["code"]] = [code for _, code in scored[:count]]
+    return index
+
+
+def write_module(index, path=OUTPUT_FILE):
+    lines = [
+        "// Generated by scripts/build_distractors.py; do not edit by hand.",
+        "// For each country, the countries most easily mistaken for it (similar flag,",
+        "// same continent, similar rank), best first.",
+        "export const distractors = {",
+    ]
+    for code, similar in index.items():
+        lines.append(f"  {js_key(code)}: {json.dumps(similar, separators=(',', ':'))},")
+    lines.append("};")
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute plausible wrong answers per country")
+    parser.add_argument("--count", type=int, default=DISTRACTORS,
+                        help=f"Candidates kept per country (default: {DISTRACTORS})")
+    parser.add_argument("--workers", type=int, help="Processes reading changed flags (default: CPU count)")
+    parser.add_argument("--show", nargs="+", metavar="CODE",
+                        help="Print the candidates of these countries")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    countries = load_countries()
+    missing = [c["code"] for c in countries if not (FLAGS_DIR / f"{c['code']}.png").exists()]
+    if missing:
+        raise SystemExit(f"Missing flags: {', '.join(missing)}")
+
+    hash_index = HashIndex()
+    store = FeatureStore()
+    flag_codes, extracted = update(store, sorted(FLAGS_DIR.glob("*.png")), hash_index, args.workers)
+    hash_index.save()
+    if extracted:
+        print(f"Extracted features of {extracted} changed flags")
+
+    with span("rank candidates", items=len(countries)):
+        index = build_index(countries, flag_codes, store.similarity(), load_ranks(), args.count)
+    write_module(index)
+    print(f"Wrote {len(index)} countries x {args.count} candidates to {OUTPUT_FILE} "
+          f"({OUTPUT_FILE.stat().st_size:,} bytes)")
+
+    names = {c["code"]: c["name"] for c in countries}
+    for code in args.show or []:
+        print(f"  {names.get(code, code)}: {', '.join(names[c] for c in index.get(code, []))}")
+
+
+if __name__ == "__main__":
+    main()
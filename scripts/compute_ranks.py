@@ -3,15 +3,105 @@
 Compute world ranks for population, area, and GDP.
 Rank 1 = highest value.
 
-Reads from country_data.json and outputs updated data.
+Reads from country_data.json and outputs updated data. With --as-of DATE
+the data comes from the snapshot in the history store (history_store.py)
+on or before DATE instead, ranked in SQL.
 """
 
+import argparse
 import json
+from array import array
+from contextlib import closing
 from pathlib import Path
 
+import history_store
+import rank_index
+from emitters import RecordWriter
+from tracing import add_profile_args, span, start_profile
+
 SCRIPT_DIR = Path(__file__).parent
 INPUT_FILE = SCRIPT_DIR / "country_data.json"
 OUTPUT_FILE = SCRIPT_DIR / "country_data_ranked.json"
+JS_OUTPUT_FILE = SCRIPT_DIR / "countries_ranked.js"
+INDEX_FILE = SCRIPT_DIR / ".rank_index.json"
+
+# Metrics that make up the overall rank (best of all)
+BASE_METRICS = ["population", "area", "gdp"]
+
+# Extra metrics derived from the base fields; None when an input is missing
+DERIVED_METRICS = {
+    "gdp_per_capita": lambda c: c["gdp"] * 1_000_000 / c["population"]
+    if c.get("gdp") is not None and c.get("population") else None,
+    "density": lambda c: c["population"] / c["area"]
+    if c.get("population") is not None and c.get("area") else None,
+}
+
+TIE_POLICIES = ["ordinal", "competition", "dense"]
+NULL_POLICIES = ["omit", "last"]
+
+
+def load_columns(countries, metrics):
+    """
+    Load the given metrics into columns in a single pass over the countries.
+    Returns {metric: (values, present)} where values is an array of doubles
+    and present is a bytearray mask of non-null entries.
+    """
+    columns = {m: (array("d"), bytearray()) for m in metrics}
+    for c in countries:
+        for m, (values, present) in columns.items():
+            value = DERIVED_METRICS[m](c) if m in DERIVED_METRICS else c.get(m)
+            values.append(value if value is not None else 0.0)
+            present.append(value is not None)
+    return columns
+
+
+def rank_column(values, present, ties="ordinal", nulls="omit"):
+    """
+    Rank one column. Rank 1 = highest value.
+
+    ties:  ordinal     - equal values get distinct ranks in input order (1, 2, 3)
+           competition - equal values share the best rank, gaps follow (1, 1, 3)
+           dense       - equal values share a rank, no gaps (1, 1, 2)
+    nulls: omit        - missing values get no rank (None)
+           last        - missing values share the rank after the last valid one
+    """
+    n = len(values)
+    # Stable descending argsort of the present entries
+    order = sorted((i for i in range(n) if present[i]), key=values.__getitem__, reverse=True)
+    ranks = [None] * n
+    rank = 0
+    previous = None
+    for position, idx in enumerate(order, start=1):
+        value = values[idx]
+        if ties == "ordinal" or value != previous:
+            rank = rank + 1 if ties == "dense" else position
+        ranks[idx] = rank
+        previous = value
+    if nulls == "last":
+        last = rank + 1 if ties == "dense" else len(order) + 1
+        for i in range(n):
+            if not present[i]:
+                ranks[i] = last
+    return ranks
+
+
+def rank_table(countries, metrics=BASE_METRICS, ties="ordinal", nulls="omit"):
+    """Compute a `<metric>_rank` column for every metric. Returns {name: [rank, ...]}."""
+    columns = load_columns(countries, metrics)
+    return {
+        f"{m}_rank": rank_column(values, present, ties, nulls)
+        for m, (values, present) in columns.items()
+    }
+
+
+def overall_ranks(table, metrics=BASE_METRICS):
+    """Best (lowest) rank per row across the given metrics, None if unranked."""
+    columns = [table[f"{m}_rank"] for m in metrics]
+    overall = []
+    for row in zip(*columns):
+        ranks = [r for r in row if r is not None]
+        overall.append(min(ranks) if ranks else None)
+    return overall
 
 
 def compute_ranks(countries, field):
@@ -19,48 +109,146 @@ def compute_ranks(countries, field):
     Compute ranks for a given field.
     Rank 1 = highest value. Countries with null/None values get no rank.
     """
-    # Filter countries with valid values for this field
-    valid = [(i, c[field]) for i, c in enumerate(countries) if c.get(field) is not None]
+    ranks = rank_table(countries, [field])[f"{field}_rank"]
+    return {i: r for i, r in enumerate(ranks) if r is not None}
 
-    # Sort by value descending (highest = rank 1)
-    valid_sorted = sorted(valid, key=lambda x: x[1], reverse=True)
 
-    # Assign ranks
-    ranks = {}
-    for rank, (idx, value) in enumerate(valid_sorted, start=1):
-        ranks[idx] = rank
+def write_outputs(countries, ndjson_path=None):
+    """Write the ranked JSON, the JavaScript module and optionally NDJSON in one pass."""
+    with span("write outputs", items=len(countries)):
+        with RecordWriter(json_path=OUTPUT_FILE, js_path=JS_OUTPUT_FILE, ndjson_path=ndjson_path) as writer:
+            writer.write_all(countries)
 
-    return ranks
+    print(f"Saved ranked data to {OUTPUT_FILE}")
+    print(f"JavaScript output saved to {JS_OUTPUT_FILE}")
+    if ndjson_path:
+        print(f"NDJSON output saved to {ndjson_path}")
+
+
+def merge_ranks(countries, previous, updates):
+    """
+    Ranked records for countries: the previous record of each code with the
+    rank_index.apply_changes updates applied. New records start with every
+    rank missing, which an update fills in when they have a value. Returns
+    (records, [(name, field, old rank, new rank)] for every rank that moved).
+    """
+    ranked = []
+    moved = []
+    for country in countries:
+        record = dict(previous.get(country["code"], {}))
+        record.update(country)
+        for m in BASE_METRICS:
+            record.setdefault(f"{m}_rank", None)
+        old = {f"{m}_rank": record[f"{m}_rank"] for m in BASE_METRICS}
+        for m, ranks in updates.items():
+            if country["code"] in ranks:
+                record[f"{m}_rank"] = ranks[country["code"]]
+        ranks = [record[f"{m}_rank"] for m in BASE_METRICS]
+        ranks = [r for r in ranks if r is not None]
+        record["rank"] = min(ranks) if ranks else None
+        for field, old_rank in old.items():
+            if record[field] != old_rank:
+                moved.append((record["name"], field, old_rank, record[field]))
+        ranked.append(record)
+    return ranked, moved
+
+
+def incremental_update(countries, ndjson_path=None):
+    """
+    Re-rank only what changed since the last run using the persisted index.
+    Falls back to a full rebuild when no usable index exists. Returns the
+    ranked countries, or None if a full rebuild is needed.
+    """
+    index = rank_index.load_index(INDEX_FILE, BASE_METRICS, OUTPUT_FILE)
+    if index is None:
+        print("No usable rank index, doing a full rebuild")
+        return None
+
+    changed, removed = rank_index.diff_records(index, countries)
+    if not changed and not removed:
+        print("No changes since the last run")
+        return []
+
+    with open(OUTPUT_FILE, "r") as f:
+        previous = {c["code"]: c for c in json.load(f)}
+    updates = rank_index.apply_changes(index, countries, changed, removed)
+
+    ranked, moved = merge_ranks(countries, previous, updates)
+
+    print(f"Changed records: {', '.join(changed) or '-'}; removed: {', '.join(removed) or '-'}")
+    print(f"Rank changes ({len(moved)}):")
+    for name, field, old_rank, new_rank in moved:
+        print(f"  {name:<30} {field:<16} {old_rank} -> {new_rank}")
+
+    write_outputs(ranked, ndjson_path)
+    rank_index.save_index(index, INDEX_FILE, OUTPUT_FILE)
+    return ranked
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Compute world ranks for country metrics")
+    parser.add_argument("--ties", choices=TIE_POLICIES, default="ordinal",
+                        help="How equal values are ranked (default: ordinal)")
+    parser.add_argument("--nulls", choices=NULL_POLICIES, default="omit",
+                        help="How missing values are ranked (default: omit)")
+    parser.add_argument("--extra-metrics", nargs="+", default=[],
+                        choices=sorted(DERIVED_METRICS),
+                        help="Additional rank columns that do not affect the overall rank")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Update only ranks affected by changed records (ordinal ties only)")
+    parser.add_argument("--ndjson", type=Path,
+                        help="Also write the ranked records as NDJSON to this path")
+    parser.add_argument("--as-of", metavar="DATE",
+                        help="Rank the history store snapshot on or before DATE (YYYY-MM-DD or latest)")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    if args.as_of:
+        if args.incremental or args.extra_metrics:
+            raise SystemExit("--as-of ranks the base metrics only, without --incremental")
+        if not history_store.STORE_FILE.exists():
+            raise SystemExit(f"No history store at {history_store.STORE_FILE}; run fetch_country_data.py")
+        with closing(history_store.connect()) as conn, span("rank snapshot"):
+            try:
+                date = history_store.resolve_date(conn, args.as_of)
+            except LookupError as e:
+                raise SystemExit(str(e))
+            countries = history_store.ranked_as_of(conn, date, BASE_METRICS, args.ties, args.nulls)
+        print(f"Ranked {len(countries)} countries as of the {date} snapshot")
+        # The rank index no longer matches the output and is rebuilt on the next --incremental
+        write_outputs(countries, args.ndjson)
+        print_summary(countries)
+        return
+
     # Read input data
     with open(INPUT_FILE, "r") as f:
         countries = json.load(f)
 
     print(f"Loaded {len(countries)} countries from {INPUT_FILE}")
 
-    # Compute ranks for each field
-    population_ranks = compute_ranks(countries, "population")
-    area_ranks = compute_ranks(countries, "area")
-    gdp_ranks = compute_ranks(countries, "gdp")
+    if args.incremental:
+        if args.ties != "ordinal" or args.nulls != "omit" or args.extra_metrics:
+            raise SystemExit("--incremental supports only the default --ties/--nulls and no extra metrics")
+        if incremental_update(countries, args.ndjson) is not None:
+            return
+
+    # Compute every rank column, then the overall rank as the best of the base ones
+    with span("rank", items=len(countries)):
+        table = rank_table(countries, BASE_METRICS + args.extra_metrics, args.ties, args.nulls)
+        table["rank"] = overall_ranks(table)
 
     # Add ranks to each country
-    for i, country in enumerate(countries):
-        country["population_rank"] = population_ranks.get(i)
-        country["area_rank"] = area_ranks.get(i)
-        country["gdp_rank"] = gdp_ranks.get(i)
+    for name, column in table.items():
+        for country, rank in zip(countries, column):
+            country[name] = rank
 
-        # Compute overall rank as the best (lowest) of all ranks
-        ranks = [r for r in [country["population_rank"], country["area_rank"], country["gdp_rank"]] if r is not None]
-        country["rank"] = min(ranks) if ranks else None
+    write_outputs(countries, args.ndjson)
+    rank_index.save_index(rank_index.build_index(countries, BASE_METRICS), INDEX_FILE, OUTPUT_FILE)
+    print_summary(countries)
 
-    # Save ranked data to new JSON file
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(countries, f, indent=2)
-
-    print(f"Saved ranked data to {OUTPUT_FILE}")
 
+def print_summary(countries):
     # Print some examples
     print("\n--- Top 10 by GDP ---")
     by_gdp = sorted(countries, key=lambda c: c.get("gdp") or 0, reverse=True)[:10]
@@ -77,26 +265,6 @@ def main():
     for c in by_area:
         print(f"  {c['area_rank']:>3}. {c['name']:<30} Area: {c['area']:,} km²")
 
-    # Also output JavaScript format for easy copy-paste
-    js_output = SCRIPT_DIR / "countries_ranked.js"
-    with open(js_output, "w") as f:
-        f.write("const countries = [\n")
-        for i, c in enumerate(countries):
-            gdp_rank = c['gdp_rank'] if c['gdp_rank'] else 'null'
-            rank = c['rank'] if c['rank'] else 'null'
-            line = (
-                f'    {{ code: "{c["code"]}", name: "{c["name"]}", '
-                f'continent: "{c["continent"]}", '
-                f'population: {c["population"]}, area: {c["area"]}, gdp: {c["gdp"]}, '
-                f'population_rank: {c["population_rank"]}, area_rank: {c["area_rank"]}, gdp_rank: {gdp_rank}, rank: {rank} }}'
-            )
-            if i < len(countries) - 1:
-                line += ","
-            f.write(line + "\n")
-        f.write("];\n")
-
-    print(f"\nJavaScript output saved to {js_output}")
-
     # Show countries with best overall rank
     print("\n--- Countries with rank = 1 (top in at least one category) ---")
     rank_one = [c for c in countries if c.get('rank') == 1]
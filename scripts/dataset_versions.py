@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Keep the versions of the game's dataset (the countries in countries.js and
+the challenges in challenges.js) and publish per-record patches between
+them, so a data fix no longer means downloading the page again.
+
+Everything is written to public/data/, which Vite copies into the site:
+  versions/<id>.json     the full dataset of a version
+  patches/<a>-<b>.json   what changed from version a to version b
+  index.json             the latest version and its size, and the patch
+                         from each older one: {version: [next, bytes]}
+  versions.json          the kept versions, oldest first, with their dates
+A version id is a hash of the dataset. A patch lists the changed fields
+per country code (null for a removed country), whole challenges by id,
+and the new order when adding or removing records does not produce it.
+
+The page does not bundle countries.js, challenges.js and distractors.js
+but the copies in pinned/, which only change when they are pinned:
+  record   (the build's dataset stage) adds the current dataset as a new
+           version with a patch from the previous one
+  pin      (opt-in build stage, before changing the page) records the
+           current dataset and copies the files into pinned/
+Both write data_updates.js with the id of the pinned dataset, and versions
+from the pinned one on are never pruned. On load the page fetches the
+index (the service worker always asks the network for it), downloads the
+patch chain from its version to the latest, or the latest full version
+when that is smaller or the chain has been pruned, and applies it on the
+start screen.
+
+So a data fix only changes public/data/ in the built site: the Pages
+deploy rebuilds an identical page, and players keep their cached page and
+download a few hundred bytes of patches. New countries still need their
+flag and audio deployed, and distractors for them come with the next pin.
+
+Usage:
+    python3 scripts/dataset_versions.py [record] [--keep N]
+    python3 scripts/dataset_versions.py pin [--keep N]
+    python3 scripts/dataset_versions.py list
+    python3 scripts/dataset_versions.py diff FROM TO [--output FILE]
+"""
+
+import argparse
+import hashlib
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from game_data import CHALLENGES_JS, COUNTRIES_JS, load_challenges, load_country_records
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "public" / "data"
+VERSIONS_DIR = DATA_DIR / "versions"
+PATCHES_DIR = DATA_DIR / "patches"
+INDEX_FILE = DATA_DIR / "index.json"
+HISTORY_FILE = DATA_DIR / "versions.json"
+LOADER_OUTPUT = PROJECT_ROOT / "data_updates.js"
+# Copies of the data modules the page bundles
+PINNED_DIR = PROJECT_ROOT / "pinned"
+PINNED_SOURCES = [COUNTRIES_JS, CHALLENGES_JS, PROJECT_ROOT / "distractors.js"]
+
+INDEX_FORMAT = 1
+ID_LENGTH = 12
+# Versions kept; players on an older one download the latest in full.
+# Every page load fetches the index, which grows with each kept version.
+KEEP_VERSIONS = 10
+
+
+def load_dataset(countries_path=COUNTRIES_JS, challenges_path=CHALLENGES_JS):
+    """The shipped data; reviews keep their range, the page expands it."""
+    challenges = [
+        {k: v for k, v in c.items() if not (k == "codes" and "range" in c)}
+        for c in load_challenges(challenges_path)
+    ]
+    return {"countries": load_country_records(countries_path), "challenges": challenges}
+
+
+def dumps(value):
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def version_id(dataset):
+    return hashlib.sha256(json.dumps(dataset, sort_keys=True).encode()).hexdigest()[:ID_LENGTH]
+
+
+def _entries(changes):
+    """Items in the order JavaScript iterates an object: integer keys ascending first."""
+    numeric = sorted((k for k in changes if k.isdigit()), key=int)
+    return [(k, changes[k]) for k in numeric] + [(k, v) for k, v in changes.items() if not k.isdigit()]
+
+
+def apply_changes(records, changes, key, order=None, merge=False):
+    """
+    Records with changes applied, as data_updates.js does: null removes a
+    record, a change is merged into (or replaces) the record with its key,
+    new keys are appended, then `order` (keys) sorts the result if given.
+    """
+    result = []
+    for record in records:
+        k = str(record[key])
+        if k not in changes:
+            result.append(record)
+        elif changes[k] is not None:
+            result.append({**record, **changes[k]} if merge else changes[k])
+    present = {str(record[key]) for record in result}
+    result += [change for k, change in _entries(changes) if change is not None and k not in present]
+    if order is not None:
+        rank = {str(k): i for i, k in enumerate(order)}
+        result.sort(key=lambda record: rank[str(record[key])])
+    return result
+
+
+def diff_records(old, new, key, merge):
+    """(changes, order or None) turning old into new."""
+    before = {str(r[key]): r for r in old}
+    after = {str(r[key]): r for r in new}
+    changes = {}
+    for k, record in after.items():
+        if k not in before:
+            changes[k] = record
+        elif record != before[k]:
+            changes[k] = {f: v for f, v in record.items() if before[k].get(f) != v} if merge else record
+    for k in before:
+        if k not in after:
+            changes[k] = None
+    applied = apply_changes(old, changes, key, merge=merge)
+    order = None if [str(r[key]) for r in applied] == list(after) else [r[key] for r in new]
+    return changes, order
+
+
+def diff(old, new):
+    """Patch from dataset old to dataset new."""
+    countries, country_order = diff_records(old["countries"], new["countries"], "code", merge=True)
+    challenges, challenge_order = diff_records(old["challenges"], new["challenges"], "id", merge=False)
+    patch = {"from": version_id(old), "to": version_id(new)}
+    if countries:
+        patch["countries"] = countries
+    if country_order:
+        patch["countryOrder"] = country_order
+    if challenges:
+        patch["challenges"] = challenges
+    if challenge_order:
+        patch["challengeOrder"] = challenge_order
+    return patch
+
+
+def apply(dataset, patch):
+    return {
+        "countries": apply_changes(dataset["countries"], patch.get("countries", {}), "code",
+                                   patch.get("countryOrder"), merge=True),
+        "challenges": apply_changes(dataset["challenges"], patch.get("challenges", {}), "id",
+                                    patch.get("challengeOrder")),
+    }
+
+
+def load_index():
+    """The page's index plus the kept versions (from versions.json) under "versions"."""
+    if INDEX_FILE.exists() and HISTORY_FILE.exists():
+        index = json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+        if index.get("format") == INDEX_FORMAT:
+            return {**index, "versions": json.loads(HISTORY_FILE.read_text(encoding="utf-8"))}
+    return {"format": INDEX_FORMAT, "latest": None, "size": 0, "patches": {}, "versions": []}
+
+
+def save_index(index):
+    write(HISTORY_FILE, json.dumps(index["versions"], indent=1) + "\n")
+    write(INDEX_FILE, dumps({k: v for k, v in index.items() if k != "versions"}) + "\n")
+
+
+def write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+    return len(text.encode("utf-8"))
+
+
+def load_version(vid):
+    path = VERSIONS_DIR / f"{vid}.json"
+    if not path.exists():
+        raise SystemExit(f"Version {vid} is not in {VERSIONS_DIR}")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def patch_path(patch):
+    return PATCHES_DIR / f"{patch['from']}-{patch['to']}.json"
+
+
+def pinned_version():
+    """Id of the dataset the page bundles."""
+    if not all((PINNED_DIR / source.name).exists() for source in PINNED_SOURCES):
+        raise SystemExit(f"No pinned data in {PINNED_DIR}; run `dataset_versions.py pin`")
+    return version_id(load_dataset(PINNED_DIR / COUNTRIES_JS.name, PINNED_DIR / CHALLENGES_JS.name))
+
+
+def pin():
+    """Copy the data modules into pinned/ for the next page build."""
+    for source in PINNED_SOURCES:
+        header = f"// Pinned copy of {source.name} (scripts/dataset_versions.py pin); do not edit by hand.\n"
+        write(PINNED_DIR / source.name, header + source.read_text(encoding="utf-8"))
+    print(f"Pinned {', '.join(source.name for source in PINNED_SOURCES)} in {PINNED_DIR}")
+
+
+def record(index, dataset, keep, pinned=None):
+    """
+    Add dataset as the latest version. Returns the patch from the previous
+    one, if any. Besides the last `keep` versions, every version from
+    `pinned` on is kept, so the bundled data always has a patch chain.
+    """
+    vid = version_id(dataset)
+    size = write(VERSIONS_DIR / f"{vid}.json", dumps(dataset) + "\n")
+    patch = None
+    if index["latest"]:
+        patch = diff(load_version(index["latest"]), dataset)
+        if apply(load_version(index["latest"]), patch) != dataset:
+            raise SystemExit("Round-trip check failed: the patch does not produce the new dataset")
+        index["patches"][index["latest"]] = [vid, write(patch_path(patch), dumps(patch) + "\n")]
+    # A version recorded again (data reverted) moves to the end
+    index["versions"] = [v for v in index["versions"] if v["id"] != vid]
+    index["versions"].append({"id": vid, "date": datetime.now(timezone.utc).date().isoformat(), "size": size})
+    index["latest"], index["size"] = vid, size
+    stale = index["patches"].pop(vid, None)
+    if stale:
+        (PATCHES_DIR / f"{vid}-{stale[0]}.json").unlink(missing_ok=True)
+
+    ids = [v["id"] for v in index["versions"]]
+    cut = len(ids) - keep
+    if pinned in ids:
+        cut = min(cut, ids.index(pinned))
+    for old in index["versions"][:max(cut, 0)]:
+        (VERSIONS_DIR / f"{old['id']}.json").unlink(missing_ok=True)
+        target = index["patches"].pop(old["id"], None)
+        if target:
+            (PATCHES_DIR / f"{old['id']}-{target[0]}.json").unlink(missing_ok=True)
+    index["versions"] = index["versions"][max(cut, 0):]
+    save_index(index)
+    return patch
+
+
+def generate_loader(version):
+    return f"""// Generated by scripts/dataset_versions.py; do not edit by hand.
+// Brings the bundled (pinned) countries and challenges up to the latest
+// published dataset: the patches in data/index.json from DATASET_VERSION on
+// are applied in place, or the latest full version is loaded when that is
+// smaller or the chain was pruned. Dynamic packs (All World, ...) keep the
+// countries of the bundled data until the next pin.
+
+export const DATASET_VERSION = "{version}";
+const INDEX_FORMAT = {INDEX_FORMAT};
+{LOADER_LOGIC}"""
+
+
+LOADER_LOGIC = """
+const fetchData = async (path) => {
+  const response = await fetch(`data/${path}`);
+  if (!response.ok) throw new Error(`data/${path}: ${response.status}`);
+  return response.json();
+};
+
+// Patches from version to the latest one, or null if one is missing
+const patchChain = (index, version) => {
+  const chain = [];
+  while (version !== index.latest) {
+    const [next, size] = index.patches[version] || [];
+    if (!next || chain.length >= Object.keys(index.patches).length) return null;
+    chain.push({ file: `patches/${version}-${next}.json`, size });
+    version = next;
+  }
+  return chain;
+};
+
+// Apply changes keyed by record[key]: null removes a record, a change is
+// merged into (or replaces) the record with its key, new keys are appended,
+// and order (the keys) sorts the result when the patch gives it
+const patchRecords = (records, changes = {}, key, order, merge) => {
+  const result = [];
+  for (const record of records) {
+    const change = changes[record[key]];
+    if (change === undefined) result.push(record);
+    else if (change !== null) result.push(merge ? Object.assign(record, change) : change);
+  }
+  const present = new Set(result.map((record) => String(record[key])));
+  for (const [k, change] of Object.entries(changes)) {
+    if (change !== null && !present.has(k)) result.push(change);
+  }
+  if (order) {
+    const rank = new Map(order.map((k, i) => [String(k), i]));
+    result.sort((a, b) => rank.get(String(a[key])) - rank.get(String(b[key])));
+  }
+  records.splice(0, records.length, ...result);
+};
+
+// Reviews cover every regular challenge from id range[0] through range[1]
+const expandReviews = (challenges) => {
+  const position = new Map(challenges.map((ch, i) => [ch.id, i]));
+  challenges.forEach((ch, i) => {
+    if (!ch.range) return;
+    const covered = challenges.slice(position.get(ch.range[0]), position.get(ch.range[1]) + 1);
+    challenges[i] = { ...ch, codes: covered.filter((c) => !c.range).flatMap((c) => c.codes) };
+  });
+};
+
+const download = async (index) => {
+  const chain = patchChain(index, DATASET_VERSION);
+  if (chain && chain.reduce((total, patch) => total + patch.size, 0) < index.size) {
+    const patches = await Promise.all(chain.map((patch) => fetchData(patch.file)));
+    return (countries, challenges) => {
+      for (const patch of patches) {
+        patchRecords(countries, patch.countries, "code", patch.countryOrder, true);
+        patchRecords(challenges, patch.challenges, "id", patch.challengeOrder, false);
+      }
+    };
+  }
+  const latest = await fetchData(`versions/${index.latest}.json`);
+  return (countries, challenges) => {
+    countries.splice(0, countries.length, ...latest.countries);
+    challenges.splice(0, challenges.length, ...latest.challenges);
+  };
+};
+
+// Downloads everything first and resolves to a function that updates the
+// arrays in place when called, or to null when there is nothing to apply.
+// A round refers to challenges by index, so the caller picks the moment.
+// On any error the arrays are left as bundled.
+export const loadDataUpdates = async (countries, challenges) => {
+  try {
+    const index = await fetchData("index.json");
+    if (index.format !== INDEX_FORMAT || !index.latest || index.latest === DATASET_VERSION) return null;
+    const update = await download(index);
+    return () => {
+      try {
+        update(countries, challenges);
+        expandReviews(challenges);
+      } catch (error) {
+        console.warn("Data update failed:", error);
+      }
+    };
+  } catch (error) {
+    console.warn("Data update failed, using the bundled data:", error);
+    return null;
+  }
+};
+"""
+
+
+def write_loader(version):
+    content = generate_loader(version)
+    if not LOADER_OUTPUT.exists() or LOADER_OUTPUT.read_text(encoding="utf-8") != content:
+        write(LOADER_OUTPUT, content)
+        print(f"Wrote {LOADER_OUTPUT}")
+
+
+def print_patch(patch, size):
+    countries = patch.get("countries", {})
+    changed = sum(1 for change in countries.values() if change is not None)
+    removed = len(countries) - changed
+    print(f"  {patch['from']} -> {patch['to']}: {changed} countries changed or added, {removed} removed, "
+          f"{len(patch.get('challenges', {}))} challenges, {size:,} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record dataset versions and write patches between them")
+    commands = parser.add_subparsers(dest="command")
+    record_parser = commands.add_parser("record", help="Add the current data as a version (the default)")
+    record_parser.add_argument("--keep", type=int, default=KEEP_VERSIONS,
+                               help=f"Versions kept (default: {KEEP_VERSIONS})")
+    pin_parser = commands.add_parser("pin", help="Record the current data and bundle it with the page")
+    pin_parser.add_argument("--keep", type=int, default=KEEP_VERSIONS,
+                            help=f"Versions kept (default: {KEEP_VERSIONS})")
+    commands.add_parser("list", help="List the versions and patches")
+    diff_parser = commands.add_parser("diff", help="Patch between any two kept versions")
+    diff_parser.add_argument("old")
+    diff_parser.add_argument("new")
+    diff_parser.add_argument("--output", type=Path, help="Write the patch here instead of printing it")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    index = load_index()
+    if args.command == "list":
+        for version in index["versions"]:
+            patch = index["patches"].get(version["id"])
+            step = f"-> {patch[0]} {patch[1]:>7,} bytes" if patch else "(latest)"
+            print(f"  {version['id']}  {version['date']}  {version['size']:>8,} bytes  {step}")
+        print(f"{len(index['versions'])} versions in {DATA_DIR}")
+        return
+    if args.command == "diff":
+        patch = diff(load_version(args.old), load_version(args.new))
+        if args.output:
+            print_patch(patch, write(args.output, dumps(patch) + "\n"))
+        else:
+            print(json.dumps(patch, indent=1, ensure_ascii=False))
+        return
+
+    with span("load dataset"):
+        dataset = load_dataset()
+    vid = version_id(dataset)
+    if args.command == "pin":
+        pin()
+    pinned = pinned_version()
+    if vid == index["latest"]:
+        print(f"Dataset {vid} is already the latest version")
+    else:
+        with span("record version"):
+            patch = record(index, dataset, getattr(args, "keep", KEEP_VERSIONS), pinned)
+        print(f"Recorded version {vid} ({len(dataset['countries'])} countries, "
+              f"{len(dataset['challenges'])} challenges)")
+        if patch:
+            print_patch(patch, index["patches"][patch["from"]][1])
+    print(f"The page bundles version {pinned}")
+    write_loader(pinned)
+
+
+if __name__ == "__main__":
+    main()
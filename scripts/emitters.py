@@ -0,0 +1,140 @@
+"""
+Streaming writers for the country data pipeline.
+
+RecordWriter emits the same records as pretty-printed JSON, an ES module
+(`export const countries = [...]`, the shape countries.js uses) and NDJSON
+in a single pass, one record at a time. Each output is written to a temp
+file next to its destination and renamed into place only when the whole
+stream finished, so a failed run never leaves a half-written file behind.
+"""
+
+import json
+import re
+
+_JS_IDENTIFIER = re.compile(r"^[A-Za-z_$][A-Za-z0-9_$]*$")
+
+
+def js_literal(value):
+    """Serialize a value as a JavaScript literal with correct escaping."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        # JSON strings are valid JS except for the two line separators
+        return json.dumps(value, ensure_ascii=False).replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    if isinstance(value, (int, float)):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(js_literal(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return js_object(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__} as JavaScript")
+
+
+def js_key(key):
+    return key if _JS_IDENTIFIER.match(key) else js_literal(key)
+
+
+def js_object(record):
+    """Single-line object literal in the countries.js style: { code: "af", ... }"""
+    return "{ " + ", ".join(f"{js_key(k)}: {js_literal(v)}" for k, v in record.items()) + " }"
+
+
+class _Output:
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = path.with_name(path.name + ".part")
+        self.file = open(self.tmp_path, "w", encoding="utf-8")
+        self.count = 0
+
+    def commit(self):
+        self.file.close()
+        self.tmp_path.replace(self.path)
+
+    def abort(self):
+        self.file.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+class _JSONOutput(_Output):
+    """Matches json.dump(records, f, indent=2) byte for byte."""
+
+    def write(self, record):
+        body = json.dumps(record, indent=2).replace("\n", "\n  ")
+        self.file.write(("[\n  " if self.count == 0 else ",\n  ") + body)
+        self.count += 1
+
+    def commit(self):
+        self.file.write("\n]" if self.count else "[]")
+        super().commit()
+
+
+class _JSOutput(_Output):
+    def __init__(self, path, name, export):
+        super().__init__(path)
+        self.header = f"{'export ' if export else ''}const {name} = ["
+
+    def write(self, record):
+        self.file.write((self.header + "\n" if self.count == 0 else ",\n") + "    " + js_object(record))
+        self.count += 1
+
+    def commit(self):
+        self.file.write("\n];\n" if self.count else self.header + "];\n")
+        super().commit()
+
+
+class _NDJSONOutput(_Output):
+    def write(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.count += 1
+
+
+class RecordWriter:
+    """
+    Write records to any combination of JSON, JS module and NDJSON files.
+
+        with RecordWriter(json_path=..., js_path=...) as writer:
+            for record in records:
+                writer.write(record)
+    """
+
+    def __init__(self, json_path=None, js_path=None, ndjson_path=None, js_name="countries",
+                 js_export=True):
+        self.outputs = []
+        try:
+            if json_path:
+                self.outputs.append(_JSONOutput(json_path))
+            if js_path:
+                self.outputs.append(_JSOutput(js_path, js_name, js_export))
+            if ndjson_path:
+                self.outputs.append(_NDJSONOutput(ndjson_path))
+        except OSError:
+            self.abort()
+            raise
+
+    def write(self, record):
+        for output in self.outputs:
+            output.write(record)
+
+    def write_all(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        for output in self.outputs:
+            output.commit()
+
+    def abort(self):
+        for output in self.outputs:
+            output.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 """
 Fetch country data from REST Countries API and compile with GDP data.
-Outputs enriched country data for countries.js
+Outputs enriched country data for countries.js, and keeps a dated snapshot
+of it in the history store (history_store.py).
 """
 
-import json
-import urllib.request
+import argparse
 import ssl
+from contextlib import closing
+from pathlib import Path
+
+import history_store
+from emitters import RecordWriter, js_object
+from http_cache import DEFAULT_TTL, REST_COUNTRIES_URL, HTTPCache
+from tracing import add_profile_args, span, start_profile
+
+OUTPUT_FILE = Path(__file__).parent / "country_data.json"
 
 # Existing country codes from countries.js
 EXISTING_CODES = [
@@ -82,19 +91,15 @@ GDP_DATA = {
     "li": 7000, "qa": 220000, "ss": 5000
 }
 
-def fetch_rest_countries():
-    """Fetch data from REST Countries API"""
-    url = "https://restcountries.com/v3.1/all?fields=name,cca2,population,area,region,subregion"
-
+def fetch_rest_countries(http_cache):
+    """Fetch data from REST Countries API (through the local HTTP cache)"""
     # Create SSL context that doesn't verify (for compatibility)
     ctx = ssl.create_default_context()
     ctx.check_hostname = False
     ctx.verify_mode = ssl.CERT_NONE
 
     try:
-        with urllib.request.urlopen(url, context=ctx, timeout=30) as response:
-            data = json.loads(response.read().decode())
-            return data
+        return http_cache.get_json(REST_COUNTRIES_URL, timeout=30, context=ctx)
     except Exception as e:
         print(f"Error fetching data: {e}")
         return None
@@ -114,9 +119,48 @@ def get_continent(country_data, code):
     else:
         return region  # Africa, Asia, Europe, Oceania
 
+def enrich(api_lookup, missing_codes):
+    """Yield enriched records for EXISTING_CODES, collecting codes the API lacks."""
+    for code in EXISTING_CODES:
+        if code not in api_lookup:
+            missing_codes.append(code)
+            continue
+        c = api_lookup[code]
+        name_data = c.get("name", {})
+        # Get common name
+        name = name_data.get("common", "") if isinstance(name_data, dict) else str(name_data)
+
+        area = c.get("area", 0)
+        yield {
+            "code": code,
+            "name": name,
+            "continent": get_continent(c, code),
+            "population": c.get("population", 0),
+            "area": int(area) if area else 0,
+            "gdp": GDP_DATA.get(code, None)
+        }
+
 def main():
+    parser = argparse.ArgumentParser(description="Fetch and enrich country data")
+    parser.add_argument("--offline", action="store_true",
+                        help="Use only the local HTTP cache or checked-in fixtures")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Revalidate with the API even if the cached copy is fresh")
+    parser.add_argument("--js", type=Path,
+                        help="Also write the records as an ES module to this path")
+    parser.add_argument("--ndjson", type=Path,
+                        help="Also write the records as NDJSON to this path")
+    parser.add_argument("--snapshot-date", default=history_store.today(),
+                        help="Date of the snapshot kept in the history store (default: today, UTC)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="Do not add a snapshot to the history store")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
     print("Fetching country data from REST Countries API...")
-    api_data = fetch_rest_countries()
+    http_cache = HTTPCache(ttl=0 if args.refresh else DEFAULT_TTL, offline=args.offline)
+    api_data = fetch_rest_countries(http_cache)
 
     if not api_data:
         print("Failed to fetch data. Using fallback.")
@@ -131,51 +175,30 @@ def main():
 
     print(f"Fetched {len(api_lookup)} countries from API")
 
-    # Build enriched country list
-    enriched = []
     missing_codes = []
+    enriched = enrich(api_lookup, missing_codes)
 
-    for code in EXISTING_CODES:
-        if code in api_lookup:
-            c = api_lookup[code]
-            name_data = c.get("name", {})
-            # Get common name
-            name = name_data.get("common", "") if isinstance(name_data, dict) else str(name_data)
-
-            continent = get_continent(c, code)
-            population = c.get("population", 0)
-            area = c.get("area", 0)
-            gdp = GDP_DATA.get(code, None)
-
-            enriched.append({
-                "code": code,
-                "name": name,
-                "continent": continent,
-                "population": population,
-                "area": int(area) if area else 0,
-                "gdp": gdp
-            })
-        else:
-            missing_codes.append(code)
+    # Stream each record to the JSON file (and any extra formats) and print
+    # the JavaScript form as we go
+    print("\n// Enriched country data for countries.js")
+    print("export const countries = [")
+    records = []
+    with RecordWriter(json_path=OUTPUT_FILE, js_path=args.js, ndjson_path=args.ndjson) as writer:
+        for record in enriched:
+            writer.write(record)
+            records.append(record)
+            print(f"    {js_object(record)},")
+    print("];")
 
     if missing_codes:
         print(f"Warning: Missing data for codes: {missing_codes}")
 
-    # Output as JavaScript
-    print("\n// Enriched country data for countries.js")
-    print("const countries = [")
-
-    for i, c in enumerate(enriched):
-        gdp_str = str(c['gdp']) if c['gdp'] else "null"
-        comma = "," if i < len(enriched) - 1 else ""
-        print(f'    {{ code: "{c["code"]}", name: "{c["name"]}", continent: "{c["continent"]}", population: {c["population"]}, area: {c["area"]}, gdp: {gdp_str} }}{comma}')
-
-    print("];")
+    print(f"\nData also saved to {OUTPUT_FILE}")
 
-    # Also save to JSON for reference
-    with open("scripts/country_data.json", "w") as f:
-        json.dump(enriched, f, indent=2)
-    print("\nData also saved to scripts/country_data.json")
+    if not args.no_history:
+        with closing(history_store.connect()) as conn, span("store snapshot", items=len(records)):
+            history_store.ingest(conn, args.snapshot_date, records, "fetch_country_data")
+        print(f"Snapshot {args.snapshot_date} kept in {history_store.STORE_FILE}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Extract compact visual descriptors for every flag and a pairwise similarity
+matrix between them.
+
+Per flag (public/assets/flags/<code>.png):
+  histogram  colour histogram, LEVELS^3 RGB bins summing to 1
+  layout     average colour of each cell of a GRID, in 0..1
+  phash      64-bit perceptual hash (low frequencies of a 32x32 grey DCT)
+  stripes    how much of the colour variance is explained by rows
+             (horizontal stripes) and by columns (vertical stripes)
+
+Descriptors are stored as a NumPy structured array and the similarity
+matrix as a float32 square matrix, both .npy files that np.load can
+memory-map, in .flag_features/ next to an index of flag codes and content
+hashes. A run decodes only flags whose content hash changed, in a process
+pool, and recomputes only their rows and columns of the matrix.
+
+Similarity is a weighted sum of per-descriptor similarities in 0..1 (see
+SIMILARITY_WEIGHTS). Load the results with load_features() and
+load_similarity().
+
+Requires NumPy and Pillow (pip install numpy pillow).
+
+Usage:
+    python3 scripts/flag_features.py [--workers N] [--force] [--similar CODE ...]
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from asset_hashes import HashIndex
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FLAGS_DIR = PROJECT_ROOT / "public" / "assets" / "flags"
+STORE_DIR = PROJECT_ROOT / ".flag_features"
+
+# Bumped whenever a descriptor or the similarity changes, forcing a full run
+FEATURES_VERSION = 1
+
+LEVELS = 4
+GRID = (6, 4)
+HASH_SIZE = 8
+HASH_SOURCE = 32
+
+FEATURE_DTYPE = np.dtype([
+    ("histogram", np.float32, LEVELS ** 3),
+    ("layout", np.float32, GRID[0] * GRID[1] * 3),
+    ("phash", np.uint8, HASH_SIZE * HASH_SIZE // 8),
+    ("stripes", np.float32, 2),
+])
+
+SIMILARITY_WEIGHTS = {"layout": 0.35, "histogram": 0.3, "phash": 0.2, "stripes": 0.15}
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    matrix = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n))
+    matrix[0] /= np.sqrt(2)
+    return matrix * np.sqrt(2 / n)
+
+
+def extract(path):
+    """Descriptors of one flag as a FEATURE_DTYPE record. Runs in a worker process."""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        rgba = img.convert("RGBA")
+    # Transparent areas count as white, as the page shows them
+    flag = Image.new("RGB", rgba.size, "white")
+    flag.paste(rgba, mask=rgba)
+    small = np.asarray(flag.resize((GRID[0] * 8, GRID[1] * 8), Image.Resampling.BOX), dtype=np.float32)
+
+    record = np.zeros((), FEATURE_DTYPE)
+    bins = (small // (256 // LEVELS)).astype(np.int64)
+    index = (bins[..., 0] * LEVELS + bins[..., 1]) * LEVELS + bins[..., 2]
+    record["histogram"] = np.bincount(index.ravel(), minlength=LEVELS ** 3) / index.size
+
+    cells = small.reshape(GRID[1], 8, GRID[0], 8, 3).mean(axis=(1, 3))
+    record["layout"] = (cells / 255).ravel()
+
+    grey = np.asarray(flag.convert("L").resize((HASH_SOURCE, HASH_SOURCE), Image.Resampling.BOX), dtype=np.float32)
+    dct = _dct_matrix(HASH_SOURCE)
+    low = (dct @ grey @ dct.T)[:HASH_SIZE, :HASH_SIZE].ravel()
+    # The DC term only reflects overall brightness; compare the rest to their median
+    bits = low > np.median(low[1:])
+    record["phash"] = np.packbits(bits)
+
+    total = small.var(axis=(0, 1)).sum()
+    if total > 0:
+        record["stripes"] = [
+            small.mean(axis=1).var(axis=0).sum() / total,  # rows: horizontal stripes
+            small.mean(axis=0).var(axis=0).sum() / total,  # columns: vertical stripes
+        ]
+    return record
+
+
+def similarity_rows(features, rows):
+    """Similarity of features[rows] to every flag, shape (len(rows), len(features))."""
+    a, b = features[rows], features
+
+    # Mean distance between cell colours, scaled by the largest possible one
+    la = a["layout"].reshape(len(a), 1, -1, 3)
+    lb = b["layout"].reshape(1, len(b), -1, 3)
+    layout = 1 - np.sqrt(((la - lb) ** 2).sum(-1)).mean(-1) / np.sqrt(3)
+
+    histogram = np.minimum(a["histogram"][:, None, :], b["histogram"][None, :, :]).sum(-1)
+
+    bits_a = np.unpackbits(a["phash"], axis=1)
+    bits_b = np.unpackbits(b["phash"], axis=1)
+    phash = 1 - (bits_a[:, None, :] != bits_b[None, :, :]).mean(-1)
+
+    stripes = 1 - np.abs(a["stripes"][:, None, :] - b["stripes"][None, :, :]).mean(-1)
+
+    w = SIMILARITY_WEIGHTS
+    return (w["layout"] * layout + w["histogram"] * histogram
+            + w["phash"] * phash + w["stripes"] * stripes).astype(np.float32)
+
+
+class FeatureStore:
+    """features.npy, similarity.npy and index.json in one directory."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.index_path = self.store_dir / "index.json"
+        self.features_path = self.store_dir / "features.npy"
+        self.similarity_path = self.store_dir / "similarity.npy"
+
+    def load_index(self):
+        if not self.index_path.exists():
+            return None
+        index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        if index.get("version") != FEATURES_VERSION or not self.features_path.exists() \
+                or not self.similarity_path.exists():
+            return None
+        return index
+
+    def features(self):
+        return np.load(self.features_path, mmap_mode="r")
+
+    def similarity(self):
+        return np.load(self.similarity_path, mmap_mode="r")
+
+    def _save_array(self, path, array):
+        tmp = path.with_name(path.stem + ".part.npy")
+        np.save(tmp, array)
+        tmp.replace(path)
+
+    def save(self, codes, hashes, features, similarity):
+        self.store_dir.mkdir(exist_ok=True)
+        self._save_array(self.features_path, features)
+        self._save_array(self.similarity_path, similarity)
+        index = {"version": FEATURES_VERSION, "codes": codes, "hashes": hashes}
+        tmp = self.index_path.with_name(self.index_path.name + ".part")
+        tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.index_path)
+
+
+def update(store, sources, hash_index, workers=None, force=False):
+    """
+    Bring the store up to date with the flags in sources.
+    Returns (codes, number of flags extracted).
+    """
+    codes = [src.stem for src in sources]
+    hashes = {src.stem: hash_index.hash(src)[:16] for src in sources}
+    index = None if force else store.load_index()
+    old_row = {code: i for i, code in enumerate(index["codes"])} if index else {}
+    old_hashes = index["hashes"] if index else {}
+
+    unchanged = {code for code in codes if code in old_row and old_hashes.get(code) == hashes[code]}
+    changed = [i for i, code in enumerate(codes) if code not in unchanged]
+    keep = [i for i, code in enumerate(codes) if code in unchanged]
+    if not changed and len(codes) == len(old_row):
+        return codes, 0
+
+    features = np.zeros(len(codes), FEATURE_DTYPE)
+    similarity = np.zeros((len(codes), len(codes)), np.float32)
+    if keep:
+        previous = [old_row[codes[i]] for i in keep]
+        features[keep] = store.features()[previous]
+        similarity[np.ix_(keep, keep)] = store.similarity()[np.ix_(previous, previous)]
+
+    if changed:
+        with span("extract", items=len(changed)), \
+                ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for i, record in zip(changed, pool.map(extract, [sources[i] for i in changed])):
+                features[i] = record
+        with span("similarity", items=len(changed)):
+            rows = similarity_rows(features, changed)
+        similarity[changed, :] = rows
+        similarity[:, changed] = rows.T
+
+    store.save(codes, hashes, features, similarity)
+    return codes, len(changed)
+
+
+def load_features(store_dir=STORE_DIR):
+    """(codes, memory-mapped feature records), or None if flag_features.py has not run."""
+    store = FeatureStore(store_dir)
+    index = store.load_index()
+    return (index["codes"], store.features()) if index else None
+
+
+def load_similarity(store_dir=STORE_DIR):
+    """(codes, memory-mapped similarity matrix), or None if flag_features.py has not run."""
+    store = FeatureStore(store_dir)
+    index = store.load_index()
+    return (index["codes"], store.similarity()) if index else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract flag descriptors and a similarity matrix")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Recompute every flag")
+    parser.add_argument("--similar", nargs="+", metavar="CODE",
+                        help="Print the flags most similar to these")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    sources = sorted(FLAGS_DIR.glob("*.png"))
+    hash_index = HashIndex()
+    store = FeatureStore()
+    codes, extracted = update(store, sources, hash_index, args.workers, args.force)
+    hash_index.save()
+    print(f"{len(codes)} flags, {extracted} extracted, {len(codes) - extracted} unchanged")
+    print(f"  {store.features_path.stat().st_size:,} bytes of features, "
+          f"{store.similarity_path.stat().st_size:,} bytes of similarity in {store.store_dir}")
+
+    similarity = store.similarity()
+    row = {code: i for i, code in enumerate(codes)}
+    for code in args.similar or []:
+        if code not in row:
+            print(f"  {code}: no flag")
+            continue
+        scores = similarity[row[code]]
+        best = [i for i in np.argsort(-scores) if i != row[code]][:8]
+        print(f"  {code}: " + ", ".join(f"{codes[i]} {scores[i]:.2f}" for i in best))
+
+
+if __name__ == "__main__":
+    main()
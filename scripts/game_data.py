@@ -0,0 +1,120 @@
+"""
+Read the game's country list, packs and progression challenges from the
+JavaScript sources (countries.js, challenges.js) so build scripts work
+from what the game actually ships.
+
+The dynamic packs in countries.js (`packs.X.codes = countries...`) are
+evaluated here the same way the browser does: either every country or
+the countries of one continent.
+"""
+
+import json
+import re
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+COUNTRIES_JS = PROJECT_ROOT / "countries.js"
+CHALLENGES_JS = PROJECT_ROOT / "challenges.js"
+
+_COUNTRY = re.compile(r'\{ code: "([\w-]+)", name: "((?:[^"\\]|\\.)*)", continent: "([^"]+)"')
+_PACK = re.compile(r'(\w+): \{\s*name: "([^"]*)",\s*codes: \[(.*?)\]', re.S)
+_DYNAMIC_PACK = re.compile(
+    r'packs\.(\w+)\.codes = countries'
+    r'(?:\.filter\(c => c\.continent === "([^"]+)"\))?'
+    r'\.map\(c => c\.code\);'
+)
+_CHALLENGE = re.compile(
+    r'\{ (?:id: (\d+), )?type: "(\w+)", (?:codes: \[(.*?)\]|range: \[(\d+), ?(\d+)\]), '
+    r'questionsShown: (\d+), passPercent: (\d+) \}'
+)
+_CODE = re.compile(r'"([\w-]+)"')
+_RECORD = re.compile(r'^\s*\{ (.*) \},?$', re.M)
+_FIELD = re.compile(r'(\w+): ("(?:[^"\\]|\\.)*"|[^,]+)')
+
+
+def _section(text, start, path):
+    begin = text.find(start)
+    if begin < 0:
+        raise RuntimeError(f"Unable to find '{start}' in {path}")
+    end = text.find("\n};", begin) if start.endswith("{") else text.find("\n];", begin)
+    return text[begin:end]
+
+
+def load_countries(path=COUNTRIES_JS):
+    """[{code, name, continent}] in countries.js order."""
+    text = _section(Path(path).read_text(encoding="utf-8"), "export const countries = [", path)
+    return [
+        {"code": code, "name": name, "continent": continent}
+        for code, name, continent in _COUNTRY.findall(text)
+    ]
+
+
+def load_country_records(path=COUNTRIES_JS):
+    """Every field of every country in countries.js, in order (as sync_countries.py writes them)."""
+    text = _section(Path(path).read_text(encoding="utf-8"), "export const countries = [", path)
+    return [
+        {key: json.loads(value) for key, value in _FIELD.findall(fields)}
+        for fields in _RECORD.findall(text)
+    ]
+
+
+def load_packs(path=COUNTRIES_JS):
+    """{pack_id: {"name": ..., "codes": [...]}} including the dynamic packs."""
+    text = Path(path).read_text(encoding="utf-8")
+    packs = {
+        pack_id: {"name": name, "codes": _CODE.findall(codes)}
+        for pack_id, name, codes in _PACK.findall(_section(text, "export const packs = {", path))
+    }
+    countries = load_countries(path)
+    for pack_id, continent in _DYNAMIC_PACK.findall(text):
+        if pack_id not in packs:
+            raise RuntimeError(f"Dynamic pack '{pack_id}' is not declared in {path}")
+        packs[pack_id]["codes"] = [
+            c["code"] for c in countries if not continent or c["continent"] == continent
+        ]
+    return packs
+
+
+def load_challenges(path=CHALLENGES_JS):
+    """
+    progressionChallenges as a list of dicts, in order. A review written as
+    `range: [first id, last id]` gets the codes of every challenge in that
+    range, the same way challenges.js expands it.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    # Generated files list challenges in `challenges` and export the expanded copy
+    start = "const challenges = [" if "const challenges = [" in text else "export const progressionChallenges = ["
+    text = _section(text, start, path)
+    challenges = []
+    for cid, kind, codes, first, last, shown, percent in _CHALLENGE.findall(text):
+        challenge = {"type": kind, "codes": _CODE.findall(codes)}
+        if cid:
+            challenge["id"] = int(cid)
+        if first:
+            challenge["range"] = [int(first), int(last)]
+        challenge.update(questionsShown=int(shown), passPercent=int(percent))
+        challenges.append(challenge)
+
+    index = {c["id"]: i for i, c in enumerate(challenges) if "id" in c}
+    for challenge in challenges:
+        if "range" in challenge:
+            first, last = challenge["range"]
+            if first not in index or last not in index:
+                raise RuntimeError(f"Challenge {challenge.get('id')} references an unknown range in {path}")
+            covered = challenges[index[first]:index[last] + 1]
+            challenge["codes"] = [code for c in covered if "range" not in c for code in c["codes"]]
+    return challenges
+
+
+def progression_chunks(challenges):
+    """
+    Split challenges into chunks that each end with a review challenge.
+    Chunk n holds the challenges after the n-th review, so a challenge's
+    chunk is the number of reviews before it.
+    """
+    chunks = [[]]
+    for challenge in challenges:
+        chunks[-1].append(challenge)
+        if challenge["type"] == "review":
+            chunks.append([])
+    return [chunk for chunk in chunks if chunk]
@@ -1,56 +1,11 @@
 import argparse
-import json
-import os
-import re
+import time
 from pathlib import Path
-from urllib import request
-
-
-def load_env(env_path):
-    env = {}
-    if not env_path.exists():
-        return env
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
-
-
-def extract_pack_codes(countries_js_path):
-    text = countries_js_path.read_text(encoding="utf-8")
-    match = re.search(r"const packs = \{(.*?)\};", text, re.S)
-    if not match:
-        raise RuntimeError("Unable to find packs in countries.js")
-    codes = set(re.findall(r'"([a-z]{2})"', match.group(1)))
-    return sorted(codes)
-
-
-def fetch_country_names():
-    url = "https://flagcdn.com/en/codes.json"
-    with request.urlopen(url) as response:
-        return json.loads(response.read().decode("utf-8"))
-
-
-def synthesize(text, out_path, api_key, voice_id, model_id, force=False):
-    if out_path.exists() and not force:
-        return False
-    payload = {
-        "text": text,
-        "model_id": model_id,
-        "voice_settings": {"stability": 0.35, "similarity_boost": 0.8},
-    }
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, method="POST")
-    req.add_header("Accept", "audio/mpeg")
-    req.add_header("Content-Type", "application/json")
-    req.add_header("xi-api-key", api_key)
-    with request.urlopen(req) as response:
-        out_path.write_bytes(response.read())
-    return True
+
+import audio
+from http_cache import HTTPCache
+from process_audio import add_processing_args, make_processor
+from tracing import add_profile_args, span, start_profile
 
 
 def parse_args():
@@ -70,78 +25,132 @@ def parse_args():
         nargs="+",
         help="Specific country codes to generate (e.g., --codes cu kw). If omitted, generates for all pack codes.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of parallel TTS requests (default: 4).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Maximum TTS requests per second across all workers, 0 for no limit (default: 2).",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=5,
+        help="Retries with exponential backoff on 429/5xx responses (default: 5).",
+    )
+    parser.add_argument(
+        "--api-base",
+        help="TTS API base URL, e.g. a local stub server (default: ELEVEN_LABS_API_BASE or ElevenLabs).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Content-addressed audio cache directory (default: .audio_cache in the project root).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the audio cache and decide only by whether the output file exists.",
+    )
+    parser.add_argument(
+        "--adopt-existing",
+        action="store_true",
+        help="Record output files missing from the cache index as current instead of regenerating them "
+             "(the default when there is no index yet; --force regenerates everything).",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Read country names only from the local HTTP cache or checked-in fixtures.",
+    )
+    parser.add_argument(
+        "--post-process",
+        action="store_true",
+        help="Trim silence, normalize loudness and re-encode the files afterwards (needs ffmpeg).",
+    )
+    add_processing_args(parser)
+    add_profile_args(parser)
     return parser.parse_args()
 
 
-def build_phrase_list():
-    phrases = [
-        ("question.mp3", "What country is this?"),
-        ("correct.mp3", "That is correct, Savva!"),
-        ("correct_alt1.mp3", "Good job, Savva!"),
-        ("correct_alt2.mp3", "Well done, Savva!"),
-        ("incorrect.mp3", "Not quite right..."),
-        ("congrats.mp3", "Congratulations, Savva!"),
-        ("try_again.mp3", "Good luck next time!"),
-    ]
-    for score in range(0, 11):
-        phrases.append((f"score_{score}.mp3", f"Your score is {score}."))
-    return phrases
-
-
 def main():
     root = Path(__file__).resolve().parents[1]
     args = parse_args()
-    env = load_env(root / ".env")
-    api_key = env.get("ELEVEN_LABS_API") or os.getenv("ELEVEN_LABS_API")
-    if not api_key:
-        raise SystemExit("Missing ELEVEN_LABS_API in .env or environment.")
+    start_profile(args.profile)
+    processor = make_processor(args) if args.post_process else None
+    api_key, model_id, api_base = audio.load_settings(root, args.api_base)
 
     voice_id = args.voice_id
-    model_id = env.get("ELEVEN_LABS_MODEL_ID") or os.getenv(
-        "ELEVEN_LABS_MODEL_ID", "eleven_multilingual_v2"
+    client = audio.TTSClient(
+        api_key,
+        voice_id,
+        model_id,
+        api_base=api_base,
+        rate=args.rate,
+        max_retries=args.max_retries,
     )
 
     # Use specific codes if provided, otherwise extract from packs
     if args.codes:
         codes_to_generate = args.codes
     else:
-        codes_to_generate = extract_pack_codes(root / "countries.js")
+        codes_to_generate = audio.extract_pack_codes(root / "countries.js")
 
-    country_names = fetch_country_names()
+    country_names = audio.fetch_country_names(HTTPCache(offline=args.offline))
 
-    audio_dir = root / "assets" / "audio" / voice_id
+    # Vite serves public/ at the site root, so the game's assets/audio/<voice>
+    # URLs resolve here; the old root-level assets/audio was never served.
+    audio_dir = root / "public" / "assets" / "audio" / voice_id
     audio_dir.mkdir(parents=True, exist_ok=True)
 
-    created = 0
+    cache = None
+    if not args.no_cache:
+        cache = audio.AudioCache(Path(args.cache_dir) if args.cache_dir else root / ".audio_cache", root,
+                                  adopt_existing=args.adopt_existing or None)
 
-    # Only generate phrase files if not using specific codes
-    if not args.codes:
-        for filename, phrase in build_phrase_list():
-            if synthesize(
-                phrase,
-                audio_dir / filename,
-                api_key,
-                voice_id,
-                model_id,
-                force=args.force,
-            ):
-                created += 1
+    def items():
+        # Only generate phrase files if not using specific codes
+        if not args.codes:
+            yield from audio.build_phrase_list()
+        yield from audio.resolve_names(audio.source_codes(codes_to_generate), country_names)
 
-    for code in codes_to_generate:
-        name = country_names.get(code)
-        if not name:
-            continue
-        if synthesize(
-            name,
-            audio_dir / f"{code}.mp3",
-            api_key,
-            voice_id,
-            model_id,
-            force=args.force,
-        ):
-            created += 1
+    created = 0
+    outputs = []
+    started = time.perf_counter()
+    try:
+        for job in audio.run(items(), audio_dir, client, cache, args.force, args.concurrency):
+            if job.error:
+                print(f"  Error: {job.out_path.name}: {job.error}")
+                continue
+            outputs.append(job.out_path)
+            if job.status != audio.SKIPPED:
+                created += 1
+    finally:
+        if cache:
+            cache.save()
+    elapsed = time.perf_counter() - started
 
     print(f"Audio files created: {created}")
+    if cache:
+        print(f"Synthesized: {cache.misses}, reused from cache: {cache.hits}")
+        if cache.adopted:
+            print(f"Adopted {cache.adopted} existing files into the cache index")
+    if created:
+        print(f"Elapsed: {elapsed:.1f}s ({created / elapsed:.1f} files/s)")
+
+    if processor:
+        # Files processed earlier with the same settings are skipped by hash
+        store = audio.ProcessedStore(Path(args.cache_dir) if args.cache_dir else root / ".audio_cache", root)
+        print("\nPost-processing:")
+        try:
+            with span("post-process", items=len(outputs)):
+                audio.print_report(audio.process_files(outputs, processor, store, args.workers))
+        finally:
+            store.save()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Generate challenges.js (the progression path) from the ranked country data.
+
+Countries in countries.js are ordered by the keys in challenge_spec.json
+(by default their overall rank from compute_ranks.py, then name) and split
+into regular challenges of `chunkSize` countries, with a review after every
+`reviewEvery` regular ones. A review is written as a range of challenge ids,
+`range: [first, last]`, and challenges.js expands it into the codes of that
+range instead of repeating them.
+
+Every challenge has an id, and the page saves progress by id. Ids never
+change once published:
+  - by default the existing challenges are kept as they are, countries that
+    are no longer in the game are dropped from them, and new countries are
+    appended in rank order as new challenges;
+  - --rebuild orders every country again from the ranks, reusing the id of
+    any previous challenge with the same countries.
+
+Usage:
+    python3 scripts/generate_challenges.py [--rebuild] [--dry-run]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from game_data import CHALLENGES_JS, load_challenges, load_countries
+from tracing import add_profile_args, span, start_profile
+
+SCRIPT_DIR = Path(__file__).parent
+SPEC_FILE = SCRIPT_DIR / "challenge_spec.json"
+RANKED_FILE = SCRIPT_DIR / "country_data_ranked.json"
+
+HEADER = """\
+// Generated by scripts/generate_challenges.py from scripts/challenge_spec.json
+// and the country ranks; run it instead of editing this file.
+// Countries ordered by rank, grouped into chunks of {chunk_size} with a review
+// challenge after every {review_every} regular ones. Player progress in localStorage
+// references challenges by id, and ids are kept when this file is regenerated.
+"""
+
+FOOTER = """\
+
+// A review covers every regular challenge from id range[0] through range[1]
+const position = new Map(challenges.map((ch, i) => [ch.id, i]));
+export const progressionChallenges = challenges.map((ch) => {
+  if (!ch.range) return ch;
+  const covered = challenges.slice(position.get(ch.range[0]), position.get(ch.range[1]) + 1);
+  return { ...ch, codes: covered.filter((c) => !c.range).flatMap((c) => c.codes) };
+});
+"""
+
+
+def ranked_codes(spec, ranked_path=RANKED_FILE):
+    """Game country codes in spec order; countries without a value sort last."""
+    game = {c["code"] for c in load_countries()}
+    with open(ranked_path, "r") as f:
+        records = [r for r in json.load(f) if r["code"] in game]
+    missing = game - {r["code"] for r in records}
+    if missing:
+        raise SystemExit(f"No ranked data for {', '.join(sorted(missing))}; run compute_ranks.py")
+    keys = spec["order"]
+    records.sort(key=lambda r: [(r.get(k) is None, r.get(k) or 0) for k in keys])
+    return [r["code"] for r in records]
+
+
+class ChallengePlan:
+    """Builds the challenge list, handing out ids and closing chunks with reviews."""
+
+    def __init__(self, spec, previous=()):
+        self.spec = spec
+        self.challenges = []
+        self.pending = []  # regular challenges since the last review
+        # Previous ids by (type, countries), so unchanged challenges keep theirs
+        self.previous = {(c["type"], frozenset(c["codes"])): c["id"] for c in previous}
+        self.next_id = max((c["id"] for c in previous), default=0) + 1
+
+    def _id(self, kind, codes):
+        cid = self.previous.pop((kind, frozenset(codes)), None)
+        if cid is None:
+            cid, self.next_id = self.next_id, self.next_id + 1
+        return cid
+
+    def add(self, challenge):
+        self.challenges.append(challenge)
+        if challenge["type"] == "review":
+            self.pending = []
+        else:
+            self.pending.append(challenge)
+
+    def add_regular(self, codes, cid=None, questions=None, pass_percent=None):
+        self.add({
+            "id": cid or self._id("regular", codes),
+            "type": "regular",
+            "codes": codes,
+            "questionsShown": min(questions or len(codes), len(codes)),
+            "passPercent": pass_percent or self.spec["regular"]["passPercent"],
+        })
+
+    def add_review(self, cid=None, questions=None, pass_percent=None):
+        """Review every regular challenge so far."""
+        regulars = [c for c in self.challenges if c["type"] == "regular"]
+        codes = [code for c in regulars for code in c["codes"]]
+        self.add({
+            "id": cid or self._id("review", codes),
+            "type": "review",
+            "range": [regulars[0]["id"], regulars[-1]["id"]],
+            "codes": codes,
+            "questionsShown": questions or self.spec["review"]["questionsShown"],
+            "passPercent": pass_percent or self.spec["review"]["passPercent"],
+        })
+
+    def close_chunk(self):
+        if self.pending:
+            self.add_review()
+
+    def extend(self, codes):
+        size = self.spec["chunkSize"]
+        for i in range(0, len(codes), size):
+            self.add_regular(codes[i:i + size])
+            if len(self.pending) == self.spec["reviewEvery"]:
+                self.close_chunk()
+        self.close_chunk()
+
+
+def with_ids(challenges):
+    """Challenges from a file written before ids existed get ids in file order."""
+    if all("id" in c for c in challenges):
+        return challenges
+    return [{**c, "id": i} for i, c in enumerate(challenges, start=1)]
+
+
+def append_plan(spec, previous, codes):
+    """Keep the published challenges and append countries they do not cover yet."""
+    plan = ChallengePlan(spec, previous)
+    game = set(codes)
+    kept = set()
+    for c in previous:
+        settings = dict(cid=c["id"], questions=c["questionsShown"], pass_percent=c["passPercent"])
+        if c["type"] == "review":
+            # A review before any surviving regular challenge has nothing to cover
+            if any(ch["type"] == "regular" for ch in plan.challenges):
+                plan.add_review(**settings)
+            continue
+        remaining = [code for code in c["codes"] if code in game]
+        if remaining:
+            plan.add_regular(remaining, **settings)
+            kept.update(remaining)
+    plan.extend([code for code in codes if code not in kept])
+    return plan.challenges
+
+
+def rebuild_plan(spec, previous, codes):
+    plan = ChallengePlan(spec, previous)
+    plan.extend(codes)
+    return plan.challenges
+
+
+def render(spec, challenges):
+    lines = [HEADER.format(chunk_size=spec["chunkSize"], review_every=spec["reviewEvery"])]
+    lines.append("const challenges = [")
+    for c in challenges:
+        if c["type"] == "review":
+            body = f'range: [{c["range"][0]}, {c["range"][1]}]'
+        else:
+            body = f'codes: {json.dumps(c["codes"], separators=(",", ":"))}'
+        lines.append(
+            f'  {{ id: {c["id"]}, type: "{c["type"]}", {body}, '
+            f'questionsShown: {c["questionsShown"]}, passPercent: {c["passPercent"]} }},'
+        )
+    lines.append("];")
+    return "\n".join(lines) + "\n" + FOOTER
+
+
+def print_changes(previous, challenges):
+    before = {c["id"]: c for c in previous}
+    after = {c["id"]: c for c in challenges}
+    added = [cid for cid in after if cid not in before]
+    removed = [cid for cid in before if cid not in after]
+    changed = [cid for cid in after if cid in before and after[cid]["codes"] != before[cid]["codes"]]
+    print(f"{len(challenges)} challenges ({sum(c['type'] == 'review' for c in challenges)} reviews)")
+    print(f"  added: {len(added)}, removed: {len(removed)}, changed: {len(changed)}")
+    for cid in changed:
+        if after[cid]["type"] == "regular":
+            print(f"  {cid}: {','.join(before[cid]['codes'])} -> {','.join(after[cid]['codes'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate challenges.js from country ranks")
+    parser.add_argument("--spec", type=Path, default=SPEC_FILE,
+                        help="Challenge spec (default: scripts/challenge_spec.json)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Reorder every country by rank instead of appending new ones")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report the changes without writing challenges.js")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    spec = json.loads(args.spec.read_text(encoding="utf-8"))
+    codes = ranked_codes(spec)
+    previous = with_ids(load_challenges()) if CHALLENGES_JS.exists() else []
+
+    plan = rebuild_plan if args.rebuild else append_plan
+    with span("plan", items=len(codes)):
+        challenges = plan(spec, previous, codes)
+    print_changes(previous, challenges)
+
+    content = render(spec, challenges)
+    if args.dry_run:
+        return
+    CHALLENGES_JS.write_text(content, encoding="utf-8")
+    print(f"Wrote {CHALLENGES_JS} ({len(content.encode('utf-8')):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
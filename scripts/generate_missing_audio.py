@@ -1,44 +1,10 @@
 import argparse
-import json
-import os
 from pathlib import Path
-from urllib import request
-
-
-def load_env(env_path):
-    env = {}
-    if not env_path.exists():
-        return env
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        env[key.strip()] = value.strip().strip('"').strip("'")
-    return env
-
-
-def fetch_country_names():
-    url = "https://flagcdn.com/en/codes.json"
-    with request.urlopen(url) as response:
-        return json.loads(response.read().decode("utf-8"))
-
-
-def synthesize(text, out_path, api_key, voice_id, model_id):
-    payload = {
-        "text": text,
-        "model_id": model_id,
-        "voice_settings": {"stability": 0.35, "similarity_boost": 0.8},
-    }
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, method="POST")
-    req.add_header("Accept", "audio/mpeg")
-    req.add_header("Content-Type", "application/json")
-    req.add_header("xi-api-key", api_key)
-    with request.urlopen(req) as response:
-        out_path.write_bytes(response.read())
-    return True
+
+import audio
+from http_cache import HTTPCache
+from process_audio import add_processing_args, make_processor
+from tracing import add_profile_args, span, start_profile
 
 
 def parse_args():
@@ -58,44 +24,150 @@ def parse_args():
         required=True,
         help="Comma-separated list of country codes to generate.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of parallel TTS requests (default: 1).",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=2.0,
+        help="Maximum TTS requests per second across all workers, 0 for no limit (default: 2).",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=5,
+        help="Retries with exponential backoff on 429/5xx responses (default: 5).",
+    )
+    parser.add_argument(
+        "--api-base",
+        help="TTS API base URL, e.g. a local stub server (default: ELEVEN_LABS_API_BASE or ElevenLabs).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Content-addressed audio cache directory (default: .audio_cache in the project root).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API instead of reusing identical cached requests.",
+    )
+    parser.add_argument(
+        "--adopt-existing",
+        action="store_true",
+        help="Record output files missing from the cache index as current instead of regenerating them "
+             "(the default when there is no index yet; --force regenerates everything).",
+    )
+    parser.add_argument(
+        "--journal",
+        help="Job journal file (default: .audio_jobs/<voice-id>.jsonl in the project root).",
+    )
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue a previous run, skipping codes the journal records as done.",
+    )
+    group.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Only regenerate codes the journal records as failed.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Read country names only from the local HTTP cache or checked-in fixtures.",
+    )
+    parser.add_argument(
+        "--post-process",
+        action="store_true",
+        help="Trim silence, normalize loudness and re-encode the files afterwards (needs ffmpeg).",
+    )
+    add_processing_args(parser)
+    add_profile_args(parser)
     return parser.parse_args()
 
 
 def main():
     root = Path(__file__).resolve().parents[1]
     args = parse_args()
-    env = load_env(root / ".env")
-    api_key = env.get("ELEVEN_LABS_API") or os.getenv("ELEVEN_LABS_API")
-    if not api_key:
-        raise SystemExit("Missing ELEVEN_LABS_API in .env or environment.")
+    start_profile(args.profile)
+    processor = make_processor(args) if args.post_process else None
+    api_key, model_id, api_base = audio.load_settings(root, args.api_base)
 
     voice_id = args.voice_id
-    model_id = env.get("ELEVEN_LABS_MODEL_ID") or os.getenv(
-        "ELEVEN_LABS_MODEL_ID", "eleven_multilingual_v2"
+    client = audio.TTSClient(
+        api_key,
+        voice_id,
+        model_id,
+        api_base=api_base,
+        rate=args.rate,
+        max_retries=args.max_retries,
     )
 
-    codes = [c.strip() for c in args.codes.split(",")]
-    country_names = fetch_country_names()
+    codes = list(audio.source_codes(args.codes.split(",")))
+    country_names = audio.fetch_country_names(HTTPCache(offline=args.offline))
 
     audio_dir = Path(args.output_dir)
     audio_dir.mkdir(parents=True, exist_ok=True)
 
+    cache = None
+    if not args.no_cache:
+        cache = audio.AudioCache(Path(args.cache_dir) if args.cache_dir else root / ".audio_cache", root,
+                                  adopt_existing=args.adopt_existing or None)
+
+    journal_path = Path(args.journal) if args.journal else root / ".audio_jobs" / f"{voice_id}.jsonl"
+    journal = audio.JobJournal(journal_path, fresh=not (args.resume or args.retry_failed))
+    selected = journal.select(codes, resume=args.resume, retry_failed=args.retry_failed)
+    if len(selected) < len(codes):
+        print(f"Journal {journal_path}: {len(codes) - len(selected)} codes already handled")
+    journal.pending(selected)
+
+    def on_missing(code):
+        print(f"Skipping {code}: name not found")
+        journal.fail(code, "name not found")
+
+    # Without the cache every selected code is regenerated, as before; with it,
+    # outputs already built from the same request are left alone.
+    force = args.no_cache
+    items = audio.resolve_names(selected, country_names, on_missing)
     created = 0
-    total = len(codes)
-    for i, code in enumerate(codes, 1):
-        name = country_names.get(code)
-        if not name:
-            print(f"[{i}/{total}] Skipping {code}: name not found")
-            continue
-        out_path = audio_dir / f"{code}.mp3"
-        print(f"[{i}/{total}] Generating {code} ({name})...")
-        try:
-            synthesize(name, out_path, api_key, voice_id, model_id)
-            created += 1
-        except Exception as e:
-            print(f"  Error: {e}")
+    outputs = []
+    total = len(selected)
+    try:
+        for i, job in enumerate(
+            audio.run(items, audio_dir, client, cache, force, args.concurrency, journal), 1
+        ):
+            if job.error:
+                print(f"[{i}/{total}] {job.name} ({job.text}): Error: {job.error}")
+            else:
+                outputs.append(job.out_path)
+                if job.status != audio.SKIPPED:
+                    created += 1
+                print(f"[{i}/{total}] {job.name} ({job.text}): {job.status} in {job.latency:.2f}s")
+    finally:
+        if cache:
+            cache.save()
+        journal.close()
+        journal.summary(codes)
 
     print(f"\nAudio files created: {created}/{total}")
+    if cache:
+        print(f"Synthesized: {cache.misses}, reused from cache: {cache.hits}")
+        if cache.adopted:
+            print(f"Adopted {cache.adopted} existing files into the cache index")
+
+    if processor:
+        store = audio.ProcessedStore(Path(args.cache_dir) if args.cache_dir else root / ".audio_cache", root)
+        print("\nPost-processing:")
+        try:
+            with span("post-process", items=len(outputs)):
+                audio.print_report(audio.process_files(outputs, processor, store, args.workers))
+        finally:
+            store.save()
 
 
 if __name__ == "__main__":
@@ -3,17 +3,65 @@
 Generate sw.js (service worker) based on actual assets in the project.
 This ensures the cache list stays in sync with the actual files.
 
+Every precached file is listed with its SRI integrity (a SHA-256 hash),
+which the worker uses as the entry's revision, passes to fetch and checks
+cached copies against before trusting them. The worker keeps precached
+entries across versions and on install only downloads entries whose hash
+changed, so a version bump no longer refetches every flag and audio file.
+The page, which Vite rebuilds, has a hex revision of its sources instead.
+Hashes are cached by mtime and size in .asset_hashes.json.
+
+When scripts/optimize_flags.py has built flag variants, only the default
+variant of each flag is precached instead of the full-size PNG; other
+variants are cached at runtime and fall back to it offline.
+
+Flags and name audio are grouped per pack and per progression chunk (read
+from countries.js and challenges.js). Install precaches the core files and
+INSTALL_GROUPS only; the page asks the worker to warm other groups when
+they are picked or when it is idle. Files no pack or challenge uses, such
+as the US state flags, are left out.
+
+The worker fetches data/index.json from the network first, falling back
+to the last copy offline; other files are served cache-first.
+
+When scripts/build_audio_sprites.py has built audio sprites (and app.js
+loads sprites.json), the sprites are precached instead of the clips they
+contain: the phrases sprite with the core files, and a pack sprite with
+every group that has one of its countries.
+
 Usage:
-    python3 scripts/generate_sw.py [--version X.Y.Z]
+    python3 scripts/generate_sw.py [--version X.Y.Z] [--full-flags]
 """
 
-import os
 import argparse
+import hashlib
+import json
 from pathlib import Path
 
+from analyze_assets import build_graph
+from asset_hashes import HashIndex
+from game_data import load_challenges, load_packs, progression_chunks
+from tracing import add_profile_args, span, start_profile
+
 # Project root (parent of scripts folder)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Static files Vite serves from the site root
+PUBLIC_DIR = PROJECT_ROOT / "public"
+
+# Length of the page's hex revision
+REVISION_LENGTH = 12
+
+# Sources Vite bundles into the page; the built index.html changes whenever
+# any of them does, so its revision covers all of them. The data modules are
+# the pinned copies, which a data-only release leaves alone
+BUNDLE_SOURCES = ["index.html", "app.js", "styles.css", "options.js", "data_updates.js",
+                  "pinned/countries.js", "pinned/challenges.js", "pinned/distractors.js"]
+
+# Groups precached on install: the first progression chunk, which has the
+# same countries as the default World Top 20 pack
+INSTALL_GROUPS = ["progression:0"]
+
 # Voice ID for audio files
 VOICE_ID = "kPzsL2i3teMYv0FxEYQ6"
 
@@ -26,17 +74,119 @@ def get_files_in_dir(directory: Path, extension: str) -> list[str]:
     return sorted(files)
 
 
-def generate_sw_content(version: str) -> str:
-    """Generate the complete sw.js content."""
-
+def asset_path(url: str) -> Path:
+    """Map a './...' precache URL to the file it is served from."""
+    rel = url[2:] or "index.html"
+    public = PUBLIC_DIR / rel
+    return public if public.exists() else PROJECT_ROOT / rel
+
+
+def page_revision(hash_index: HashIndex) -> str:
+    digest = hashlib.sha256()
+    for name in BUNDLE_SOURCES:
+        path = PROJECT_ROOT / name
+        if path.exists():
+            digest.update(hash_index.hash(path).encode())
+    return digest.hexdigest()[:REVISION_LENGTH]
+
+
+def manifest_entries(urls: list[str], hash_index: HashIndex) -> list[dict]:
+    """
+    Attach the SRI integrity to each URL; missing files are skipped. The
+    page has a revision of its sources instead, as Vite rebuilds it.
+    """
+    entries = []
+    for url in urls:
+        if url in ("./", "./index.html"):
+            entries.append({"url": url, "revision": page_revision(hash_index)})
+            continue
+        path = asset_path(url)
+        if not path.exists():
+            print(f"  Warning: {url} not found, not precached")
+            continue
+        entries.append({"url": url, "integrity": hash_index.integrity(path)})
+    return entries
+
+
+def js_manifest(name: str, entries: list[dict], comment: str = None) -> list[str]:
+    lines = [f"// {comment}"] if comment else []
+    lines.append(f"const {name} = [")
+    for i, entry in enumerate(entries):
+        comma = "," if i < len(entries) - 1 else ""
+        lines.append(f"  {json.dumps(entry)}{comma}")
+    lines.append("];")
+    lines.append("")
+    return lines
+
+
+def load_flag_variants(flags_dir: Path, full_flags: bool = False) -> dict | None:
+    """variants.json from optimize_flags.py, or None to precache the original PNGs."""
+    manifest_path = flags_dir / "variants.json"
+    if full_flags or not manifest_path.exists():
+        return None
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def flag_url(code: str, variants: dict | None) -> str:
+    if variants and code in variants["flags"]:
+        default = variants["default"]
+        return f"./assets/flags/{default['width']}/{code}.{default['format']}"
+    return f"./assets/flags/{code}.png"
+
+
+def load_sprites(voice_dir: Path, graph) -> dict | None:
+    """sprites.json from build_audio_sprites.py, if the page uses it."""
+    manifest_path = voice_dir / "sprites.json"
+    rel = manifest_path.relative_to(PUBLIC_DIR).as_posix()
+    if rel not in graph.refs or not manifest_path.exists():
+        return None
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
+
+
+def sprite_urls(sprites: dict | None) -> dict[str, str]:
+    """{clip name: URL of the sprite it plays from}; like app.js, the first sprite with a clip wins."""
+    urls = {}
+    for sprite in (sprites or {"sprites": {}})["sprites"].values():
+        for name in sprite["clips"]:
+            urls.setdefault(name, f"./assets/audio/{VOICE_ID}/{sprite['file']}")
+    return urls
+
+
+def asset_groups(packs: dict, challenges: list[dict]) -> dict[str, list[str]]:
+    """
+    Country codes per group: 'progression:N' for each progression chunk
+    (only codes not introduced by an earlier chunk), then 'pack:<id>'.
+    """
+    groups = {}
+    seen = set()
+    for i, chunk in enumerate(progression_chunks(challenges)):
+        codes = list(dict.fromkeys(code for ch in chunk for code in ch["codes"] if code not in seen))
+        seen.update(codes)
+        groups[f"progression:{i}"] = codes
+    for pack_id, pack in packs.items():
+        groups[f"pack:{pack_id}"] = pack["codes"]
+    return groups
+
+
+def build_manifest(hash_index: HashIndex, full_flags: bool = False) -> dict:
+    """
+    Collect the precache manifest:
+      core       entries installed up front
+      countries  {code: [flag entry, name audio entry]} for referenced codes;
+                 the audio entry is left out if a sprite has the clip
+      groups     {group: [codes]} warmed on demand
+      sprites    {group: [sprite entries]} for the groups' clips in sprites
+      excluded   asset files that nothing references
+    """
     # Paths
-    flags_dir = PROJECT_ROOT / "assets" / "flags"
-    images_dir = PROJECT_ROOT / "assets" / "images"
-    audio_root = PROJECT_ROOT / "assets" / "audio"
+    flags_dir = PUBLIC_DIR / "assets" / "flags"
+    images_dir = PUBLIC_DIR / "assets" / "images"
+    audio_root = PUBLIC_DIR / "assets" / "audio"
     voice_dir = audio_root / VOICE_ID
-    icons_dir = PROJECT_ROOT / "assets" / "icons"
+    icons_dir = PUBLIC_DIR / "assets" / "icons"
 
     # Collect assets
+    variants = load_flag_variants(flags_dir, full_flags)
     flag_files = get_files_in_dir(flags_dir, ".png")
     image_files = get_files_in_dir(images_dir, ".png")
     icon_files = get_files_in_dir(icons_dir, ".png")
@@ -47,91 +197,269 @@ def generate_sw_content(version: str) -> str:
     score_files = sorted([f for f in voice_audio_files if f.startswith("score_")],
                          key=lambda x: int(x.replace("score_", "").replace(".mp3", "")))
     system_audio = [f for f in voice_audio_files if f in ["question.mp3", "congrats.mp3"]]
-    country_audio = [f for f in voice_audio_files
-                     if f not in score_files and f not in system_audio]
 
-    # Build the file content
+    # Core assets (app.js, styles.css and countries.js are bundled by Vite
+    # into hashed files, so they are cached at runtime instead)
+    core = ["./", "./index.html", "./manifest.json"]
+    if variants:
+        core.append("./assets/flags/variants.json")
+    core += [f"./assets/icons/{icon}" for icon in icon_files]
+    core += [f"./assets/images/{img}" for img in image_files]
+    core += [f"./assets/audio/{audio}" for audio in root_audio_files]
+    # Voice system audio (question, congrats) and score audio files
+    core += [f"./assets/audio/{VOICE_ID}/{audio}" for audio in sorted(system_audio)]
+    core += [f"./assets/audio/{VOICE_ID}/{score}" for score in score_files]
+
+    # Leave out images and sounds the page never loads (see analyze_assets.py)
+    graph, _ = build_graph()
+    unused = [url for url in core if url.startswith("./assets/") and url[2:] not in graph.refs]
+    core = [url for url in core if url not in unused]
+
+    # Clips in a sprite are precached as the sprite
+    sprites = load_sprites(voice_dir, graph)
+    in_sprite = sprite_urls(sprites)
+    if sprites:
+        core.append(f"./assets/audio/{VOICE_ID}/sprites.json")
+        core = list(dict.fromkeys(
+            in_sprite.get(Path(url).stem, url) if url.startswith(f"./assets/audio/{VOICE_ID}/") else url
+            for url in core
+        ))
+
+    groups = asset_groups(load_packs(PROJECT_ROOT / "countries.js"),
+                          load_challenges(PROJECT_ROOT / "challenges.js"))
+    codes = sorted({code for group in groups.values() for code in group})
+    countries = {
+        code: manifest_entries(
+            [flag_url(code, variants)]
+            + ([] if code in in_sprite else [f"./assets/audio/{VOICE_ID}/{code}.mp3"]),
+            hash_index,
+        )
+        for code in codes
+    }
+    group_sprites = {}
+    for name, group_codes in groups.items():
+        urls = list(dict.fromkeys(in_sprite[code] for code in group_codes if code in in_sprite))
+        if urls:
+            group_sprites[name] = manifest_entries(urls, hash_index)
+
+    referenced = set(codes)
+    excluded = unused + [f"./assets/flags/{f}" for f in flag_files if f[:-len(".png")] not in referenced]
+    excluded += [f"./assets/audio/{VOICE_ID}/{f}" for f in voice_audio_files
+                 if f not in score_files and f not in system_audio and f[:-len(".mp3")] not in referenced]
+
+    return {
+        "core": manifest_entries(core, hash_index),
+        "countries": countries,
+        "groups": groups,
+        "sprites": group_sprites,
+        "excluded": excluded,
+    }
+
+
+def render_sw(version: str, manifest: dict) -> str:
     lines = []
-    lines.append(f"const CACHE_NAME = 'flag-game-{version}';")
+    lines.append(f"const VERSION = '{version}';")
+    lines.append("const PRECACHE = 'flag-game-precache';")
+    lines.append("const RUNTIME_CACHE = `flag-game-runtime-${VERSION}`;")
     lines.append("")
+    lines += js_manifest("CORE_ASSETS", manifest["core"])
 
-    # Core assets
-    lines.append("const CORE_ASSETS = [")
-    lines.append("  './',")
-    lines.append("  './index.html',")
-    lines.append("  './styles.css',")
-    lines.append("  './app.js',")
-    lines.append("  './countries.js',")
-    lines.append("  './manifest.json',")
-
-    # Icons
-    for icon in icon_files:
-        lines.append(f"  './assets/icons/{icon}',")
-
-    # Images
-    for img in image_files:
-        lines.append(f"  './assets/images/{img}',")
-
-    # Root audio files
-    for audio in root_audio_files:
-        lines.append(f"  './assets/audio/{audio}',")
-
-    # Voice system audio (question, congrats)
-    for audio in sorted(system_audio):
-        lines.append(f"  './assets/audio/{VOICE_ID}/{audio}',")
-
-    # Score audio files
-    for score in score_files:
-        lines.append(f"  './assets/audio/{VOICE_ID}/{score}',")
-
-    # Remove trailing comma from last item
-    if lines[-1].endswith(","):
-        lines[-1] = lines[-1][:-1]
-    lines.append("];")
+    lines.append("// Flag and name audio for every country a pack or challenge uses")
+    lines.append("const COUNTRY_ASSETS = {")
+    for code, entries in manifest["countries"].items():
+        lines.append(f"  {json.dumps(code)}: [{', '.join(json.dumps(e) for e in entries)}],")
+    lines.append("};")
     lines.append("")
 
-    # Flag assets
-    lines.append("// All flag images")
-    lines.append("const PACK_FLAGS = [")
-    for i, flag in enumerate(flag_files):
-        comma = "," if i < len(flag_files) - 1 else ""
-        lines.append(f"  './assets/flags/{flag}'{comma}")
-    lines.append("];")
+    lines.append("// Country codes per progression chunk and per pack")
+    lines.append("const ASSET_GROUPS = {")
+    for name, codes in manifest["groups"].items():
+        lines.append(f"  {json.dumps(name)}: {json.dumps(codes)},")
+    lines.append("};")
     lines.append("")
-
-    # Country audio
-    lines.append("// All country name audio files")
-    lines.append("const COUNTRY_AUDIO = [")
-    for i, audio in enumerate(country_audio):
-        comma = "," if i < len(country_audio) - 1 else ""
-        lines.append(f"  './assets/audio/{VOICE_ID}/{audio}'{comma}")
-    lines.append("];")
+    lines.append("// Audio sprites holding the name clips of each group's countries")
+    lines.append("const GROUP_ASSETS = {")
+    for name, entries in manifest["sprites"].items():
+        lines.append(f"  {json.dumps(name)}: [{', '.join(json.dumps(e) for e in entries)}],")
+    lines.append("};")
+    lines.append("")
+    lines.append(f"const INSTALL_GROUPS = {json.dumps(INSTALL_GROUPS)};")
     lines.append("")
 
     # Service worker logic
-    lines.append("""self.addEventListener('install', (event) => {
+    lines.append(SW_LOGIC)
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_sw_content(version: str, hash_index: HashIndex = None, full_flags: bool = False) -> str:
+    """Generate the complete sw.js content."""
+    return render_sw(version, build_manifest(hash_index or HashIndex(), full_flags))
+
+
+# Precached responses are stored under '<url>?__rev=<revision>', where the
+# revision is the page's source hash or the file's integrity, so an entry
+# whose file did not change keeps its cache key across versions and is not
+# downloaded again. Keys not in the current manifest are removed on activate.
+#
+# Install only fetches CORE_ASSETS and INSTALL_GROUPS. The page posts
+# {type: 'warm', groups: [...]} when a pack or challenge is picked, and
+# {type: 'warm-idle'} once it is idle; both feed one queue that a fixed
+# number of workers drain, with on-demand groups jumping the queue.
+SW_LOGIC = """const WARM_CONCURRENCY = 4;
+
+const groupEntries = (name) => [
+  ...(GROUP_ASSETS[name] || []),
+  ...(ASSET_GROUPS[name] || []).flatMap((code) => COUNTRY_ASSETS[code] || []),
+];
+const INSTALL_MANIFEST = [...CORE_ASSETS, ...INSTALL_GROUPS.flatMap(groupEntries)];
+const PRECACHE_MANIFEST = [
+  ...CORE_ASSETS,
+  ...Object.values(COUNTRY_ASSETS).flat(),
+  ...Object.values(GROUP_ASSETS).flat(),
+];
+
+const absoluteUrl = (url) => new URL(url, self.registration.scope).href;
+const revision = (entry) => entry.revision || encodeURIComponent(entry.integrity);
+const cacheKey = (entry) => `${absoluteUrl(entry.url)}?__rev=${revision(entry)}`;
+const precacheEntriesByUrl = new Map(PRECACHE_MANIFEST.map((entry) => [absoluteUrl(entry.url), entry]));
+
+// Every size and format of a flag falls back to its precached image offline
+const flagCode = (url) => url.pathname.match(/\\/assets\\/flags\\/(?:\\d+\\/)?([\\w-]+)\\.\\w+$/)?.[1];
+const precachedFlag = async (url) => {
+  const entry = COUNTRY_ASSETS[flagCode(url)]?.[0];
+  const response = entry && (await caches.open(PRECACHE).then((cache) => cache.match(cacheKey(entry))));
+  return response || Response.error();
+};
+
+// Entries carry the SRI hash of their file: downloads are checked against it
+// by fetch, and a cached copy that no longer matches (a truncated or corrupted
+// write) is dropped and downloaded again when its group is precached or warmed
+const base64Digest = async (response) => {
+  const body = await response.clone().arrayBuffer();
+  const digest = new Uint8Array(await crypto.subtle.digest('SHA-256', body));
+  return btoa(String.fromCharCode(...digest));
+};
+
+const cachedEntry = async (cache, entry) => {
+  const response = await cache.match(cacheKey(entry));
+  if (!response || !entry.integrity) return response;
+  if (`sha256-${await base64Digest(response)}` === entry.integrity) return response;
+  await cache.delete(cacheKey(entry));
+  return undefined;
+};
+
+const fetchEntry = async (cache, entry, options) => {
+  const init = entry.integrity ? { ...options, integrity: entry.integrity } : options;
+  const response = await fetch(entry.url, init);
+  if (!response.ok) throw new Error(`Precache failed for ${entry.url}: ${response.status}`);
+  await cache.put(cacheKey(entry), response.clone());
+  return response;
+};
+
+const precacheEntries = async (cache, entries) => {
+  const missing = [];
+  for (const entry of entries) {
+    if (!(await cachedEntry(cache, entry))) missing.push(entry);
+  }
+  await Promise.all(missing.map((entry) => fetchEntry(cache, entry, { cache: 'reload' })));
+  return missing.length;
+};
+
+// Background warming: a shared queue drained by WARM_CONCURRENCY workers
+const warmQueue = [];
+const warmingKeys = new Set();
+let warming = null;
+
+const drainWarmQueue = async () => {
+  const cache = await caches.open(PRECACHE);
+  const worker = async () => {
+    while (warmQueue.length) {
+      const entry = warmQueue.shift();
+      const key = cacheKey(entry);
+      if (warmingKeys.has(key)) continue;
+      warmingKeys.add(key);
+      // A failed entry is simply retried the next time its group is warmed
+      if (!(await cachedEntry(cache, entry))) await fetchEntry(cache, entry).catch(() => {});
+      warmingKeys.delete(key);
+    }
+  };
+  await Promise.all(Array.from({ length: WARM_CONCURRENCY }, worker));
+};
+
+const warm = (entries, urgent) => {
+  if (urgent) warmQueue.unshift(...entries);
+  else warmQueue.push(...entries);
+  warming = warming || drainWarmQueue().finally(() => { warming = null; });
+  return warming;
+};
+
+self.addEventListener('install', (event) => {
   event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => {
-      return cache.addAll([...CORE_ASSETS, ...PACK_FLAGS, ...COUNTRY_AUDIO]);
-    })
+    caches.open(PRECACHE).then((cache) => precacheEntries(cache, INSTALL_MANIFEST))
   );
   self.skipWaiting();
 });
 
 self.addEventListener('activate', (event) => {
+  const currentKeys = new Set(PRECACHE_MANIFEST.map(cacheKey));
   event.waitUntil(
-    caches.keys().then((cacheNames) => {
-      return Promise.all(
+    Promise.all([
+      caches.keys().then((cacheNames) => Promise.all(
         cacheNames
-          .filter((name) => name !== CACHE_NAME)
+          .filter((name) => name !== PRECACHE && name !== RUNTIME_CACHE)
           .map((name) => caches.delete(name))
-      );
-    })
+      )),
+      caches.open(PRECACHE).then(async (cache) => {
+        const requests = await cache.keys();
+        await Promise.all(
+          requests
+            .filter((request) => !currentKeys.has(request.url))
+            .map((request) => cache.delete(request))
+        );
+      }),
+    ])
   );
   self.clients.claim();
 });
 
+self.addEventListener('message', (event) => {
+  const { type, groups } = event.data || {};
+  if (type === 'warm') {
+    event.waitUntil(warm((groups || []).flatMap(groupEntries), true));
+  } else if (type === 'warm-idle') {
+    event.waitUntil(warm(Object.keys(ASSET_GROUPS).flatMap(groupEntries), false));
+  }
+});
+
 self.addEventListener('fetch', (event) => {
+  const url = new URL(event.request.url);
+  url.search = '';
+  const entry = precacheEntriesByUrl.get(url.href);
+  if (entry) {
+    // Entries not warmed yet are stored under their revision on first use
+    event.respondWith(
+      caches.open(PRECACHE).then(async (cache) => (
+        (await cache.match(cacheKey(entry))) || fetchEntry(cache, entry).catch(() => fetch(event.request))
+      ))
+    );
+    return;
+  }
+
+  // The dataset index changes whenever data is published; offline, the last copy is used
+  if (url.pathname.endsWith('/data/index.json')) {
+    event.respondWith(
+      fetch(event.request).then((response) => {
+        if (response.ok) {
+          const copy = response.clone();
+          caches.open(RUNTIME_CACHE).then((cache) => cache.put(event.request, copy));
+        }
+        return response;
+      }).catch(() => caches.match(event.request).then((cached) => cached || Response.error()))
+    );
+    return;
+  }
+
   event.respondWith(
     caches.match(event.request).then((cachedResponse) => {
       if (cachedResponse) {
@@ -142,42 +470,63 @@ self.addEventListener('fetch', (event) => {
           return response;
         }
         const responseToCache = response.clone();
-        caches.open(CACHE_NAME).then((cache) => {
+        caches.open(RUNTIME_CACHE).then((cache) => {
           cache.put(event.request, responseToCache);
         });
         return response;
+      }).catch((error) => {
+        if (flagCode(url)) return precachedFlag(url);
+        throw error;
       });
     })
   );
-});""")
+});"""
 
-    return "\n".join(lines) + "\n"
+
+def entry_bytes(entries: list[dict]) -> int:
+    return sum(asset_path(entry["url"]).stat().st_size for entry in entries)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate sw.js from actual assets")
     parser.add_argument("--version", default="2.1.0",
                         help="Cache version string (default: 2.1.0)")
+    parser.add_argument("--full-flags", action="store_true",
+                        help="Precache the full-size flag PNGs even if variants were built")
     parser.add_argument("--dry-run", action="store_true",
                         help="Print output instead of writing file")
+    add_profile_args(parser)
     args = parser.parse_args()
+    start_profile(args.profile)
 
-    content = generate_sw_content(args.version)
+    hash_index = HashIndex()
+    with span("build manifest"):
+        manifest = build_manifest(hash_index, args.full_flags)
+    with span("render") as s:
+        content = render_sw(args.version, manifest)
+        s.add(bytes=len(content))
+    hash_index.save()
 
     if args.dry_run:
         print(content)
     else:
-        output_path = PROJECT_ROOT / "sw.js"
+        output_path = PUBLIC_DIR / "sw.js"
         output_path.write_text(content)
         print(f"Generated {output_path}")
+        print(f"  - {hash_index.hashed} files rehashed")
 
         # Print summary
-        flags_count = content.count("./assets/flags/")
-        audio_count = content.count(f"./assets/audio/{VOICE_ID}/")
-        images_count = content.count("./assets/images/")
-        print(f"  - {flags_count} flags")
-        print(f"  - {audio_count} voice audio files")
-        print(f"  - {images_count} images")
+        install = manifest["core"] + [
+            entry for group in INSTALL_GROUPS
+            for code in manifest["groups"][group] for entry in manifest["countries"][code]
+        ] + [entry for group in INSTALL_GROUPS for entry in manifest["sprites"].get(group, [])]
+        everything = manifest["core"] + [e for entries in manifest["countries"].values() for e in entries]
+        everything += list({e["url"]: e for entries in manifest["sprites"].values() for e in entries}.values())
+        print(f"  - {len(manifest['countries'])} countries in {len(manifest['groups'])} groups")
+        print(f"  - install: {len(install)} files, {entry_bytes(install):,} bytes")
+        print(f"  - on demand: {len(everything) - len(install)} more files, "
+              f"{entry_bytes(everything) - entry_bytes(install):,} bytes")
+        print(f"  - {len(manifest['excluded'])} unreferenced files excluded")
 
 
 if __name__ == "__main__":
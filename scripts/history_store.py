@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Dated snapshots of the country metrics in a local SQLite database
+(scripts/country_history.db), so a fetch no longer loses the previous data.
+
+A snapshot is the full country list on one date, as in country_data.json:
+  snapshots     (date, source, created)
+  members       (date, code, seq, name, continent)  seq = position in the list
+  observations  (code, metric, date, value)         one row per metric, NULL if missing
+
+observations is indexed on (metric, date, value), so ranking a metric within
+a snapshot reads it in value order straight from the index. ranked_as_of()
+ranks every metric with window functions (ROW_NUMBER for ordinal ties, RANK
+for competition, DENSE_RANK for dense), breaking ordinal ties by position
+like compute_ranks does; compute_ranks.py --as-of uses it.
+
+fetch_country_data.py adds a snapshot on every run. Older country_data.json
+files can be imported with the ingest command, e.g. from git history:
+    git show <rev>:scripts/country_data.json > old.json
+    python3 scripts/history_store.py ingest old.json --date 2025-01-31
+
+Usage:
+    python3 scripts/history_store.py list
+    python3 scripts/history_store.py ingest FILE --date YYYY-MM-DD [--source NAME]
+    python3 scripts/history_store.py history CODE [--metric NAME]
+"""
+
+import argparse
+import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tracing import add_profile_args, span, start_profile
+
+STORE_FILE = Path(__file__).parent / "country_history.db"
+
+METRICS = ["population", "area", "gdp"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    date TEXT PRIMARY KEY,
+    source TEXT,
+    created TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS members (
+    date TEXT NOT NULL REFERENCES snapshots(date) ON DELETE CASCADE,
+    code TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    continent TEXT,
+    PRIMARY KEY (date, code)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS observations (
+    code TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    date TEXT NOT NULL REFERENCES snapshots(date) ON DELETE CASCADE,
+    value NUMERIC,
+    PRIMARY KEY (code, metric, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS observations_by_value ON observations (metric, date, value);
+"""
+
+# Window function per compute_ranks tie policy, and whether position breaks ties
+RANK_FUNCTIONS = {
+    "ordinal": ("ROW_NUMBER", True),
+    "competition": ("RANK", False),
+    "dense": ("DENSE_RANK", False),
+}
+
+
+def connect(path=STORE_FILE):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def today():
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def ingest(conn, date, countries, source=None, metrics=METRICS):
+    """Store countries (country_data.json records) as the snapshot for date, replacing any."""
+    with conn:
+        conn.execute("DELETE FROM snapshots WHERE date = ?", (date,))
+        conn.execute(
+            "INSERT INTO snapshots (date, source, created) VALUES (?, ?, ?)",
+            (date, source, datetime.now(timezone.utc).isoformat(timespec="seconds")),
+        )
+        conn.executemany(
+            "INSERT INTO members (date, code, seq, name, continent) VALUES (?, ?, ?, ?, ?)",
+            ((date, c["code"], seq, c["name"], c.get("continent")) for seq, c in enumerate(countries)),
+        )
+        conn.executemany(
+            "INSERT INTO observations (code, metric, date, value) VALUES (?, ?, ?, ?)",
+            ((c["code"], m, date, c.get(m)) for c in countries for m in metrics),
+        )
+
+
+def snapshot_dates(conn):
+    return [date for (date,) in conn.execute("SELECT date FROM snapshots ORDER BY date")]
+
+
+def resolve_date(conn, as_of):
+    """Date of the latest snapshot on or before as_of ("latest" for the newest one)."""
+    if as_of == "latest":
+        row = conn.execute("SELECT MAX(date) FROM snapshots").fetchone()
+    else:
+        row = conn.execute("SELECT MAX(date) FROM snapshots WHERE date <= ?", (as_of,)).fetchone()
+    if row[0] is None:
+        raise LookupError(f"No snapshot on or before {as_of} in the history store")
+    return row[0]
+
+
+def ranked_as_of(conn, date, metrics=METRICS, ties="ordinal", nulls="omit"):
+    """
+    Records of the snapshot on date with a `<metric>_rank` per metric and the
+    overall `rank` (best of them), like compute_ranks' output.
+    """
+    function, by_position = RANK_FUNCTIONS[ties]
+    order = "o.value DESC, m.seq" if by_position else "o.value DESC"
+    placeholders = ", ".join("?" * len(metrics))
+    rows = conn.execute(
+        f"""
+        SELECT m.code, o.metric, o.value,
+               CASE WHEN o.value IS NULL THEN NULL
+                    ELSE {function}() OVER (PARTITION BY o.metric, o.value IS NULL ORDER BY {order})
+               END
+        FROM observations o JOIN members m ON m.date = o.date AND m.code = o.code
+        WHERE o.date = ? AND o.metric IN ({placeholders})
+        """,
+        (date, *metrics),
+    )
+    values, ranks = {}, {}
+    for code, metric, value, rank in rows:
+        values[code, metric] = value
+        ranks[code, metric] = rank
+
+    if nulls == "last":
+        for metric in metrics:
+            ranked = [r for (code, m), r in ranks.items() if m == metric and r is not None]
+            last = (max(ranked, default=0) if ties == "dense" else len(ranked)) + 1
+            for key, r in ranks.items():
+                if key[1] == metric and r is None:
+                    ranks[key] = last
+
+    countries = []
+    for code, name, continent in conn.execute(
+            "SELECT code, name, continent FROM members WHERE date = ? ORDER BY seq", (date,)):
+        record = {"code": code, "name": name, "continent": continent}
+        record.update({m: values.get((code, m)) for m in metrics})
+        record.update({f"{m}_rank": ranks.get((code, m)) for m in metrics})
+        best = [r for r in (ranks.get((code, m)) for m in metrics) if r is not None]
+        record["rank"] = min(best) if best else None
+        countries.append(record)
+    return countries
+
+
+def metric_history(conn, code, metric=None):
+    """[(date, metric, value)] for one country, oldest first."""
+    query = "SELECT date, metric, value FROM observations WHERE code = ?"
+    params = [code]
+    if metric:
+        query += " AND metric = ?"
+        params.append(metric)
+    return conn.execute(query + " ORDER BY date, metric", params).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dated snapshots of the country metrics")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the snapshots")
+    ingest_parser = commands.add_parser("ingest", help="Import a country_data.json file as a snapshot")
+    ingest_parser.add_argument("file", type=Path)
+    ingest_parser.add_argument("--date", required=True, help="Snapshot date (YYYY-MM-DD)")
+    ingest_parser.add_argument("--source", help="Where the data came from (default: the file name)")
+    history_parser = commands.add_parser("history", help="Print the values of one country over time")
+    history_parser.add_argument("code")
+    history_parser.add_argument("--metric", choices=METRICS)
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    with closing(connect()) as conn:
+        if args.command == "ingest":
+            with open(args.file, "r") as f:
+                countries = json.load(f)
+            with span("ingest", items=len(countries)):
+                ingest(conn, args.date, countries, args.source or args.file.name)
+            print(f"Stored {len(countries)} countries as the {args.date} snapshot in {STORE_FILE}")
+        elif args.command == "list":
+            rows = conn.execute(
+                "SELECT s.date, s.source, COUNT(m.code) FROM snapshots s "
+                "LEFT JOIN members m ON m.date = s.date GROUP BY s.date ORDER BY s.date"
+            ).fetchall()
+            for date, source, count in rows:
+                print(f"  {date}  {count:>4} countries  {source or ''}")
+            print(f"{len(rows)} snapshots in {STORE_FILE}")
+        else:
+            for date, metric, value in metric_history(conn, args.code, args.metric):
+                print(f"  {date}  {metric:<12} {value if value is not None else '-':>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+On-disk HTTP response cache for the upstream JSON the scripts download.
+
+Responses are stored under .http_cache/ in the project root, keyed by URL.
+Within the TTL a cached body is returned without touching the network; after
+it expires the request is revalidated with If-None-Match / If-Modified-Since,
+so an unchanged upstream costs a 304 instead of a full download. If the
+network is unavailable a stale entry is served with a warning.
+
+In offline mode nothing is fetched: the cache is used regardless of age,
+falling back to the checked-in snapshots in scripts/fixtures/. Those were
+built from country_data.json and carry only the fields and countries the
+pipeline reads.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from urllib import error, request
+
+from tracing import span
+
+SCRIPT_DIR = Path(__file__).parent
+DEFAULT_CACHE_DIR = SCRIPT_DIR.parent / ".http_cache"
+FIXTURES_DIR = SCRIPT_DIR / "fixtures"
+DEFAULT_TTL = 7 * 24 * 3600
+
+FLAGCDN_CODES_URL = "https://flagcdn.com/en/codes.json"
+REST_COUNTRIES_URL = "https://restcountries.com/v3.1/all?fields=name,cca2,population,area,region,subregion"
+
+# Checked-in snapshots used in offline mode when the cache is empty
+FIXTURES = {
+    FLAGCDN_CODES_URL: "flagcdn_codes.json",
+    REST_COUNTRIES_URL: "restcountries_all.json",
+}
+
+
+class OfflineError(RuntimeError):
+    """Raised when offline mode has neither a cached response nor a fixture."""
+
+
+class HTTPCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL, offline=False):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.offline = offline
+
+    def _paths(self, url):
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+        return self.cache_dir / f"{digest}.body", self.cache_dir / f"{digest}.meta.json"
+
+    def _load(self, url):
+        body_path, meta_path = self._paths(url)
+        if not body_path.exists() or not meta_path.exists():
+            return None, None
+        return body_path.read_bytes(), json.loads(meta_path.read_text(encoding="utf-8"))
+
+    def _save(self, url, body, meta):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        body_path, meta_path = self._paths(url)
+        if body is not None:
+            tmp = body_path.with_suffix(".part")
+            tmp.write_bytes(body)
+            tmp.replace(body_path)
+        meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    def get(self, url, timeout=30, context=None):
+        """Return the response body for url, using the cache as described above."""
+        with span("http get", url=url) as s:
+            body = self._get(url, timeout, context)
+            s.add(bytes=len(body))
+        return body
+
+    def _get(self, url, timeout, context):
+        body, meta = self._load(url)
+
+        if self.offline:
+            if body is not None:
+                return body
+            fixture = FIXTURES.get(url)
+            if fixture and (FIXTURES_DIR / fixture).exists():
+                return (FIXTURES_DIR / fixture).read_bytes()
+            raise OfflineError(f"No cached response or fixture for {url}")
+
+        if body is not None and time.time() - meta["fetched_at"] < self.ttl:
+            return body
+
+        req = request.Request(url)
+        if meta and meta.get("etag"):
+            req.add_header("If-None-Match", meta["etag"])
+        if meta and meta.get("last_modified"):
+            req.add_header("If-Modified-Since", meta["last_modified"])
+
+        try:
+            with request.urlopen(req, timeout=timeout, context=context) as response:
+                new_body = response.read()
+                headers = response.headers
+        except error.HTTPError as e:
+            if e.code == 304 and body is not None:
+                meta["fetched_at"] = time.time()
+                self._save(url, None, meta)
+                return body
+            raise
+        except (error.URLError, TimeoutError) as e:
+            if body is None:
+                raise
+            print(f"Warning: {url} unreachable ({e}); using cached copy")
+            return body
+
+        self._save(url, new_body, {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        })
+        return new_body
+
+    def get_json(self, url, timeout=30, context=None):
+        return json.loads(self.get(url, timeout, context).decode("utf-8"))
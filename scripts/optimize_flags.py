@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Build responsive flag derivatives from the full-size PNGs.
+
+The flag of every country in countries.js and every code a pack or
+challenge names, public/assets/flags/<code>.png (1280px wide), is resized
+to each of WIDTHS and saved in each of FORMATS under
+public/assets/flags/<width>/. The other PNGs (US states etc.) are never
+shown, so they get no variants.
+Flags are transcoded in a process pool; a flag whose source hash and
+encoder settings match the previous run is skipped.
+
+The run writes public/assets/flags/variants.json, which app.js reads to
+build its <picture> srcsets and generate_sw.py reads to precache a single
+small variant per flag instead of the full-size PNG.
+
+WebP is the only default format: flags are flat colour, and a lossless
+256-colour WebP is smaller than lossy AVIF for most of them.
+
+Requires Pillow (pip install pillow).
+
+Usage:
+    python3 scripts/optimize_flags.py [--widths 320 640 960] [--formats webp [png]]
+                                      [--workers N] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from analyze_assets import game_codes
+from asset_hashes import HashIndex
+from game_data import load_challenges, load_countries, load_packs
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FLAGS_DIR = PROJECT_ROOT / "public" / "assets" / "flags"
+MANIFEST_FILE = FLAGS_DIR / "variants.json"
+
+MANIFEST_VERSION = 1
+WIDTHS = [320, 640, 960]
+# Listed in order of preference; the <picture> element offers them in this
+# order and falls back to the original PNG, so resized PNGs are opt-in
+FORMATS = ["webp"]
+OPTIONAL_FORMATS = ["png"]
+# Variant the service worker precaches for offline play; every browser the
+# game targets decodes WebP, and 320px covers the flag at phone size
+DEFAULT_VARIANT = {"width": 320, "format": "webp"}
+
+ENCODER_OPTIONS = {
+    "webp": {"lossless": True, "method": 6},
+    "png": {"optimize": True},
+}
+PIL_FORMATS = {"webp": "WEBP", "png": "PNG"}
+
+
+def settings_hash(widths, formats):
+    settings = {"widths": widths, "formats": formats, "options": {f: ENCODER_OPTIONS[f] for f in formats}}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def variant_path(code, width, fmt):
+    return FLAGS_DIR / str(width) / f"{code}.{fmt}"
+
+
+def game_flag_codes():
+    """Codes of every flag the game can show."""
+    codes = {c["code"] for c in load_countries()}
+    codes.update(game_codes(load_packs(), load_challenges()))
+    return codes
+
+
+def transcode(src, code, widths, formats):
+    """Write every variant of one flag. Runs in a worker process."""
+    from PIL import Image
+
+    with Image.open(src) as img:
+        img.load()
+        has_alpha = img.mode in ("RGBA", "LA") or "transparency" in img.info
+        rgb = img.convert("RGBA" if has_alpha else "RGB")
+
+    sizes = {}
+    for width in widths:
+        # Never upscale; the directory keeps the nominal width
+        size = min(width, rgb.width)
+        resized = rgb.resize((size, round(rgb.height * size / rgb.width)), Image.LANCZOS)
+        # Flags are flat colour: resampling only adds edge shades, so a
+        # 256-colour palette encoded losslessly beats lossy WebP at every width
+        palette = resized.quantize(256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+        for fmt in formats:
+            path = variant_path(code, width, fmt)
+            tmp = path.with_name(path.name + ".part")
+            palette.save(tmp, PIL_FORMATS[fmt], **ENCODER_OPTIONS[fmt])
+            tmp.replace(path)
+            sizes.setdefault(fmt, []).append(path.stat().st_size)
+    return code, {"width": rgb.width, "height": rgb.height, "bytes": sizes}
+
+
+def require_pillow():
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        raise SystemExit("Pillow is required: pip install pillow")
+
+
+def load_manifest():
+    if MANIFEST_FILE.exists():
+        return json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+    return {}
+
+
+def is_current(entry, source_hash, code, widths, formats):
+    if not entry or entry.get("source") != source_hash:
+        return False
+    return all(variant_path(code, w, f).exists() for w in widths for f in formats)
+
+
+def pick_default(widths, formats):
+    """DEFAULT_VARIANT, or the closest one the current settings produce."""
+    width = DEFAULT_VARIANT["width"]
+    if width not in widths:
+        width = min((w for w in widths if w >= width), default=widths[-1])
+    fmt = DEFAULT_VARIANT["format"]
+    if fmt not in formats:
+        fmt = "png" if "png" in formats else formats[-1]
+    return {"width": width, "format": fmt}
+
+
+def remove_stale(codes, widths, formats):
+    """Delete variants of deleted or unused flags and of formats no longer built."""
+    removed = 0
+    for width in widths:
+        for path in (FLAGS_DIR / str(width)).glob("*.*"):
+            if path.stem not in codes or path.suffix[1:] not in formats:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def report(flags, sources, widths, formats):
+    original = sum(p.stat().st_size for p in sources)
+    print(f"\n--- Total bytes ({len(flags)} flags, original PNGs {original:,}) ---")
+    print(f"  {'format':<8}" + "".join(f"{f'{w}px':>12}" for w in widths))
+    for fmt in formats:
+        totals = [sum(e["bytes"][fmt][i] for e in flags.values()) for i in range(len(widths))]
+        print(f"  {fmt:<8}" + "".join(f"{t:>12,}" for t in totals))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build responsive flag image derivatives")
+    parser.add_argument("--widths", type=int, nargs="+", default=WIDTHS,
+                        help=f"Output widths in pixels (default: {' '.join(map(str, WIDTHS))})")
+    parser.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS + OPTIONAL_FORMATS,
+                        help=f"Output formats in order of preference (default: {' '.join(FORMATS)})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-encode every flag even if its source is unchanged")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    widths = sorted(set(args.widths))
+    formats = list(dict.fromkeys(args.formats))
+    require_pillow()
+    codes = game_flag_codes()
+    sources = sorted(src for src in FLAGS_DIR.glob("*.png") if src.stem in codes)
+    hash_index = HashIndex()
+    previous = load_manifest()
+    settings = settings_hash(widths, formats)
+    old_flags = previous.get("flags", {}) if previous.get("settings") == settings and not args.force else {}
+
+    flags = {}
+    pending = []
+    for src in sources:
+        code = src.stem
+        source_hash = hash_index.hash(src)[:12]
+        entry = old_flags.get(code)
+        if is_current(entry, source_hash, code, widths, formats):
+            flags[code] = entry
+        else:
+            pending.append((src, code, source_hash))
+    hash_index.save()
+
+    for width in widths:
+        (FLAGS_DIR / str(width)).mkdir(exist_ok=True)
+
+    print(f"{len(sources)} flags, {len(pending)} to encode, {len(sources) - len(pending)} unchanged")
+    if pending:
+        with span("transcode", items=len(pending)), ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {pool.submit(transcode, src, code, widths, formats): source_hash
+                       for src, code, source_hash in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                code, entry = future.result()
+                flags[code] = {"source": futures[future], **entry}
+                if done % 50 == 0 or done == len(pending):
+                    print(f"  encoded {done}/{len(pending)}")
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "settings": settings,
+        "widths": widths,
+        "formats": formats,
+        "default": pick_default(widths, formats),
+        "flags": {code: flags[code] for code in sorted(flags)},
+    }
+    tmp = MANIFEST_FILE.with_name(MANIFEST_FILE.name + ".part")
+    tmp.write_text(json.dumps(manifest, separators=(",", ":")) + "\n", encoding="utf-8")
+    tmp.replace(MANIFEST_FILE)
+    print(f"Wrote {MANIFEST_FILE}")
+
+    removed = remove_stale(set(flags), widths, formats)
+    if removed:
+        print(f"Removed {removed} stale variants")
+    if flags:
+        report(manifest["flags"], sources, widths, formats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Precompress the built site: write Brotli (.br) and gzip (.gz) copies of every
+compressible file next to it, for servers that serve precompressed files
+(nginx brotli_static/gzip_static, most CDNs), and a manifest of sizes and
+Subresource Integrity hashes.
+
+Run it on dist/ after `vite build` (npm run precompress) when deploying to
+such a server. It is not part of the default build: GitHub Pages ignores
+precompressed files and compresses on the fly, so the Pages deploy skips it.
+Files are compressed at the highest levels in a process pool. A variant is
+kept only if it is smaller than the file; a file whose hash and variants
+match the previous manifest is not compressed again.
+
+The manifest, <dir>/precompressed.json, lists every file:
+    {"version": 1, "encodings": [...], "files": {path: {"size", "integrity", "gzip", "br"}}}
+where integrity is the file's "sha256-<base64>" SRI value (the same one
+generate_sw.py gives the service worker) and gzip/br are variant sizes.
+
+The report lists the compressed sizes of each compressible file. With
+--compare (e.g. the manifest of the previous release) it also shows the
+change per file; Vite's content hashes are ignored when matching names.
+
+Brotli needs the brotli package (pip install brotli) and is skipped with a
+warning otherwise.
+
+Usage:
+    python3 scripts/precompress.py [--dir dist] [--compare OLD_MANIFEST] [--workers N] [--force]
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from tracing import add_profile_args, span, start_profile
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_DIR = PROJECT_ROOT / "dist"
+MANIFEST_NAME = "precompressed.json"
+
+MANIFEST_VERSION = 1
+
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".webmanifest", ".svg", ".txt", ".xml", ".map"}
+# Below this, headers cost more than compression saves
+MIN_SIZE = 1024
+
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+
+# Vite's content hash in built file names, e.g. assets/index-BPvgi06a.js
+_BUILD_HASH = re.compile(r"-[\w-]{8}(?=\.\w+$)")
+
+
+def integrity(data):
+    """Subresource Integrity value of data."""
+    return "sha256-" + base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+
+def available_encodings():
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        print("Warning: the brotli package is not installed, writing gzip only")
+        return ["gzip"]
+    return list(ENCODINGS)
+
+
+def compress(data, encoding):
+    if encoding == "br":
+        import brotli
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps the output identical between builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def is_compressible(path):
+    return path.suffix in COMPRESSIBLE and path.stat().st_size >= MIN_SIZE
+
+
+def process(path, encodings):
+    """Manifest entry of one file, writing its compressed variants. Runs in a worker process."""
+    data = path.read_bytes()
+    entry = {"size": len(data), "integrity": integrity(data)}
+    for encoding in encodings:
+        variant = path.with_name(path.name + ENCODINGS[encoding])
+        compressed = compress(data, encoding)
+        if len(compressed) >= len(data):
+            variant.unlink(missing_ok=True)
+            continue
+        tmp = variant.with_name(variant.name + ".part")
+        tmp.write_bytes(compressed)
+        tmp.replace(variant)
+        entry[encoding] = len(compressed)
+    return entry
+
+
+def is_current(entry, path, encodings):
+    """The previous entry still describes the file and its variants."""
+    if not entry or entry["size"] != path.stat().st_size:
+        return False
+    for encoding in encodings:
+        variant = path.with_name(path.name + ENCODINGS[encoding])
+        if encoding in entry and (not variant.exists() or variant.stat().st_size != entry[encoding]):
+            return False
+    return entry["integrity"] == integrity(path.read_bytes())
+
+
+def site_files(root):
+    variant_suffixes = tuple(ENCODINGS.values())
+    return sorted(
+        path for path in root.rglob("*")
+        if path.is_file() and not path.name.endswith(variant_suffixes + (".part",))
+        and path.name != MANIFEST_NAME
+    )
+
+
+def remove_stale(root, previous):
+    """Delete variants of files that were in the previous manifest and are gone now."""
+    removed = 0
+    for rel in previous:
+        if (root / rel).exists():
+            continue
+        for suffix in ENCODINGS.values():
+            variant = root / (rel + suffix)
+            if variant.exists():
+                variant.unlink()
+                removed += 1
+    return removed
+
+
+def load_manifest(path, encodings=None):
+    """Files of a manifest; none if it was written with other encodings."""
+    if path and path.exists():
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        if manifest.get("version") == MANIFEST_VERSION and encodings in (None, manifest["encodings"]):
+            return manifest["files"]
+    return {}
+
+
+def smallest(entry):
+    """Bytes sent to a client that accepts every encoding."""
+    return min(entry.get(key, entry["size"]) for key in ("size", *ENCODINGS))
+
+
+def report(files, previous):
+    """Sizes of the compressed files, largest first, with the change since `previous`."""
+    old = {_BUILD_HASH.sub("", path): entry for path, entry in previous.items()}
+    compressed = {path: entry for path, entry in files.items() if any(key in entry for key in ENCODINGS)}
+    width = max([len(path) for path in compressed] + [5])
+
+    print(f"\n  {'file':<{width}} {'size':>10} {'gzip':>10} {'br':>10}  change")
+    change = 0
+    for path, entry in sorted(compressed.items(), key=lambda item: -smallest(item[1])):
+        before = old.get(_BUILD_HASH.sub("", path))
+        if before:
+            delta = smallest(entry) - smallest(before)
+            change += delta
+        cells = [f"{entry[key]:,}" if key in entry else "-" for key in ("size", "gzip", "br")]
+        note = f"{delta:+,}" if before else ("new" if previous else "")
+        print(f"  {path:<{width}} " + " ".join(f"{cell:>10}" for cell in cells) + f"  {note}")
+
+    totals = [sum(entry.get(key, entry["size"]) for entry in compressed.values())
+              for key in ("size", "gzip", "br")]
+    print(f"  {'total':<{width}} " + " ".join(f"{total:>10,}" for total in totals)
+          + (f"  {change:+,}" if previous else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write Brotli/gzip variants and an integrity manifest")
+    parser.add_argument("--dir", type=Path, default=DEFAULT_DIR,
+                        help="Built site to compress (default: dist)")
+    parser.add_argument("--compare", type=Path,
+                        help="Earlier manifest to compare compressed sizes with (default: the previous run)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Compress every file again")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    if not args.dir.is_dir():
+        raise SystemExit(f"{args.dir} not found; run `npm run build` first")
+    manifest_path = args.dir / MANIFEST_NAME
+    encodings = available_encodings()
+    previous = {} if args.force else load_manifest(manifest_path, encodings)
+    compare = load_manifest(args.compare) if args.compare else previous
+
+    files, pending = {}, []
+    with span("scan") as s:
+        for path in site_files(args.dir):
+            rel = path.relative_to(args.dir).as_posix()
+            if not is_compressible(path):
+                data = path.read_bytes()
+                files[rel] = {"size": len(data), "integrity": integrity(data)}
+            elif is_current(previous.get(rel), path, encodings):
+                files[rel] = previous[rel]
+            else:
+                pending.append((rel, path))
+        s.add(items=len(files) + len(pending))
+
+    print(f"{len(files) + len(pending)} files, {len(pending)} to compress ({', '.join(encodings)})")
+    with span("compress", items=len(pending)) as s, ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for (rel, _), entry in zip(pending, pool.map(process, [p for _, p in pending],
+                                                     [encodings] * len(pending))):
+            files[rel] = entry
+            s.add(bytes=entry["size"])
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "encodings": encodings,
+        "files": {rel: files[rel] for rel in sorted(files)},
+    }
+    tmp = manifest_path.with_name(manifest_path.name + ".part")
+    tmp.write_text(json.dumps(manifest, indent=1) + "\n", encoding="utf-8")
+    tmp.replace(manifest_path)
+    print(f"Wrote {manifest_path}")
+    removed = remove_stale(args.dir, previous)
+    if removed:
+        print(f"Removed {removed} variants of deleted files")
+    report(manifest["files"], compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import time
+from pathlib import Path
+
+import audio
+from tracing import add_profile_args, span, start_profile
+
+
+def add_processing_args(parser):
+    """Options shared with the generate scripts' --post-process."""
+    parser.add_argument(
+        "--ffmpeg",
+        default="ffmpeg",
+        help="ffmpeg executable (default: ffmpeg on PATH).",
+    )
+    parser.add_argument(
+        "--bitrate",
+        default="48k",
+        help="Target mono MP3 bitrate (default: 48k).",
+    )
+    parser.add_argument(
+        "--loudness",
+        type=float,
+        default=-16.0,
+        help="Target integrated loudness in LUFS (default: -16).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Parallel ffmpeg processes (default: CPU count).",
+    )
+
+
+def make_processor(args):
+    processor = audio.AudioProcessor(args.ffmpeg, bitrate=args.bitrate, loudness=args.loudness)
+    processor.check()
+    return processor
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Trim silence, normalize loudness and re-encode generated audio files."
+    )
+    parser.add_argument(
+        "--voice-id",
+        required=True,
+        help="Voice ID whose audio directory to process.",
+    )
+    parser.add_argument(
+        "--codes",
+        nargs="+",
+        help="Only process these files (e.g., --codes cu kw score_5). If omitted, processes every file.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-encode files even if they are already processed with the same settings.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Where processed.json and the original files are kept (default: .audio_cache).",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print totals, not every processed file.",
+    )
+    add_processing_args(parser)
+    add_profile_args(parser)
+    return parser.parse_args()
+
+
+def main():
+    root = Path(__file__).resolve().parents[1]
+    args = parse_args()
+    start_profile(args.profile)
+    processor = make_processor(args)
+
+    audio_dir = root / "public" / "assets" / "audio" / args.voice_id
+    if args.codes:
+        paths = [audio_dir / f"{code}.mp3" for code in args.codes]
+    else:
+        paths = sorted(audio_dir.glob("*.mp3"))
+
+    store = audio.ProcessedStore(Path(args.cache_dir) if args.cache_dir else root / ".audio_cache", root)
+    started = time.perf_counter()
+    try:
+        with span("post-process", items=len(paths)):
+            audio.print_report(
+                audio.process_files(paths, processor, store, args.workers, args.force),
+                verbose=not args.quiet,
+            )
+    finally:
+        store.save()
+    print(f"Elapsed: {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Persisted sorted index for incremental re-ranking.
+
+For each metric the index keeps every ranked country as a (-value, seq, code)
+entry in sorted order, where seq is the country's position in
+country_data.json and breaks ties the same way compute_ranks' ordinal policy
+does. When a few records change, their old entries are removed and new
+ones inserted with binary search, and only the ranks between the lowest
+and highest touched positions are re-read. This yields the same ranks as
+a full rebuild for O(k log n) searches plus one slice of list shifting.
+
+The index is tied to the ranked output it was built with (by hash) and is
+rebuilt from scratch whenever that output was produced some other way.
+"""
+
+import bisect
+import hashlib
+import json
+
+INDEX_VERSION = 1
+
+
+def _file_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+
+
+def _entry(value, seq, code):
+    return (-value, seq, code)
+
+
+def build_index(countries, metrics):
+    index = {
+        "version": INDEX_VERSION,
+        "metrics": list(metrics),
+        "seq": {c["code"]: i for i, c in enumerate(countries)},
+        "values": {c["code"]: {m: c.get(m) for m in metrics} for c in countries},
+        "sorted": {},
+    }
+    for m in metrics:
+        index["sorted"][m] = sorted(
+            _entry(c[m], i, c["code"]) for i, c in enumerate(countries) if c.get(m) is not None
+        )
+    return index
+
+
+def load_index(path, metrics, ranked_path):
+    """Load the index if it matches the metrics and the current ranked output."""
+    if not path.exists():
+        return None
+    index = json.loads(path.read_text(encoding="utf-8"))
+    if (
+        index.get("version") != INDEX_VERSION
+        or index.get("metrics") != list(metrics)
+        or index.get("ranked_hash") != _file_hash(ranked_path)
+    ):
+        return None
+    index["sorted"] = {m: [tuple(e) for e in entries] for m, entries in index["sorted"].items()}
+    return index
+
+
+def save_index(index, path, ranked_path):
+    index["ranked_hash"] = _file_hash(ranked_path)
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+def diff_records(index, countries):
+    """Return (changed, removed) country codes between the index and new data."""
+    metrics = index["metrics"]
+    changed = []
+    for c in countries:
+        old = index["values"].get(c["code"])
+        if old is None or any(old[m] != c.get(m) for m in metrics):
+            changed.append(c["code"])
+    current = {c["code"] for c in countries}
+    removed = [code for code in index["values"] if code not in current]
+    return changed, removed
+
+
+def _resequence(index, countries):
+    """
+    Keep the stored seqs in the same order as the records in countries.
+    Removals and records appended after every known one leave the order
+    intact, so new codes just get the next seqs. Anything else (a record
+    inserted between others, or a reordered list) renumbers every seq to
+    its position, and the codes whose seq changed are returned so their
+    entries can be moved.
+    """
+    seqs = index["seq"]
+    known = [(i, c["code"]) for i, c in enumerate(countries) if c["code"] in seqs]
+    new = [(i, c["code"]) for i, c in enumerate(countries) if c["code"] not in seqs]
+    in_order = all(seqs[a] < seqs[b] for (_, a), (_, b) in zip(known, known[1:]))
+    appended = not new or not known or new[0][0] > known[-1][0]
+    if in_order and appended:
+        last = max(seqs.values(), default=-1)
+        for n, (_, code) in enumerate(new, 1):
+            seqs[code] = last + n
+        return []
+    moved = [code for i, code in known if seqs[code] != i]
+    index["seq"] = {c["code"]: i for i, c in enumerate(countries)}
+    return moved
+
+
+def apply_changes(index, countries, changed, removed):
+    """
+    Update the sorted lists for the given codes in place.
+    Returns {metric: {code: new_rank}} covering every entry whose rank may
+    have moved, with None for codes that no longer have a rank.
+    """
+    by_code = {c["code"]: c for c in countries}
+    old_seqs = dict(index["seq"])
+    moved = _resequence(index, countries)
+    seqs = index["seq"]
+    codes = list(dict.fromkeys(changed + moved + removed))
+
+    updates = {}
+    for m in index["metrics"]:
+        entries = index["sorted"][m]
+        touched = []
+        net = 0
+        for code in codes:
+            old = index["values"].get(code, {}).get(m)
+            if old is not None:
+                pos = bisect.bisect_left(entries, _entry(old, old_seqs[code], code))
+                del entries[pos]
+                touched.append(pos)
+                net -= 1
+            new = by_code[code].get(m) if code in by_code else None
+            if new is not None:
+                pos = bisect.bisect_left(entries, _entry(new, seqs[code], code))
+                entries.insert(pos, _entry(new, seqs[code], code))
+                touched.append(pos)
+                net += 1
+        if not touched:
+            continue
+        lo = min(touched)
+        # If entries were added or dropped, everything below shifts as well
+        hi = len(entries) if net else min(len(entries), max(touched) + len(touched) + 1)
+        ranks = {entries[i][2]: i + 1 for i in range(lo, hi)}
+        for code in codes:
+            if code not in by_code or by_code[code].get(m) is None:
+                ranks[code] = None
+        updates[m] = ranks
+
+    for code in removed:
+        index["values"].pop(code, None)
+        seqs.pop(code, None)
+    for code in changed:
+        index["values"][code] = {m: by_code[code].get(m) for m in index["metrics"]}
+    return updates
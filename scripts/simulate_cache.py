@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Simulate how service worker caching strategies play out for players, so a
+change to sw.js can be measured before it ships.
+
+Synthetic players visit the game a few times. Each visit plays a few
+rounds: a pack from countries.js with the player's questions-per-round
+setting (5/10/20), or the next challenge of progressionChallenges. The
+sessions are replayed for every strategy, with the requests the page
+makes: the flag, the question clip and a name clip per option, the
+answer sounds and the score clip, with clips played from a sprite once
+it is loaded. Sizes come from the precache manifest generate_sw.py builds
+from the files on disk.
+
+Strategies:
+  install-all    precache every flag and clip on install, then cache-first
+  per-pack       install the core files and the first progression chunk,
+                 warm a pack's or challenge's group when it is picked
+  per-pack-idle  per-pack, also warming every group once the page is idle
+                 (what generate_sw.py emits)
+  lru            install the core files; cache the rest on use, dropping
+                 the least recently used over --budget MB
+
+The network is one connection per request up to 6 at a time, sharing the
+bandwidth of --network after a round trip. As in the browser, the page
+is only served by the worker once it has installed, a request for a file
+still being warmed is downloaded again, and background downloads stop
+when the visit ends.
+
+Reported per strategy (over all players):
+  first play     seconds from pressing start on the first visit to the first flag
+  wait/question  time a question waits on flags and clips, on average
+  MB, requests   downloaded per player, in the foreground and background
+  hit ratio      page requests answered from the worker's cache
+
+Usage:
+    python3 scripts/simulate_cache.py [--players 200] [--visits 4] [--questions 5 10 20]
+                                      [--network slow-4g] [--budget 2] [--strategies NAME ...]
+"""
+
+import argparse
+import json
+import math
+import random
+import statistics
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+from analyze_assets import build_graph
+from asset_hashes import HashIndex
+from game_data import load_challenges, load_countries, load_packs
+from generate_sw import (
+    INSTALL_GROUPS, PUBLIC_DIR, VOICE_ID, asset_path, build_manifest, load_sprites, sprite_urls,
+)
+from tracing import add_profile_args, span, start_profile
+
+# (bytes per second, round trip seconds)
+NETWORKS = {
+    "slow-3g": (50_000, 0.4),
+    "slow-4g": (200_000, 0.15),
+    "4g": (1_125_000, 0.07),
+    "wifi": (3_750_000, 0.02),
+}
+
+# Parallel requests per host in the browser, and WARM_CONCURRENCY in sw.js
+CONNECTIONS = 6
+WARM_CONCURRENCY = 4
+
+# Player timing, in seconds (CONFIG.optionRevealDelay in app.js for the reveal)
+START_DELAY = 5.0
+OPTION_REVEAL_DELAY = 0.12
+ANSWER_SECONDS = 3.0
+ROUND_GAP = 5.0
+LINGER = 10.0
+# Length of a clip that is not in a sprite
+CLIP_SECONDS = 1.2
+# Share of questions answered correctly
+ACCURACY = 0.75
+# CONFIG.winThresholdPercent in app.js
+WIN_PERCENT = 80
+
+AUDIO = "./assets/audio"
+VOICE = f"{AUDIO}/{VOICE_ID}"
+PAGE_REQUESTS = ["./assets/flags/variants.json", f"{VOICE}/sprites.json"]
+
+
+@dataclass
+class Strategy:
+    name: str
+    install: str  # "all", "groups" (core files and INSTALL_GROUPS) or "core"
+    warm_on_pick: bool = False
+    warm_when_idle: bool = False
+    lru: bool = False
+
+
+STRATEGIES = {
+    "install-all": Strategy("install-all", "all"),
+    "per-pack": Strategy("per-pack", "groups", warm_on_pick=True),
+    "per-pack-idle": Strategy("per-pack-idle", "groups", warm_on_pick=True, warm_when_idle=True),
+    "lru": Strategy("lru", "core", lru=True),
+}
+CURRENT = "per-pack-idle"
+
+
+class Assets:
+    """URLs and sizes of what the page loads, from the precache manifest."""
+
+    def __init__(self):
+        manifest = build_manifest(HashIndex())
+        graph, _ = build_graph()
+        sprites = load_sprites(PUBLIC_DIR / "assets" / "audio" / VOICE_ID, graph)
+        self.in_sprite = sprite_urls(sprites)
+        self.durations = {
+            name: duration
+            for sprite in (sprites or {"sprites": {}})["sprites"].values()
+            for name, (_, duration) in sprite["clips"].items()
+        }
+        self.core = [e["url"] for e in manifest["core"]]
+        self.flags = {code: entries[0]["url"] for code, entries in manifest["countries"].items()}
+        self.groups = {
+            name: [e["url"] for e in manifest["sprites"].get(name, [])]
+            + [e["url"] for code in codes for e in manifest["countries"].get(code, [])]
+            for name, codes in manifest["groups"].items()
+        }
+        everything = self.core + [url for urls in self.groups.values() for url in urls]
+        self.sizes = {url: asset_path(url).stat().st_size for url in everything}
+
+    def size(self, url):
+        if url not in self.sizes:
+            path = asset_path(url)
+            self.sizes[url] = path.stat().st_size if path.exists() else 0
+        return self.sizes[url]
+
+    def clip(self, name):
+        """(URL the page requests for a clip, seconds it plays)"""
+        url = self.in_sprite.get(name, f"{VOICE}/{name}.mp3")
+        return url, self.durations.get(name, CLIP_SECONDS)
+
+    def install_urls(self, strategy):
+        if strategy.install == "all":
+            urls = self.core + [url for urls in self.groups.values() for url in urls]
+        elif strategy.install == "groups":
+            urls = self.core + [url for name in INSTALL_GROUPS for url in self.groups.get(name, [])]
+        else:
+            urls = self.core
+        return list(dict.fromkeys(urls))
+
+
+class Transfer:
+    __slots__ = ("url", "latency", "remaining", "done", "on_done")
+
+    def __init__(self, url, size, latency, on_done=None, done=None):
+        self.url = url
+        self.latency = latency
+        self.remaining = size
+        self.done = done
+        self.on_done = on_done
+
+
+class Network:
+    """
+    One visit's network: up to CONNECTIONS transfers at a time, each waiting
+    a round trip and then sharing the bandwidth equally with the others
+    that are downloading. Requests beyond that wait in order.
+    """
+
+    def __init__(self, bandwidth, rtt):
+        self.bandwidth = bandwidth
+        self.rtt = rtt
+        self.now = 0.0
+        self.queue = deque()
+        self.active = []
+        self.requests = 0
+        self.received = 0.0
+
+    def request(self, url, size, on_done=None):
+        transfer = Transfer(url, size, self.rtt, on_done)
+        self.queue.append(transfer)
+        self.requests += 1
+        self._start()
+        return transfer
+
+    def _start(self):
+        while self.queue and len(self.active) < CONNECTIONS:
+            self.active.append(self.queue.popleft())
+
+    def _step(self, limit):
+        loading = sum(1 for t in self.active if t.latency <= 0)
+        share = self.bandwidth / loading if loading else 0
+        dt = min(t.latency if t.latency > 0 else t.remaining / share for t in self.active)
+        dt = min(dt, limit - self.now)
+        self.now += dt
+        self.received += share * loading * dt
+
+        finished = []
+        for t in self.active:
+            if t.latency > 0:
+                t.latency = 0 if t.latency - dt <= 1e-12 else t.latency - dt
+            else:
+                t.remaining -= share * dt
+            if t.latency <= 0 and t.remaining <= 1e-6:
+                finished.append(t)
+        for t in finished:
+            self.active.remove(t)
+            t.done = self.now
+        self._start()
+        for t in finished:
+            if t.on_done:
+                t.on_done(t)
+
+    def advance(self, until):
+        while self.active and self.now < until:
+            self._step(until)
+        self.now = max(self.now, until)
+
+    def wait(self, transfer):
+        while transfer.done is None:
+            self._step(math.inf)
+        return transfer.done
+
+
+class Storage:
+    """A player's worker cache, kept across visits; with a budget, runtime entries are evicted LRU."""
+
+    def __init__(self, sizes, budget=None, pinned=()):
+        self.sizes = sizes
+        self.budget = budget
+        self.pinned = set(pinned)
+        self.entries = OrderedDict()
+        self.used = 0
+        self.installed = False
+
+    def has(self, url):
+        return url in self.entries
+
+    def get(self, url):
+        if url in self.entries:
+            self.entries.move_to_end(url)
+            return True
+        return False
+
+    def put(self, url):
+        if url in self.entries:
+            return
+        self.entries[url] = size = self.sizes(url)
+        if url in self.pinned:
+            return
+        self.used += size
+        while self.budget is not None and self.used > self.budget:
+            victim = next(u for u in self.entries if u not in self.pinned)
+            self.used -= self.entries.pop(victim)
+
+
+class Visit:
+    """The page and the service worker during one visit."""
+
+    def __init__(self, strategy, assets, storage, network, stats):
+        self.strategy = strategy
+        self.assets = assets
+        self.storage = storage
+        self.network = network
+        self.stats = stats
+        self.loaded = {}
+        self.pending = []
+        self.warm_queue = deque()
+        self.warming = set()
+
+    # Page
+    def fetch(self, url):
+        """Request url from the page; a URL already requested this visit is not requested again."""
+        if url in self.loaded:
+            return self.loaded[url]
+        self.stats.page_requests += 1
+        if self.storage.installed and self.storage.get(url):
+            self.stats.hits += 1
+            transfer = Transfer(url, 0, 0, done=self.network.now)
+        else:
+            # Once installed the worker serves the page and caches what it fetches
+            store = self.storage.put if self.storage.installed else None
+            transfer = self.network.request(url, self.assets.size(url),
+                                            store and (lambda t: store(t.url)))
+        self.loaded[url] = transfer
+        return transfer
+
+    def wait(self, transfer):
+        """Seconds spent waiting for a transfer."""
+        start = self.network.now
+        return max(self.network.wait(transfer) - start, 0.0)
+
+    def play(self, name):
+        """Play a clip; returns the seconds spent waiting for it to load."""
+        url, duration = self.assets.clip(name)
+        waited = self.wait(self.fetch(url))
+        self.network.advance(self.network.now + duration)
+        return waited
+
+    def post(self, urls, urgent):
+        """Message the worker to warm urls, once it is active (navigator.serviceWorker.ready)."""
+        if not self.storage.installed:
+            self.pending.append((urls, urgent))
+            return
+        if urgent:
+            self.warm_queue.extendleft(reversed(urls))
+        else:
+            self.warm_queue.extend(urls)
+        self._drain()
+
+    # Worker
+    def register(self):
+        missing = [url for url in self.assets.install_urls(self.strategy) if not self.storage.has(url)]
+        left = [len(missing)]
+
+        def installed(transfer):
+            self.storage.put(transfer.url)
+            left[0] -= 1
+            if not left[0]:
+                self._activate()
+
+        for url in missing:
+            self.network.request(url, self.assets.size(url), installed)
+        if self.strategy.warm_when_idle:
+            self.post([url for urls in self.assets.groups.values() for url in urls], urgent=False)
+        if not missing:
+            self._activate()
+
+    def _activate(self):
+        self.storage.installed = True
+        pending, self.pending = self.pending, []
+        for urls, urgent in pending:
+            self.post(urls, urgent)
+
+    def _drain(self):
+        while len(self.warming) < WARM_CONCURRENCY and self.warm_queue:
+            url = self.warm_queue.popleft()
+            if url in self.warming or self.storage.has(url):
+                continue
+            self.warming.add(url)
+            self.network.request(url, self.assets.size(url), self._warmed)
+
+    def _warmed(self, transfer):
+        self.storage.put(transfer.url)
+        self.warming.discard(transfer.url)
+        self._drain()
+
+
+@dataclass
+class Round:
+    group: str
+    # [(answer, [option codes], answered correctly)]
+    questions: list
+    pass_percent: int = WIN_PERCENT
+
+
+def plan_player(rng, countries, packs, challenges, visits, questions, progression_share):
+    """[[Round]] per visit for one player, the same for every strategy."""
+    per_round = rng.choice(questions)
+    progress = 0
+    plan = []
+    for _ in range(visits):
+        rounds = []
+        for _ in range(rng.randint(1, 3)):
+            if progress < len(challenges) and rng.random() < progression_share:
+                challenge = challenges[progress]
+                chunk = sum(1 for c in challenges[:progress] if c["type"] == "review")
+                group = f"progression:{chunk}"
+                codes, count = challenge["codes"], challenge["questionsShown"]
+                pass_percent = challenge["passPercent"]
+            else:
+                # The World Top 20 pack is selected by default
+                pack_id = "world" if rng.random() < 0.5 else rng.choice(list(packs))
+                group = f"pack:{pack_id}"
+                codes, count, pass_percent = packs[pack_id]["codes"], per_round, WIN_PERCENT
+            wanted = set(codes)
+            pool = [code for code in countries if code in wanted]
+            round_ = Round(group, [], pass_percent)
+            for answer in rng.sample(pool, min(count, len(pool))):
+                others = rng.sample([c for c in pool if c != answer], min(3, len(pool) - 1))
+                round_.questions.append((answer, rng.sample([answer, *others], len(others) + 1),
+                                         rng.random() < ACCURACY))
+            if group.startswith("progression:") and score_percent(round_) >= pass_percent:
+                progress += 1
+            rounds.append(round_)
+        plan.append(rounds)
+    return plan
+
+
+def score_percent(round_):
+    return 100 * sum(correct for _, _, correct in round_.questions) / len(round_.questions)
+
+
+@dataclass
+class Stats:
+    first_play: list
+    question_wait: float = 0.0
+    questions: int = 0
+    received: float = 0.0
+    requests: int = 0
+    page_requests: int = 0
+    hits: int = 0
+
+
+def play_visit(visit, rounds, stats, first):
+    network, assets = visit.network, visit.assets
+    visit.wait(visit.fetch("./"))
+    for url in PAGE_REQUESTS:
+        if url in assets.sizes:
+            visit.fetch(url)
+    visit.register()
+    network.advance(network.now + START_DELAY)
+
+    for round_ in rounds:
+        if visit.strategy.warm_on_pick:
+            visit.post(assets.groups.get(round_.group, []), urgent=True)
+        visit.fetch(f"{AUDIO}/background.mp3")
+        for answer, options, correct in round_.questions:
+            waited = visit.wait(visit.fetch(assets.flags[answer]))
+            if first:
+                stats.first_play.append(waited)
+                first = False
+            waited += visit.play("question")
+            for code in options:
+                network.advance(network.now + OPTION_REVEAL_DELAY)
+                waited += visit.play(code)
+            network.advance(network.now + ANSWER_SECONDS)
+            visit.fetch(f"{AUDIO}/{'positive' if correct else 'negative'}.mp3")
+            stats.question_wait += waited
+            stats.questions += 1
+        if score_percent(round_) >= WIN_PERCENT:
+            visit.fetch(f"{AUDIO}/celebration.mp3")
+        visit.play(f"score_{sum(correct for _, _, correct in round_.questions)}")
+        network.advance(network.now + ROUND_GAP)
+
+    network.advance(network.now + LINGER)
+    stats.received += network.received
+    stats.requests += network.requests
+
+
+def simulate(strategy, assets, plans, network, budget):
+    stats = Stats(first_play=[])
+    bandwidth, rtt = NETWORKS[network]
+    for plan in plans:
+        storage = Storage(assets.size, budget if strategy.lru else None, pinned=assets.core)
+        for i, rounds in enumerate(plan):
+            play_visit(Visit(strategy, assets, storage, Network(bandwidth, rtt), stats), rounds, stats, i == 0)
+    return stats
+
+
+def report(results, players):
+    print(f"\n  {'strategy':<22} {'first play':>15} {'wait/question':>14} {'MB/player':>10} "
+          f"{'requests':>9} {'hit ratio':>10}")
+    for name, stats in results.items():
+        first = sorted(stats.first_play)
+        p90 = first[min(len(first) - 1, int(len(first) * 0.9))]
+        label = f"{name} (current)" if name == CURRENT else name
+        print(f"  {label:<22} {statistics.median(first):>5.2f}s / {p90:>5.2f}s "
+              f"{1000 * stats.question_wait / max(stats.questions, 1):>10.0f} ms "
+              f"{stats.received / players / 1e6:>10.2f} {stats.requests / players:>9.0f} "
+              f"{stats.hits / max(stats.page_requests, 1):>10.1%}")
+    print("  (first play: median / 90th percentile)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare service worker caching strategies on simulated players")
+    parser.add_argument("--players", type=int, default=200, help="Number of players (default: 200)")
+    parser.add_argument("--visits", type=int, default=4, help="Visits per player (default: 4)")
+    parser.add_argument("--questions", type=int, nargs="+", default=[5, 10, 20],
+                        help="Questions-per-round settings players pick from (default: 5 10 20)")
+    parser.add_argument("--progression", type=float, default=0.5,
+                        help="Share of rounds that are progression challenges (default: 0.5)")
+    parser.add_argument("--network", choices=list(NETWORKS), default="slow-4g",
+                        help="Network profile (default: slow-4g, 1.6 Mbit/s with a 150 ms round trip)")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="Runtime cache budget of the lru strategy in MB (default: 2)")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES),
+                        metavar="NAME", help=f"Strategies to compare (default: all of {', '.join(STRATEGIES)})")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the sessions (default: 1)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON instead of a table")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    with span("load assets"):
+        assets = Assets()
+        countries = [c["code"] for c in load_countries()]
+        packs = load_packs()
+        challenges = load_challenges()
+    rng = random.Random(args.seed)
+    plans = [plan_player(rng, countries, packs, challenges, args.visits, args.questions, args.progression)
+             for _ in range(args.players)]
+
+    results = {}
+    for name in args.strategies:
+        with span(name, items=args.players):
+            results[name] = simulate(STRATEGIES[name], assets, plans, args.network, args.budget * 1e6)
+
+    if args.json:
+        print(json.dumps({
+            name: {
+                "first_play_median": statistics.median(stats.first_play),
+                "question_wait": stats.question_wait / max(stats.questions, 1),
+                "bytes_per_player": stats.received / args.players,
+                "requests_per_player": stats.requests / args.players,
+                "hit_ratio": stats.hits / max(stats.page_requests, 1),
+            }
+            for name, stats in results.items()
+        }, indent=1))
+        return
+    bandwidth, rtt = NETWORKS[args.network]
+    print(f"{args.players} players, {args.visits} visits each, {args.network} "
+          f"({bandwidth * 8 / 1e6:g} Mbit/s, {rtt * 1000:g} ms round trip)")
+    report(results, args.players)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Update the countries array in countries.js from the ranked data
+(scripts/country_data_ranked.json, written by compute_ranks.py), replacing
+the step of copying countries_ranked.js over it by hand.
+
+Each country line is rewritten in place from its ranked record, keeping
+the display name already in countries.js (some are edited for the game,
+e.g. "Côte d'Ivoire") and the blank lines between letters. Countries
+missing from the ranked data are dropped, new ones are added at the end of
+the array, and everything after the array (the packs) is left untouched.
+The file is only written when something changed.
+
+Usage:
+    python3 scripts/sync_countries.py [--dry-run]
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from emitters import js_object
+from game_data import COUNTRIES_JS
+from tracing import add_profile_args, span, start_profile
+
+RANKED_FILE = Path(__file__).parent / "country_data_ranked.json"
+
+START = "export const countries = [\n"
+_LINE = re.compile(r'^(\s*)\{ code: "([\w-]+)", name: "((?:[^"\\]|\\.)*)",.*?\},?$')
+
+
+def sync(text, ranked):
+    """(new countries.js text, {"updated": [...], "added": [...], "removed": [...]})"""
+    begin = text.find(START)
+    if begin < 0:
+        raise RuntimeError(f"Unable to find '{START.strip()}' in {COUNTRIES_JS}")
+    begin += len(START)
+    end = text.find("\n];", begin)
+    records = {r["code"]: r for r in ranked}
+    changes = {"updated": [], "added": [], "removed": []}
+
+    lines, seen, indent = [], set(), "    "
+    for line in text[begin:end].split("\n"):
+        match = _LINE.match(line)
+        if not match:
+            lines.append(line)
+            continue
+        indent, code, name = match.groups()
+        if code not in records:
+            changes["removed"].append(code)
+            continue
+        seen.add(code)
+        record = {**records[code], "name": json.loads(f'"{name}"')}
+        new = indent + js_object({k: record[k] for k in records[code]})
+        if new.rstrip(",") != line.rstrip(","):
+            changes["updated"].append(code)
+        lines.append(new)
+
+    for record in ranked:
+        if record["code"] not in seen:
+            changes["added"].append(record["code"])
+            lines.append(indent + js_object(record))
+
+    # Commas between countries, none after the last one (blank lines stay as they are)
+    last = max(i for i, line in enumerate(lines) if line.strip())
+    body = [
+        line.rstrip(",") + ("," if line.strip() and i < last else "")
+        for i, line in enumerate(lines)
+    ]
+    return text[:begin] + "\n".join(body) + text[end:], changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update countries.js from the ranked country data")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report the changes without writing countries.js")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    with open(RANKED_FILE, "r") as f:
+        ranked = json.load(f)
+    text = COUNTRIES_JS.read_text(encoding="utf-8")
+    with span("sync", items=len(ranked)):
+        content, changes = sync(text, ranked)
+
+    print(", ".join(f"{len(codes)} {kind}" for kind, codes in changes.items()))
+    for kind in ("added", "removed"):
+        if changes[kind]:
+            print(f"  {kind}: {', '.join(changes[kind])}")
+    if content == text:
+        print(f"{COUNTRIES_JS} is up to date")
+        return
+    if args.dry_run:
+        return
+    tmp = COUNTRIES_JS.with_suffix(".tmp")
+    tmp.write_text(content, encoding="utf-8")
+    tmp.replace(COUNTRIES_JS)
+    print(f"Wrote {COUNTRIES_JS}")
+
+
+if __name__ == "__main__":
+    main()
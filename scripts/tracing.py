@@ -0,0 +1,157 @@
+"""
+Lightweight spans for finding where a script's time goes.
+
+    from tracing import add_profile_args, span, start_profile
+
+    with span("hash assets") as s:
+        for path in paths:
+            ...
+            s.add(items=1, bytes=path.stat().st_size)
+
+Until start_profile() is called, span() returns one shared no-op object,
+so instrumented code costs a function call per span. Every entry point
+takes --profile [PATH] (add_profile_args); with it, each span is recorded
+with its thread, wall time and counters, and at exit the script writes a
+Chrome trace (open it in chrome://tracing or https://ui.perfetto.dev) and
+prints a table of wall time, bytes and items per span name.
+
+Spans opened in worker processes are not recorded; the span around the
+pool covers them.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TRACE_DIR = PROJECT_ROOT / ".traces"
+
+_tracer = None
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def add(self, **counters):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+    def add(self, **counters):
+        for key, value in counters.items():
+            self.args[key] = self.args.get(key, 0) + value
+
+
+class Tracer:
+    def __init__(self):
+        self.origin = time.perf_counter_ns()
+        self.events = []
+        self.threads = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, start, end, args):
+        thread = threading.get_ident()
+        with self.lock:
+            tid = self.threads.setdefault(thread, len(self.threads) + 1)
+            self.events.append((name, start - self.origin, end - start, tid, args))
+
+    def chrome_trace(self, process_name):
+        pid = os.getpid()
+        events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": process_name}}]
+        for name, start, duration, tid, args in self.events:
+            event = {"name": name, "ph": "X", "ts": start / 1000, "dur": duration / 1000,
+                     "pid": pid, "tid": tid}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self):
+        """{name: {"calls", "seconds", "bytes", "items"}} in order of first use."""
+        totals = {}
+        for name, _, duration, _, args in self.events:
+            entry = totals.setdefault(name, {"calls": 0, "seconds": 0.0, "bytes": 0, "items": 0})
+            entry["calls"] += 1
+            entry["seconds"] += duration / 1e9
+            entry["bytes"] += args.get("bytes", 0)
+            entry["items"] += args.get("items", 0)
+        return totals
+
+
+def span(name, **args):
+    """Context manager timing a block; args become trace arguments, bytes/items are summed."""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, args)
+
+
+def add_profile_args(parser):
+    parser.add_argument("--profile", nargs="?", const="", metavar="TRACE",
+                        help="Record timings: write a Chrome trace (default: .traces/<script>.json) "
+                             "and print a summary per stage")
+
+
+def print_summary(tracer, total):
+    rows = tracer.summary()
+    width = max([len(name) for name in rows] + [4])
+    print(f"\n  {'span':<{width}} {'calls':>6} {'wall':>10} {'share':>6} {'bytes':>14} {'items':>8}")
+    for name, entry in rows.items():
+        share = entry["seconds"] / total if total else 0
+        size = f"{entry['bytes']:,}" if entry["bytes"] else ""
+        items = f"{entry['items']:,}" if entry["items"] else ""
+        print(f"  {name:<{width}} {entry['calls']:>6} {entry['seconds']:>9.3f}s {share:>6.0%} "
+              f"{size:>14} {items:>8}")
+
+
+def start_profile(path, name=None):
+    """
+    Start recording when path is not None (the --profile value; "" for the
+    default location). The whole run is one span named after the script;
+    the trace and summary are written when the interpreter exits.
+    """
+    global _tracer
+    if path is None:
+        return
+    name = name or Path(sys.argv[0]).stem
+    trace_path = Path(path) if path else TRACE_DIR / f"{name}.json"
+    _tracer = tracer = Tracer()
+    root = _Span(tracer, name, {})
+    root.__enter__()
+
+    def finish():
+        root.__exit__(None, None, None)
+        trace_path.parent.mkdir(parents=True, exist_ok=True)
+        trace_path.write_text(json.dumps(tracer.chrome_trace(name)), encoding="utf-8")
+        print_summary(tracer, tracer.events[-1][2] / 1e9)
+        print(f"Trace written to {trace_path}")
+
+    atexit.register(finish)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the ElevenLabs text-to-speech endpoint.
+
+Answers POST /v1/text-to-speech/<voice_id> with fake MP3 bytes after a fixed
+latency, optionally failing a fraction of requests with 429/503, so the audio
+scripts can be exercised and their throughput measured without network access.
+
+Usage:
+    python3 scripts/tts_stub_server.py [--port 8765] [--latency 0.3] [--fail-rate 0.1]
+    python3 scripts/generate_audio.py --voice-id test --api-base http://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tracing import add_profile_args, span, start_profile
+
+# MPEG-1 Layer III frame header followed by zeroed side info and data: one
+# 26 ms frame of silence (128 kbps, 44.1 kHz) that decoders accept
+FAKE_MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+
+class StubTTSHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        with span("stub request", items=1) as s:
+            s.add(bytes=self.respond())
+
+    def respond(self):
+        """Answer one request; returns the audio bytes sent (0 for errors)."""
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        server = self.server
+        with server.lock:
+            server.requests += 1
+
+        if not self.path.startswith("/v1/text-to-speech/"):
+            self.send_error(404)
+            return 0
+        if server.fail_rate and random.random() < server.fail_rate:
+            status = random.choice([429, 503])
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return 0
+
+        try:
+            text = json.loads(body)["text"]
+        except (ValueError, KeyError):
+            self.send_error(400)
+            return 0
+
+        time.sleep(server.latency)
+        # Roughly speech length, at least half a second so decoders can probe it
+        frames = max(20, len(text) * 3)
+        audio = FAKE_MP3_FRAME * frames
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(len(audio)))
+        self.end_headers()
+        self.wfile.write(audio)
+        return len(audio)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def start_stub_server(port=0, latency=0.3, fail_rate=0.0, verbose=False):
+    """Start the stub server on a background thread. Returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubTTSHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.fail_rate = fail_rate
+    server.verbose = verbose
+    server.requests = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local stub TTS server")
+    parser.add_argument("--port", type=int, default=8765,
+                        help="Port to listen on (default: 8765)")
+    parser.add_argument("--latency", type=float, default=0.3,
+                        help="Seconds to wait before each response (default: 0.3)")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 429/503 (default: 0)")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    start_profile(args.profile)
+
+    server, url = start_stub_server(args.port, args.latency, args.fail_rate, verbose=True)
+    print(f"Stub TTS server listening on {url} (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(f"Served {server.requests} requests")
+
+
+if __name__ == "__main__":
+    main()